@@ -0,0 +1,222 @@
+import sys
+import tracemalloc
+from array import array
+from jeu import Question
+from sources_questions import SourceQuestions
+
+MAX_THEMES = 65535
+
+
+class VueQuestion(Question):
+    """
+    Vue légère sur une question d'une BanqueCompacte : seuls la banque et l'indice
+    sont gardés, les champs sont décodés à la lecture.
+
+    Une vue est une jeu.Question (poser, rendu, evaluer) : le jeu la pose comme
+    une question construite, sans copier ses champs (les emplacements hérités
+    de Question restent vides).
+    """
+
+    __slots__ = ("banque", "indice")
+
+    def __init__(self, banque, indice):
+        self.banque = banque
+        self.indice = indice
+
+    @property
+    def enonce(self):
+        return self.banque._chaine(self.banque._premiers[self.indice])
+
+    @property
+    def explication(self):
+        return self.banque._chaine(self.banque._premiers[self.indice] + 1)
+
+    @property
+    def options(self):
+        banque = self.banque
+        return [banque._chaine(j) for j in range(banque._premiers[self.indice] + 2, banque._premiers[self.indice + 1])]
+
+    @property
+    def reponse_correcte(self):
+        return self.banque.reponses[self.indice]
+
+    @property
+    def difficulte(self):
+        return self.banque.difficultes[self.indice]
+
+    @property
+    def theme(self):
+        return self.banque.noms_themes[self.banque.themes[self.indice]]
+
+
+class BanqueCompacte(SourceQuestions):
+    """
+    Banque de questions en colonnes, pour les très grandes banques en mémoire.
+
+    Difficulté, réponse correcte et thème sont des tableaux typés (un ou deux octets
+    par question) ; les thèmes sont internés et référencés par numéro. Les textes
+    (énoncé, explication puis options de chaque question) sont mis bout à bout en
+    UTF-8 dans un seul tampon, repérés par un tableau de positions. Aucun objet
+    Python n'est gardé par question.
+
+    S'utilise comme source de Jeu : les pages sont faites de VueQuestion, aucune
+    question n'est copiée hors de la banque.
+    """
+
+    acces_direct = True
+
+    def __init__(self):
+        super().__init__()
+        self.difficultes = array("b")
+        self.reponses = array("b")
+        self.themes = array("H")
+        self.noms_themes = []
+        self._numeros_themes = {}
+        self._texte = bytearray()
+        self._bornes = array("Q", [0])  # La chaîne j occupe _texte[_bornes[j]:_bornes[j + 1]]
+        self._premiers = array("Q", [0])  # La question i occupe les chaînes _premiers[i] à _premiers[i + 1] - 1
+
+    @classmethod
+    def depuis_source(cls, source):
+        """
+        Construit une banque à partir d'une source de questions, lue en flux.
+
+        Args:
+            source (SourceQuestions): La source (ou tout itérable de questions normalisées).
+
+        Returns:
+            BanqueCompacte: La banque remplie.
+        """
+        banque = cls()
+        for enonce, options, reponse_correcte, difficulte, theme, explication in source:
+            banque.ajouter(enonce, options, reponse_correcte, difficulte, theme, explication)
+        return banque
+
+    def _ajouter_chaine(self, chaine):
+        self._texte += chaine.encode("utf-8")
+        self._bornes.append(len(self._texte))
+
+    def _chaine(self, j):
+        return self._texte[self._bornes[j]:self._bornes[j + 1]].decode("utf-8")
+
+    def _numero_theme(self, theme):
+        numero = self._numeros_themes.get(theme)
+        if numero is None:
+            if len(self.noms_themes) >= MAX_THEMES:
+                raise ValueError(f"Une banque compacte accepte au plus {MAX_THEMES} thèmes.")
+            numero = self._numeros_themes[theme] = len(self.noms_themes)
+            self.noms_themes.append(sys.intern(theme))
+        return numero
+
+    def ajouter(self, enonce, options, reponse_correcte, difficulte, theme="", explication=""):
+        """
+        Ajoute une question à la banque.
+
+        Args:
+            enonce (str): L'énoncé de la question.
+            options (list): Les options de réponse.
+            reponse_correcte (int): Le numéro (1-n) de la bonne option.
+            difficulte (int): La difficulté (1-3).
+            theme (str): Le thème (None est rangé comme "").
+            explication (str): L'explication de la réponse (None est rangé comme "").
+
+        Returns:
+            int: L'indice de la question dans la banque.
+        """
+        theme, explication = theme or "", explication or ""
+        self.themes.append(self._numero_theme(theme))
+        self.difficultes.append(difficulte)
+        self.reponses.append(reponse_correcte)
+        self._ajouter_chaine(enonce)
+        self._ajouter_chaine(explication)
+        for option in options:
+            self._ajouter_chaine(option)
+        self._premiers.append(len(self._bornes) - 1)
+        return len(self.difficultes) - 1
+
+    def __len__(self):
+        return len(self.difficultes)
+
+    def __getitem__(self, indice):
+        if not 0 <= indice < len(self):
+            raise IndexError("Indice de question hors de la banque.")
+        return VueQuestion(self, indice)
+
+    def question(self, indice):
+        """
+        Décode une question.
+
+        Returns:
+            tuple: (enonce, options, reponse_correcte, difficulte, theme, explication).
+        """
+        vue = self[indice]
+        return vue.enonce, vue.options, vue.reponse_correcte, vue.difficulte, vue.theme, vue.explication
+
+    def enregistrements(self):
+        for enonce, options, reponse_correcte, difficulte, theme, explication in self:
+            yield {"question": enonce, "options": options, "correct_option": reponse_correcte,
+                   "difficulty": difficulte, "theme": theme, "explication": explication}
+
+    def depuis(self, position):
+        # Les questions sont déjà normalisées : pas de conversion de difficulté.
+        for indice in range(position, len(self)):
+            yield self.question(indice)
+
+    def colonnes(self):
+        return self.difficultes, [self.noms_themes[numero] for numero in self.themes]
+
+    def question_construite(self, indice, fabrique):
+        # La vue remplace la question construite par fabrique.
+        return self[indice]
+
+    def questions_depuis(self, position, fabrique):
+        # Les vues remplacent les questions construites par fabrique.
+        return map(self.__getitem__, range(position, len(self)))
+
+    def taille_memoire(self):
+        """
+        Retourne la mémoire occupée par les données de la banque, en octets.
+        """
+        tableaux = (self.difficultes, self.reponses, self.themes, self._bornes, self._premiers)
+        return (sum(t.buffer_info()[1] * t.itemsize for t in tableaux) + len(self._texte)
+                + sum(sys.getsizeof(nom) for nom in self.noms_themes))
+
+
+def questions_synthetiques(n, nb_themes=20):
+    """
+    Génère n questions normalisées de test (pour les mesures de mémoire).
+    """
+    for i in range(n):
+        yield (f"Question numéro {i} : quelle est la bonne réponse ?",
+               [f"Réponse {i}-{k}" for k in range(1, 5)], 1 + i % 4, 1 + i % 3,
+               f"Thème {i % nb_themes}", f"Explication de la question {i}.")
+
+
+def memoire_par_question(fabrique, n=100000):
+    """
+    Mesure la mémoire allouée par question pour une représentation donnée.
+
+    Args:
+        fabrique (callable): Construit la représentation à partir d'un itérable de questions normalisées.
+        n (int): Le nombre de questions.
+
+    Returns:
+        float: Le nombre d'octets par question.
+    """
+    tracemalloc.start()
+    try:
+        avant = tracemalloc.get_traced_memory()[0]
+        representation = fabrique(questions_synthetiques(n))
+        apres = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del representation
+    return (apres - avant) / n
+
+
+if __name__ == "__main__":
+    n = 100000
+    objets = memoire_par_question(lambda questions: [Question(*q) for q in questions], n)
+    compacte = memoire_par_question(BanqueCompacte.depuis_source, n)
+    print(f"Objets Question : {objets:.0f} octets par question")
+    print(f"Banque compacte : {compacte:.0f} octets par question ({objets / compacte:.1f}x moins)")
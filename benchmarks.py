@@ -0,0 +1,312 @@
+import argparse
+import contextlib
+import csv
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+import create_questions_db
+import quiz_vocal
+import saisie
+from banque_compacte import BanqueCompacte, questions_synthetiques
+from jeu import Jeu, Joueur as JoueurJeu
+from joueur import Joueur
+from journal_scores import JournalScores
+from presentateur import Presentateur
+from qbank import BanqueMmap, compiler
+from question import Question
+from sorties import SortieNulle
+from sources_questions import SourceCSV, SourceJSONL, SourceListe, SourceSQLite
+
+TAILLES = (10**3, 10**4, 10**5, 10**6)
+REPETITIONS = 5
+DUREE_MIN = 0.1
+SEUIL_REGRESSION = 0.2
+HISTORIQUE = "benchmarks_historique.json"
+REFERENCE = "benchmarks_reference.json"
+LIBELLES_DIFFICULTE = {1: "facile", 2: "moyen", 3: "difficile"}
+
+
+def mesurer(fonction, repetitions=REPETITIONS, duree_min=DUREE_MIN):
+    """
+    Mesure le temps d'un appel de fonction : le nombre d'appels par mesure est augmenté
+    jusqu'à durer au moins duree_min, puis la meilleure de plusieurs mesures est gardée
+    (la moins perturbée par le reste du système).
+
+    Args:
+        fonction (callable): La fonction à mesurer, sans argument.
+        repetitions (int): Le nombre de mesures.
+        duree_min (float): La durée minimale d'une mesure, en secondes.
+
+    Returns:
+        float: Le temps d'un appel, en secondes.
+    """
+    minuteur = timeit.Timer(fonction)
+    nombre = 1
+    while True:
+        duree = minuteur.timeit(nombre)
+        if duree >= duree_min:
+            break
+        nombre = max(nombre * 2, int(nombre * duree_min * 1.2 / duree) if duree > 0 else nombre * 10)
+    durees = [duree] + minuteur.repeat(repetitions - 1, nombre)
+    return min(durees) / nombre
+
+
+@contextlib.contextmanager
+def silence():
+    """
+    Envoie les affichages du jeu (print) vers os.devnull le temps d'un bloc.
+    """
+    with open(os.devnull, "w", encoding="utf-8") as nul, contextlib.redirect_stdout(nul):
+        yield
+
+
+class LecteurScripte:
+    """
+    Remplace saisie.lecteur : répond toujours la même chose, sans attente ni fil d'exécution.
+    """
+
+    def __init__(self, reponse="1"):
+        self.reponse = reponse
+
+    def lire(self, invite, echeance):
+        return self.reponse
+
+
+def _enregistrements(taille):
+    for enonce, options, reponse, difficulte, theme, explication in questions_synthetiques(taille):
+        yield {"question": enonce, "context": theme, "options": options, "correct_option": reponse,
+               "difficulty": LIBELLES_DIFFICULTE[difficulte], "theme": theme, "explication": explication}
+
+
+class Banques:
+    """
+    Banques de questions synthétiques d'une taille donnée, dans chaque format pris en charge,
+    générées une seule fois dans un dossier temporaire.
+    """
+
+    def __init__(self, dossier, taille):
+        self.taille = taille
+        prefixe = os.path.join(dossier, f"banque_{taille}")
+        self.jsonl = prefixe + ".jsonl"
+        self.csv = prefixe + ".csv"
+        self.sqlite = prefixe + ".db"
+        self.qbank = prefixe + ".qbank"
+        with open(self.jsonl, "w", encoding="utf-8") as f:
+            for enregistrement in _enregistrements(taille):
+                f.write(json.dumps(enregistrement, ensure_ascii=False) + "\n")
+        with open(self.csv, "w", encoding="utf-8", newline="") as f:
+            colonnes = ["question", "options", "correct_option", "difficulty", "theme", "explication"]
+            ecrivain = csv.DictWriter(f, colonnes, extrasaction="ignore")
+            ecrivain.writeheader()
+            for enregistrement in _enregistrements(taille):
+                ecrivain.writerow(dict(enregistrement, options="|".join(enregistrement["options"])))
+        with silence():
+            create_questions_db.create_database(self.sqlite)
+        create_questions_db.bulk_insert(self.sqlite, _enregistrements(taille))
+        compiler(SourceJSONL(self.jsonl), self.qbank)
+        self.liste = list(_enregistrements(taille))
+
+    def sources(self):
+        """
+        Returns:
+            dict: Une fabrique de source par format.
+        """
+        return {
+            "liste": lambda: SourceListe(self.liste),
+            "jsonl": lambda: SourceJSONL(self.jsonl),
+            "csv": lambda: SourceCSV(self.csv),
+            "sqlite": lambda: SourceSQLite(self.sqlite),
+            "qbank": lambda: BanqueMmap(self.qbank),
+        }
+
+
+def _parcourir(fabrique):
+    def parcourir():
+        source = fabrique()
+        for _ in source:
+            pass
+        if isinstance(source, BanqueMmap):
+            source.close()
+    return parcourir
+
+
+def cas_independants(dossier):
+    """
+    Cas dont le coût ne dépend pas de la taille de la banque.
+
+    Returns:
+        dict: Pour chaque nom de cas, la fonction à mesurer.
+    """
+    options = ["Paris", "Londres", "Berlin", "Madrid"]
+    question = Question("Quelle est la capitale de la France ?", options, 1, 1)
+    presentateur = Presentateur("Jean-Luc Reichmann")
+    joueur = Joueur("Maître de Midi")
+    jeu = Jeu(sortie=SortieNulle(), scores={})
+    joueur_jeu = JoueurJeu("Alice")
+    joueurs_partie = [JoueurJeu(nom) for nom in ("Alice", "Bob", "Charlie")]
+    # Les lectures sont mesurées sur un journal séparé, qui ne grossit pas pendant les mesures.
+    journal = JournalScores(os.path.join(dossier, "scores.db"), compaction_toutes=0, ancien_fichier=None)
+    lecture = JournalScores(os.path.join(dossier, "lecture.db"), compaction_toutes=0, ancien_fichier=None)
+    lecture.enregistrer_partie(joueurs_partie)
+
+    def creer_question_invalide():
+        try:
+            Question("Quelle est la capitale de la France ?", options, 5, 1)
+        except ValueError:
+            pass
+
+    return {
+        "question.creation": lambda: Question("Quelle est la capitale de la France ?", options, 1, 1),
+        "question.creation_invalide": creer_question_invalide,
+        "question.poser": lambda: question.poser(presentateur, joueur),
+        "jeu.jouer_tour": lambda: jeu.jouer_tour(joueur_jeu),
+        "scores.enregistrer_partie": lambda: journal.enregistrer_partie(joueurs_partie),
+        "scores.lecture": lambda: lecture["Alice"],
+        "scores.totaux": lambda: list(lecture.totaux()),
+    }
+
+
+def cas_par_taille(banques):
+    """
+    Cas mesurés sur une banque de taille donnée. Les chargements sont rapportés par question.
+
+    Returns:
+        dict: Pour chaque nom de cas, (la fonction à mesurer, le nombre d'opérations par appel).
+    """
+    cas = {f"source.{nom}.chargement": (_parcourir(fabrique), banques.taille)
+           for nom, fabrique in banques.sources().items()}
+    cas["banque_compacte.construction"] = (
+        lambda: BanqueCompacte.depuis_source(questions_synthetiques(banques.taille)), banques.taille)
+    posees = set(range(1, banques.taille // 2, 2))
+    cas["quiz_vocal.get_random_question"] = (lambda: quiz_vocal.get_random_question(banques.sqlite, posees), 1)
+    return cas
+
+
+def executer(tailles=TAILLES, filtre=None, repetitions=REPETITIONS, duree_min=DUREE_MIN, sortie=print):
+    """
+    Exécute les benchmarks.
+
+    Args:
+        tailles (tuple): Les tailles de banques générées.
+        filtre (str, optional): Ne garde que les cas dont le nom contient ce texte.
+        repetitions (int): Voir mesurer.
+        duree_min (float): Voir mesurer.
+        sortie (callable): Reçoit une ligne par cas mesuré.
+
+    Returns:
+        dict: Pour chaque cas (« nom » ou « nom[taille] »), le temps d'une opération en secondes.
+    """
+    resultats = {}
+
+    def mesurer_cas(nom, fonction, operations=1):
+        if filtre and filtre not in nom:
+            return
+        with silence():
+            resultats[nom] = mesurer(fonction, repetitions, duree_min) / operations
+        sortie(f"{nom:<48}{resultats[nom] * 1e6:>14.3f} µs")
+
+    lecteur, saisie.lecteur = saisie.lecteur, LecteurScripte()
+    try:
+        with tempfile.TemporaryDirectory() as dossier:
+            for nom, fonction in cas_independants(dossier).items():
+                mesurer_cas(nom, fonction)
+            for taille in tailles:
+                banques = Banques(dossier, taille)
+                for nom, (fonction, operations) in cas_par_taille(banques).items():
+                    mesurer_cas(f"{nom}[{taille}]", fonction, operations)
+    finally:
+        saisie.lecteur = lecteur
+    return resultats
+
+
+def comparer(resultats, reference, seuil=SEUIL_REGRESSION):
+    """
+    Compare des résultats à une référence.
+
+    Args:
+        resultats (dict): Les temps mesurés (voir executer).
+        reference (dict): Les temps de référence.
+        seuil (float): L'écart relatif au-delà duquel un cas est signalé (0.2 : 20 %).
+
+    Returns:
+        dict: Pour chaque cas présent dans les deux, {"rapport": temps / référence,
+            "etat": "regression", "amelioration" ou "stable"}.
+    """
+    comparaison = {}
+    for nom, temps in resultats.items():
+        if nom not in reference or not reference[nom]:
+            continue
+        rapport = temps / reference[nom]
+        etat = "regression" if rapport > 1 + seuil else "amelioration" if rapport < 1 / (1 + seuil) else "stable"
+        comparaison[nom] = {"rapport": rapport, "etat": etat}
+    return comparaison
+
+
+def _lire_json(chemin, defaut):
+    if not os.path.exists(chemin):
+        return defaut
+    with open(chemin, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _ecrire_json(chemin, donnees):
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "w", encoding="utf-8") as f:
+        json.dump(donnees, f, ensure_ascii=False, indent=1)
+    os.replace(temporaire, chemin)
+
+
+def enregistrer(resultats, historique=HISTORIQUE, reference=REFERENCE, seuil=SEUIL_REGRESSION, fixer_reference=False):
+    """
+    Ajoute une exécution à l'historique JSON, en la comparant à la référence enregistrée.
+
+    Args:
+        resultats (dict): Les temps mesurés (voir executer).
+        historique (str): Le fichier d'historique (liste d'exécutions).
+        reference (str): Le fichier de référence ; créé à partir de ces résultats s'il n'existe pas.
+        seuil (float): Voir comparer.
+        fixer_reference (bool): Remplace la référence par ces résultats (après comparaison).
+
+    Returns:
+        dict: L'exécution ajoutée (date, machine, resultats, comparaison, regressions).
+    """
+    temps_reference = _lire_json(reference, {}).get("resultats", {})
+    comparaison = comparer(resultats, temps_reference, seuil)
+    execution = {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "resultats": resultats,
+        "comparaison": comparaison,
+        "regressions": sorted(nom for nom, c in comparaison.items() if c["etat"] == "regression"),
+    }
+    executions = _lire_json(historique, [])
+    executions.append(execution)
+    _ecrire_json(historique, executions)
+    if fixer_reference or not temps_reference:
+        _ecrire_json(reference, {"date": execution["date"], "python": execution["python"], "resultats": resultats})
+    return execution
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Benchmarks des chemins critiques du jeu.")
+    parseur.add_argument("--tailles", type=int, nargs="+", default=list(TAILLES),
+                         help="Tailles des banques de questions générées.")
+    parseur.add_argument("--cas", help="Ne mesure que les cas dont le nom contient ce texte.")
+    parseur.add_argument("--repetitions", type=int, default=REPETITIONS)
+    parseur.add_argument("--historique", default=HISTORIQUE)
+    parseur.add_argument("--reference", default=REFERENCE)
+    parseur.add_argument("--seuil", type=float, default=SEUIL_REGRESSION,
+                         help="Écart relatif signalé comme régression (0.2 : 20 %%).")
+    parseur.add_argument("--fixer-reference", action="store_true", help="Enregistre ces résultats comme référence.")
+    arguments = parseur.parse_args()
+    execution = enregistrer(executer(arguments.tailles, arguments.cas, arguments.repetitions),
+                            arguments.historique, arguments.reference, arguments.seuil, arguments.fixer_reference)
+    for nom, c in sorted(execution["comparaison"].items()):
+        if c["etat"] != "stable":
+            print(f"{'RÉGRESSION' if c['etat'] == 'regression' else 'Amélioration'} : {nom} ({c['rapport']:.2f}x)")
+    sys.exit(1 if execution["regressions"] else 0)
@@ -1,7 +1,7 @@
-import os
 import subprocess
 import sys
 import requests
+from controle_code import ControleCode
 
 # Configuration
 REQUIRED_MODULES = ['psutil', 'pyttsx3', 'sqlite3']
@@ -46,29 +46,32 @@ def check_for_updates():
         print(f"Erreur lors de la vérification des mises à jour : {e}")
 
 def check_syntax_errors():
-    py_files = [f for f in os.listdir('.') if f.endswith('.py')]
-    for py_file in py_files:
-        print(f"Vérification de la syntaxe dans {py_file}...")
-        result = subprocess.run([sys.executable, "-m", "py_compile", py_file], stderr=subprocess.PIPE)
-        if result.returncode != 0:
-            print(f"Erreurs de syntaxe trouvées dans {py_file} :\n{result.stderr.decode()}")
-        else:
-            print(f"Pas d'erreurs de syntaxe dans {py_file}.")
+    """Vérifie la syntaxe dans ce processus ; les fichiers inchangés depuis la dernière vérification sont ignorés."""
+    controle = ControleCode()
+    erreurs = controle.verifier_syntaxe()
+    for module in controle.modules():
+        if module in erreurs:
+            print(f"Erreurs de syntaxe trouvées dans {module}.py :\n{erreurs[module]}")
+    for module in controle.modules_masquants():
+        print(f"Erreur : {module}.py masque le module {module} de la bibliothèque standard.")
+    print(f"{len(controle.modules()) - len(erreurs)} fichiers sans erreur de syntaxe.")
+    return controle
 
-def run_unit_tests():
+def run_unit_tests(controle=None):
+    """Exécute dans un pool de processus les modules de tests dont le code ou les dépendances ont changé."""
     print("Exécution des tests unitaires...")
-    result = subprocess.run([sys.executable, "-m", "unittest", "discover"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    print(result.stdout.decode())
-    if result.returncode != 0:
-        print(f"Erreurs dans les tests unitaires :\n{result.stderr.decode()}")
-    else:
-        print("Tous les tests unitaires passent avec succès.")
+    controle = controle or check_syntax_errors()
+    resultats = controle.executer_tests()
+    echecs = [(module, sortie) for module, reussite, _, sortie in resultats if not reussite]
+    for module, sortie in echecs:
+        print(f"Erreurs dans les tests unitaires de {module} :\n{sortie}")
+    if not echecs:
+        print(f"Tous les tests unitaires passent avec succès ({len(resultats)} modules modifiés exécutés).")
 
 def main():
     install_missing_modules()
     check_for_updates()
-    check_syntax_errors()
-    run_unit_tests()
+    run_unit_tests(check_syntax_errors())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,13 @@
+import importlib.util
 import subprocess
 import sys
-import pkg_resources
+
+# Liste des modules requis
+REQUIRED_MODULES = [
+    "psutil",
+    "pyttsx3",
+    # Ajoutez d'autres modules requis ici
+]
 
 def install_module(module_name):
     """Installe un module Python en utilisant pip."""
@@ -12,24 +19,19 @@ def install_module(module_name):
         print(f"Erreur lors de l'installation du module {module_name}: {e}")
         sys.exit(1)
 
-def check_and_install_modules(modules):
-    """Vérifie et installe les modules requis."""
-    installed_packages = {pkg.key for pkg in pkg_resources.working_set}
+def check_and_install_modules(modules, verbeux=True):
+    """Vérifie et installe les modules requis.
+
+    La présence d'un module est vérifiée sans l'importer ni parcourir les paquets installés :
+    pip n'est lancé que pour les modules manquants."""
     for module in modules:
-        if module.lower() not in installed_packages:
+        if importlib.util.find_spec(module) is None:
             print(f"Module {module} n'est pas installé. Installation en cours...")
             install_module(module)
-        else:
+        elif verbeux:
             print(f"Module {module} est déjà installé.")
 
 if __name__ == "__main__":
-    # Liste des modules requis
-    required_modules = [
-        "psutil",
-        "pyttsx3",
-        # Ajoutez d'autres modules requis ici
-    ]
-
     print("Vérification et installation des modules requis...")
-    check_and_install_modules(required_modules)
-    print("Tous les modules requis sont installés.")
\ No newline at end of file
+    check_and_install_modules(REQUIRED_MODULES)
+    print("Tous les modules requis sont installés.")
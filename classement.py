@@ -0,0 +1,313 @@
+import random
+import time
+from collections import deque
+
+NIVEAU_MAX = 32
+PROBABILITE_NIVEAU = 0.25
+JOUR = 86400
+SEMAINE = 7 * JOUR
+
+
+class _Noeud:
+    __slots__ = ("cle", "suivants", "largeurs")
+
+    def __init__(self, cle, niveau):
+        self.cle = cle
+        self.suivants = [None] * niveau
+        self.largeurs = [1] * niveau
+
+
+class ListeSautsIndexee:
+    """
+    Liste à sauts indexée : ensemble ordonné de clés avec insertion, suppression
+    et recherche de rang en O(log n) en moyenne, et accès par rang en O(log n).
+    Chaque lien mémorise le nombre d'éléments qu'il enjambe.
+    """
+
+    def __init__(self, graine=None):
+        self._rng = random.Random(graine)
+        self._tete = _Noeud(None, NIVEAU_MAX)
+        self._niveau = 1
+        self._taille = 0
+
+    def __len__(self):
+        return self._taille
+
+    def _niveau_aleatoire(self):
+        niveau = 1
+        while niveau < NIVEAU_MAX and self._rng.random() < PROBABILITE_NIVEAU:
+            niveau += 1
+        return niveau
+
+    def _chemin(self, cle):
+        # Pour chaque niveau : dernier nœud avant cle et rang (base 0) de ce nœud.
+        precedents = [self._tete] * NIVEAU_MAX
+        rangs = [0] * NIVEAU_MAX
+        noeud, rang = self._tete, -1
+        for i in range(self._niveau - 1, -1, -1):
+            while noeud.suivants[i] is not None and noeud.suivants[i].cle < cle:
+                rang += noeud.largeurs[i]
+                noeud = noeud.suivants[i]
+            precedents[i] = noeud
+            rangs[i] = rang
+        return precedents, rangs
+
+    def ajouter(self, cle):
+        """
+        Ajoute une clé (les clés doivent être distinctes et comparables).
+        """
+        precedents, rangs = self._chemin(cle)
+        niveau = self._niveau_aleatoire()
+        if niveau > self._niveau:
+            for i in range(self._niveau, niveau):
+                precedents[i] = self._tete
+                rangs[i] = -1
+                self._tete.largeurs[i] = self._taille + 1
+            self._niveau = niveau
+        noeud = _Noeud(cle, niveau)
+        rang = rangs[0] + 1
+        for i in range(niveau):
+            precedent = precedents[i]
+            noeud.suivants[i] = precedent.suivants[i]
+            precedent.suivants[i] = noeud
+            noeud.largeurs[i] = precedent.largeurs[i] - (rang - rangs[i]) + 1
+            precedent.largeurs[i] = rang - rangs[i]
+        for i in range(niveau, self._niveau):
+            precedents[i].largeurs[i] += 1
+        self._taille += 1
+
+    def retirer(self, cle):
+        """
+        Retire une clé présente.
+
+        Raises:
+            KeyError: Si la clé est absente.
+        """
+        precedents, _ = self._chemin(cle)
+        noeud = precedents[0].suivants[0]
+        if noeud is None or noeud.cle != cle:
+            raise KeyError(cle)
+        for i in range(self._niveau):
+            if precedents[i].suivants[i] is noeud:
+                precedents[i].largeurs[i] += noeud.largeurs[i] - 1
+                precedents[i].suivants[i] = noeud.suivants[i]
+            else:
+                precedents[i].largeurs[i] -= 1
+        while self._niveau > 1 and self._tete.suivants[self._niveau - 1] is None:
+            self._niveau -= 1
+        self._taille -= 1
+
+    def rang(self, cle):
+        """
+        Retourne le rang (base 0) d'une clé présente.
+        """
+        precedents, rangs = self._chemin(cle)
+        noeud = precedents[0].suivants[0]
+        if noeud is None or noeud.cle != cle:
+            raise KeyError(cle)
+        return rangs[0] + 1
+
+    def __getitem__(self, rang):
+        if not 0 <= rang < self._taille:
+            raise IndexError("Rang hors du classement.")
+        noeud, position = self._tete, -1
+        for i in range(self._niveau - 1, -1, -1):
+            while noeud.suivants[i] is not None and position + noeud.largeurs[i] <= rang:
+                position += noeud.largeurs[i]
+                noeud = noeud.suivants[i]
+        return noeud.cle
+
+    def premiers(self, k):
+        """
+        Parcourt les k premières clés dans l'ordre, en O(log n + k).
+        """
+        noeud = self._tete.suivants[0]
+        while noeud is not None and k > 0:
+            yield noeud.cle
+            noeud = noeud.suivants[0]
+            k -= 1
+
+
+class Classement:
+    """
+    Classement incrémental des joueurs par score cumulé.
+
+    Chaque mise à jour coûte O(log n) ; le top K coûte O(log n + K) et le rang
+    d'un joueur O(log n), sans jamais retrier l'ensemble des scores.
+    À score égal, le joueur arrivé le premier à ce score est devant.
+    """
+
+    def __init__(self):
+        self._liste = ListeSautsIndexee()
+        self._cles = {}
+        self._sequence = 0
+
+    def __len__(self):
+        return len(self._cles)
+
+    def __contains__(self, nom):
+        return nom in self._cles
+
+    def ajouter(self, nom, points):
+        """
+        Ajoute des points au score cumulé d'un joueur.
+
+        Args:
+            nom (str): Le nom du joueur.
+            points (int): Les points gagnés.
+        """
+        cle = self._cles.get(nom)
+        score = 0
+        if cle is not None:
+            self._liste.retirer(cle)
+            score = -cle[0]
+        self._sequence += 1
+        cle = (-(score + points), self._sequence, nom)
+        self._cles[nom] = cle
+        self._liste.ajouter(cle)
+
+    def retrancher(self, nom, points):
+        """
+        Retire des points au score cumulé d'un joueur classé sans changer son ordre
+        d'arrivée : à score égal, il garde sa place par rapport aux autres joueurs.
+
+        Args:
+            nom (str): Le nom du joueur.
+            points (int): Les points retirés.
+        """
+        score, sequence, _ = cle = self._cles[nom]
+        self._liste.retirer(cle)
+        cle = (score + points, sequence, nom)
+        self._cles[nom] = cle
+        self._liste.ajouter(cle)
+
+    def retirer(self, nom):
+        """
+        Retire un joueur du classement.
+        """
+        self._liste.retirer(self._cles.pop(nom))
+
+    def score(self, nom):
+        """
+        Retourne le score cumulé d'un joueur (0 s'il n'est pas classé).
+        """
+        cle = self._cles.get(nom)
+        return -cle[0] if cle else 0
+
+    def rang(self, nom):
+        """
+        Retourne le rang d'un joueur (1 pour le premier), ou None s'il n'est pas classé.
+        """
+        cle = self._cles.get(nom)
+        return self._liste.rang(cle) + 1 if cle else None
+
+    def top(self, k=10):
+        """
+        Retourne les k premiers joueurs.
+
+        Returns:
+            list: Couples (nom, score), du meilleur au moins bon.
+        """
+        return [(nom, -score) for score, _, nom in self._liste.premiers(k)]
+
+
+class ClassementFenetre:
+    """
+    Classement sur une fenêtre de temps glissante (par exemple le jour ou la semaine).
+
+    Les résultats sont gardés dans l'ordre d'arrivée ; quand ils sortent de la
+    fenêtre, leurs points sont retirés du classement, et un joueur sans résultat
+    dans la fenêtre n'est plus classé. Chaque résultat entre et sort une seule
+    fois : le coût amorti reste O(log n) par résultat.
+    """
+
+    def __init__(self, duree, horloge=time.time):
+        """
+        Args:
+            duree (float): La durée de la fenêtre en secondes.
+            horloge (callable): L'horloge utilisée pour dater les résultats.
+        """
+        self.duree = duree
+        self.horloge = horloge
+        self.classement = Classement()
+        self._resultats = deque()
+        self._nombres = {}
+
+    def _expirer(self):
+        limite = self.horloge() - self.duree
+        while self._resultats and self._resultats[0][0] < limite:
+            _, nom, points = self._resultats.popleft()
+            self._nombres[nom] -= 1
+            if self._nombres[nom]:
+                self.classement.retrancher(nom, points)
+            else:
+                del self._nombres[nom]
+                self.classement.retirer(nom)
+
+    def ajouter(self, nom, points, horodatage=None):
+        """
+        Ajoute le résultat d'une partie. Les résultats doivent arriver dans l'ordre chronologique.
+
+        Args:
+            nom (str): Le nom du joueur.
+            points (int): Les points gagnés.
+            horodatage (float, optional): L'instant de la partie (maintenant par défaut).
+        """
+        horodatage = self.horloge() if horodatage is None else horodatage
+        self._resultats.append((horodatage, nom, points))
+        self._nombres[nom] = self._nombres.get(nom, 0) + 1
+        self.classement.ajouter(nom, points)
+        self._expirer()
+
+    def top(self, k=10):
+        self._expirer()
+        return self.classement.top(k)
+
+    def rang(self, nom):
+        self._expirer()
+        return self.classement.rang(nom)
+
+    def score(self, nom):
+        self._expirer()
+        return self.classement.score(nom)
+
+
+class TableauDesScores:
+    """
+    Classements général, du jour et de la semaine, alimentés par les résultats de parties.
+    """
+
+    def __init__(self, horloge=time.time):
+        self.general = Classement()
+        self.jour = ClassementFenetre(JOUR, horloge)
+        self.semaine = ClassementFenetre(SEMAINE, horloge)
+        self.horloge = horloge
+
+    @classmethod
+    def depuis_journal(cls, journal, horloge=time.time):
+        """
+        Construit le tableau à partir d'un JournalScores : totaux pour le classement
+        général, résultats de la dernière semaine pour les classements glissants.
+        """
+        tableau = cls(horloge)
+        for nom, total, _, _ in journal.totaux():
+            tableau.general.ajouter(nom, total)
+        for nom, score, horodatage in journal.resultats(depuis=horloge() - SEMAINE):
+            tableau.jour.ajouter(nom, score, horodatage)
+            tableau.semaine.ajouter(nom, score, horodatage)
+        return tableau
+
+    def enregistrer_partie(self, resultats, horodatage=None):
+        """
+        Ajoute les résultats d'une partie à tous les classements.
+
+        Args:
+            resultats (iterable): Couples (nom, score), ou instances de Joueur.
+            horodatage (float, optional): L'instant de la partie (maintenant par défaut).
+        """
+        horodatage = self.horloge() if horodatage is None else horodatage
+        for resultat in resultats:
+            nom, score = (resultat.nom, resultat.score) if hasattr(resultat, "nom") else resultat
+            self.general.ajouter(nom, score)
+            self.jour.ajouter(nom, score, horodatage)
+            self.semaine.ajouter(nom, score, horodatage)
@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from journal_scores import JournalScores
+from serveur import ServeurJeu
+
+
+async def _ouvrir(hote, port, chemin_unix):
+    if chemin_unix:
+        return await asyncio.open_unix_connection(chemin_unix)
+    return await asyncio.open_connection(hote, port)
+
+
+async def jouer_interactif(hote="127.0.0.1", port=8765, chemin_unix=None):
+    """
+    Joue une partie au clavier contre le serveur.
+    """
+    lecteur, ecrivain = await _ouvrir(hote, port, chemin_unix)
+    boucle = asyncio.get_running_loop()
+    nom = await boucle.run_in_executor(None, input, "Votre nom : ")
+    ecrivain.write((json.dumps({"nom": nom}) + "\n").encode())
+    async for ligne in lecteur:
+        message = json.loads(ligne)
+        if message["type"] == "question":
+            print(message["texte"])
+            choix = await boucle.run_in_executor(None, input, "\nVotre réponse (numéro) : ")
+            reponse = {"reponse": int(choix) if choix.strip().isdigit() else 0, "numero": message.get("numero")}
+            ecrivain.write((json.dumps(reponse) + "\n").encode())
+        elif message["type"] == "fin":
+            print(f"\nScore final : {message['score']} points")
+            if message.get("rang"):
+                print(f"Classement général : {message['rang']}e")
+            break
+        else:
+            print(message["texte"])
+    ecrivain.close()
+
+
+async def bot(nom, hote, port, chemin_unix):
+    """
+    Client automatique : répond immédiatement une option au hasard (le serveur n'envoie
+    pas la bonne réponse aux clients).
+
+    Returns:
+        int: Le score final, ou None si le serveur a refusé la connexion.
+    """
+    lecteur, ecrivain = await _ouvrir(hote, port, chemin_unix)
+    ecrivain.write((json.dumps({"nom": nom}) + "\n").encode())
+    score = None
+    async for ligne in lecteur:
+        message = json.loads(ligne)
+        if message["type"] == "question":
+            choix = random.randint(1, len(message["options"]))
+            ecrivain.write((json.dumps({"reponse": choix, "numero": message.get("numero")}) + "\n").encode())
+        elif message["type"] in ("fin", "erreur"):
+            score = message.get("score")
+            break
+    ecrivain.close()
+    return score
+
+
+async def charge(nb_clients, hote="127.0.0.1", port=8765, chemin_unix=None, local=True, nb_tours=5):
+    """
+    Lance nb_clients bots simultanés et mesure le débit du serveur.
+    Si local est vrai, un serveur est démarré dans le même processus, sans réseau externe,
+    avec un journal des scores temporaire.
+
+    Returns:
+        dict: Le nombre de parties terminées, la durée et le débit en parties par seconde.
+    """
+    serveur = None
+    if local:
+        dossier = tempfile.TemporaryDirectory()
+        journal = JournalScores(os.path.join(dossier.name, "scores.db"))
+        serveur = ServeurJeu(nb_tours=nb_tours, max_sessions=nb_clients, scores=journal)
+        instance = await serveur.demarrer(hote, 0 if not chemin_unix else port, chemin_unix)
+        if not chemin_unix:
+            port = instance.sockets[0].getsockname()[1]
+    debut = time.perf_counter()
+    scores = await asyncio.gather(*(bot(f"Bot{i}", hote, port, chemin_unix) for i in range(nb_clients)))
+    duree = time.perf_counter() - debut
+    if serveur:
+        await serveur.arreter()
+        journal.close()
+        dossier.cleanup()
+    terminees = sum(score is not None for score in scores)
+    return {"parties": terminees, "duree": duree, "parties_par_seconde": terminees / duree if duree else 0.0}
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Client du serveur de quiz.")
+    parseur.add_argument("--hote", default="127.0.0.1")
+    parseur.add_argument("--port", type=int, default=8765)
+    parseur.add_argument("--unix", help="Chemin d'une socket Unix.")
+    parseur.add_argument("--charge", type=int, metavar="N", help="Lance N bots simultanés au lieu d'une partie au clavier.")
+    parseur.add_argument("--distant", action="store_true", help="Avec --charge, utilise un serveur déjà lancé.")
+    arguments = parseur.parse_args()
+    if arguments.charge:
+        resultat = asyncio.run(charge(arguments.charge, arguments.hote, arguments.port, arguments.unix,
+                                      local=not arguments.distant))
+        print(f"{resultat['parties']} parties en {resultat['duree']:.2f}s "
+              f"({resultat['parties_par_seconde']:.0f} parties/s).")
+    else:
+        asyncio.run(jouer_interactif(arguments.hote, arguments.port, arguments.unix))
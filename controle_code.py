@@ -0,0 +1,254 @@
+import ast
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+FICHIER_CACHE = ".controle_cache.json"
+SEUIL_PARALLELE = 8  # En dessous, compiler dans le processus coûte moins que démarrer des processus
+
+
+def empreinte_fichier(chemin):
+    """
+    Retourne l'empreinte (SHA-256) du contenu d'un fichier.
+    """
+    with open(chemin, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def analyser_fichier(chemin):
+    """
+    Compile un fichier source (sans écrire de bytecode) et relève les modules qu'il importe.
+
+    Args:
+        chemin (str): Le fichier .py.
+
+    Returns:
+        tuple: (empreinte, modules importés, message d'erreur ou None).
+    """
+    with open(chemin, "rb") as f:
+        source = f.read()
+    empreinte = hashlib.sha256(source).hexdigest()
+    try:
+        arbre = ast.parse(source, chemin)
+        compile(arbre, chemin, "exec")
+    except (SyntaxError, ValueError) as e:
+        return empreinte, [], f"{type(e).__name__} : {e}"
+    modules = set()
+    for noeud in ast.walk(arbre):
+        if isinstance(noeud, ast.Import):
+            modules.update(alias.name.split(".")[0] for alias in noeud.names)
+        elif isinstance(noeud, ast.ImportFrom) and noeud.module and not noeud.level:
+            modules.add(noeud.module.split(".")[0])
+    return empreinte, sorted(modules), None
+
+
+def executer_module_tests(repertoire, module):
+    """
+    Exécute les tests d'un module (dans un processus du pool), sans rien afficher.
+
+    Args:
+        repertoire (str): Le répertoire du projet.
+        module (str): Le nom du module de tests (par exemple "test_jeu").
+
+    Returns:
+        tuple: (module, réussite, nombre de tests, sortie du lanceur de tests).
+    """
+    if repertoire not in sys.path:
+        sys.path.insert(0, repertoire)
+    sortie = io.StringIO()
+    # Les tests tournent pendant la partie : ils ne doivent ni lire le terminal du joueur ni y écrire.
+    entree, sys.stdin = sys.stdin, io.StringIO()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            suite = unittest.defaultTestLoader.loadTestsFromName(module)
+            resultat = unittest.TextTestRunner(stream=sortie, verbosity=1).run(suite)
+    except Exception as e:
+        return module, False, 0, f"Impossible d'exécuter {module} : {e!r}"
+    finally:
+        sys.stdin = entree
+    return module, resultat.wasSuccessful(), resultat.testsRun, sortie.getvalue()
+
+
+class ControleCode:
+    """
+    Vérification de la syntaxe et exécution des tests du projet, en ne refaisant que ce qui a changé.
+
+    Les fichiers sont compilés dans le processus (ou dans un pool de processus s'ils sont
+    nombreux) et un fichier dont le contenu n'a pas changé depuis la dernière vérification
+    réussie n'est pas recompilé. Un module de tests n'est relancé que si son contenu ou
+    celui d'un module du projet qu'il importe (directement ou non) a changé depuis sa
+    dernière exécution réussie. L'état est gardé dans .controle_cache.json.
+    """
+
+    def __init__(self, repertoire=".", chemin_cache=None, nb_processus=None):
+        """
+        Args:
+            repertoire (str): Le répertoire du projet.
+            chemin_cache (str, optional): Le fichier de cache (.controle_cache.json du projet par défaut).
+            nb_processus (int, optional): La taille des pools de processus (nombre de cœurs par défaut).
+        """
+        self.repertoire = os.path.abspath(repertoire)
+        self.chemin_cache = chemin_cache or os.path.join(self.repertoire, FICHIER_CACHE)
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+        self.cache = self._lire_cache()
+        self.analyses = {}  # module -> (empreinte, imports, erreur)
+
+    def _lire_cache(self):
+        try:
+            with open(self.chemin_cache, "r") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if cache.get("python") != sys.version:
+            cache = {"python": sys.version, "fichiers": {}, "tests": {}}
+        return cache
+
+    def sauvegarder(self):
+        """
+        Écrit le cache (écriture atomique).
+        """
+        temporaire = f"{self.chemin_cache}.tmp"
+        with open(temporaire, "w") as f:
+            json.dump(self.cache, f)
+        os.replace(temporaire, self.chemin_cache)
+
+    def modules(self):
+        """
+        Returns:
+            list: Les modules Python du projet (fichiers .py du répertoire), triés.
+        """
+        return sorted(nom[:-3] for nom in os.listdir(self.repertoire) if nom.endswith(".py"))
+
+    def modules_masquants(self):
+        """
+        Returns:
+            list: Les modules du projet qui portent le nom d'un module de la bibliothèque standard.
+                Lancé depuis le projet, un tel fichier remplace ce module pour tout le processus,
+                y compris pour la bibliothèque standard elle-même (random.py masque random,
+                qu'importe tempfile, qu'importe concurrent.futures...).
+        """
+        return [module for module in self.modules() if module in sys.stdlib_module_names]
+
+    def verifier_syntaxe(self, modules=None):
+        """
+        Vérifie la syntaxe des modules ; seuls les fichiers modifiés depuis la dernière
+        vérification réussie sont recompilés.
+
+        Args:
+            modules (list, optional): Les modules à vérifier (tous par défaut).
+
+        Returns:
+            dict: Pour chaque module en erreur, le message d'erreur.
+        """
+        connus = self.cache["fichiers"]
+        a_compiler = []
+        for module in modules if modules is not None else self.modules():
+            chemin = os.path.join(self.repertoire, module + ".py")
+            entree = connus.get(module)
+            if entree and entree["empreinte"] == empreinte_fichier(chemin):
+                self.analyses[module] = (entree["empreinte"], entree["imports"], None)
+            else:
+                a_compiler.append(module)
+        chemins = [os.path.join(self.repertoire, module + ".py") for module in a_compiler]
+        if len(chemins) >= SEUIL_PARALLELE and self.nb_processus > 1:
+            with ProcessPoolExecutor(self.nb_processus) as executeur:
+                analyses = list(executeur.map(analyser_fichier, chemins, chunksize=4))
+        else:
+            analyses = [analyser_fichier(chemin) for chemin in chemins]
+        for module, (empreinte, imports, erreur) in zip(a_compiler, analyses):
+            self.analyses[module] = (empreinte, imports, erreur)
+            if erreur is None:
+                connus[module] = {"empreinte": empreinte, "imports": imports}
+            else:
+                connus.pop(module, None)
+        if a_compiler:
+            self.sauvegarder()
+        return {module: analyse[2] for module, analyse in self.analyses.items() if analyse[2] is not None}
+
+    def dependances(self, module):
+        """
+        Retourne le module et les modules du projet qu'il importe, directement ou non.
+        Les modules qui masquent un module de la bibliothèque standard (voir modules_masquants)
+        sont des dépendances de tous les modules : la bibliothèque standard les importe.
+
+        Args:
+            module (str): Le nom du module (déjà analysé par verifier_syntaxe).
+
+        Returns:
+            set: Les noms des modules.
+        """
+        a_voir = [module] + [masquant for masquant in self.modules_masquants() if masquant in self.analyses]
+        vus = set(a_voir)
+        while a_voir:
+            for importe in self.analyses.get(a_voir.pop(), (None, [], None))[1]:
+                if importe not in vus and importe in self.analyses:
+                    vus.add(importe)
+                    a_voir.append(importe)
+        return vus
+
+    def empreinte_module(self, module):
+        """
+        Retourne l'empreinte d'un module et de toutes ses dépendances dans le projet.
+        """
+        empreinte = hashlib.sha256()
+        for nom in sorted(self.dependances(module)):
+            empreinte.update(f"{nom}:{self.analyses[nom][0]}\n".encode())
+        return empreinte.hexdigest()
+
+    def tests_a_executer(self):
+        """
+        Returns:
+            list: Les modules de tests (test_*.py) sans erreur de syntaxe dont le code ou
+                les dépendances ont changé depuis leur dernière exécution réussie.
+        """
+        return [module for module in self.modules()
+                if module.startswith("test_") and module in self.analyses and self.analyses[module][2] is None
+                and self.cache["tests"].get(module) != self.empreinte_module(module)]
+
+    def lancer_tests(self, modules, executeur):
+        """
+        Soumet des modules de tests à un pool de processus.
+
+        Args:
+            modules (list): Les modules de tests.
+            executeur (concurrent.futures.Executor): Le pool.
+
+        Returns:
+            list: Les futurs, un par module (voir executer_module_tests).
+        """
+        return [executeur.submit(executer_module_tests, self.repertoire, module) for module in modules]
+
+    def enregistrer_resultat(self, module, reussite):
+        """
+        Note le résultat d'un module de tests : un module réussi ne sera relancé
+        que si lui ou ses dépendances changent.
+        """
+        if reussite:
+            self.cache["tests"][module] = self.empreinte_module(module)
+        else:
+            self.cache["tests"].pop(module, None)
+
+    def executer_tests(self, modules=None):
+        """
+        Exécute des modules de tests dans un pool de processus et enregistre les résultats.
+
+        Args:
+            modules (list, optional): Les modules de tests (par défaut, ceux de tests_a_executer).
+
+        Returns:
+            list: Les résultats (voir executer_module_tests), dans l'ordre des modules.
+        """
+        modules = self.tests_a_executer() if modules is None else modules
+        if not modules:
+            return []
+        with ProcessPoolExecutor(min(self.nb_processus, len(modules))) as executeur:
+            resultats = [futur.result() for futur in self.lancer_tests(modules, executeur)]
+        for module, reussite, _, _ in resultats:
+            self.enregistrer_resultat(module, reussite)
+        self.sauvegarder()
+        return resultats
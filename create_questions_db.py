@@ -1,32 +1,123 @@
+import json
+import os
 import sqlite3
+import sys
+import time
+from itertools import islice
+from sources_questions import SourceJSONL, SourceCSV
+
+BATCH_SIZE = 10000
+# Colonnes ajoutées après la première version de la table (qui n'avait que question et context),
+# ajoutées aux bases existantes par create_database.
+COLONNES_AJOUTEES = (
+    ("options", "TEXT"),
+    ("correct_option", "INTEGER"),
+    ("difficulty", "TEXT"),
+    ("theme", "TEXT"),
+    ("explication", "TEXT"),
+)
+INSERT_SQL = '''
+    INSERT INTO questions (question, context, options, correct_option, difficulty, theme, explication)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
 
 def create_database(db_name):
-    """Crée une base de données SQLite avec une table pour les questions."""
+    """Crée une base de données SQLite avec une table pour les questions,
+    ou ajoute à la table d'une base existante les colonnes qui lui manquent."""
     conn = sqlite3.connect(db_name)
     cursor = conn.cursor()
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS questions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             question TEXT NOT NULL,
-            context TEXT NOT NULL
+            context TEXT NOT NULL,
+            options TEXT,
+            correct_option INTEGER,
+            difficulty TEXT,
+            theme TEXT,
+            explication TEXT
         )
     ''')
+    colonnes = {ligne[1] for ligne in cursor.execute("PRAGMA table_info(questions)")}
+    for nom, type_sql in COLONNES_AJOUTEES:
+        if nom not in colonnes:
+            cursor.execute(f"ALTER TABLE questions ADD COLUMN {nom} {type_sql}")
     conn.commit()
     conn.close()
     print(f"Base de données {db_name} créée avec succès.")
 
-def add_question(db_name, question, context):
-    """Ajoute une question avec son contexte à la base de données."""
+def add_question(db_name, question, context, options=None, correct_option=None, difficulty=None, theme=None, explication=None):
+    """Ajoute une question avec son contexte (et ses options pour le jeu à choix multiples) à la base de données."""
     conn = sqlite3.connect(db_name)
     cursor = conn.cursor()
-    cursor.execute('''
-        INSERT INTO questions (question, context)
-        VALUES (?, ?)
-    ''', (question, context))
+    cursor.execute(INSERT_SQL, (question, context, json.dumps(options) if options is not None else None, correct_option, difficulty, theme, explication))
     conn.commit()
     conn.close()
     print("Question ajoutée avec succès.")
 
+def _to_row(record):
+    """Convertit un enregistrement (dictionnaire) en ligne de la table questions."""
+    options = record.get("options")
+    return (record["question"], record.get("context", ""), json.dumps(options) if options else None,
+            record.get("correct_option"), record.get("difficulty"), record.get("theme"), record.get("explication"))
+
+def bulk_insert(db_name, records, batch_size=BATCH_SIZE):
+    """Insère en masse un flux d'enregistrements, par lots transactionnels, et retourne le nombre de lignes insérées.
+
+    Pendant le chargement, la base passe en WAL avec synchronous=OFF et les index secondaires
+    de la table questions sont supprimés puis reconstruits une seule fois à la fin."""
+    conn = sqlite3.connect(db_name, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'questions' AND sql IS NOT NULL"
+        ).fetchall()
+        for name, _ in indexes:
+            conn.execute(f'DROP INDEX "{name}"')
+
+        rows = map(_to_row, records)
+        total = 0
+        try:
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                conn.execute("BEGIN")
+                conn.executemany(INSERT_SQL, batch)
+                conn.execute("COMMIT")
+                total += len(batch)
+        finally:
+            # Un lot en échec est annulé ; les lots déjà validés restent, et les index sont
+            # reconstruits dans tous les cas.
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for _, sql in indexes:
+                conn.execute(sql)
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return total
+    finally:
+        conn.close()
+
+def import_file(db_name, path, batch_size=BATCH_SIZE):
+    """Importe un fichier JSONL ou CSV dans la base en flux, sans le charger en mémoire, et affiche le débit."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        source = SourceJSONL(path)
+    elif extension == ".csv":
+        source = SourceCSV(path)
+    else:
+        raise ValueError(f"Format non pris en charge : {extension} (attendu : .jsonl ou .csv).")
+
+    start = time.perf_counter()
+    total = bulk_insert(db_name, source.enregistrements(), batch_size)
+    duration = time.perf_counter() - start
+    rate = total / duration if duration > 0 else float("inf")
+    print(f"{total} questions importées en {duration:.2f}s ({rate:.0f} lignes/s).")
+    return total
+
 def main():
     db_name = 'questions.db'
     create_database(db_name)
@@ -50,8 +141,13 @@ def main():
         {"question": "Quel est le plus long fleuve du monde?", "context": "Cette question concerne la géographie."}
     ]
 
-    for q in questions:
-        add_question(db_name, q["question"], q["context"])
+    bulk_insert(db_name, questions)
+    print(f"{len(questions)} questions ajoutées avec succès.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        create_database('questions.db')
+        for path in sys.argv[1:]:
+            import_file('questions.db', path)
+    else:
+        main()
\ No newline at end of file
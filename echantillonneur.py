@@ -0,0 +1,303 @@
+import math
+import random
+from array import array
+
+DIFFICULTES = (1, 2, 3)
+NIVEAUX = (1, 1.5, 2, 2.5, 3)
+
+
+class _TousLesThemes:
+    """
+    Clé de thème des seaux qui regroupent tous les thèmes (distincte de tout thème réel, None compris).
+    """
+
+    def __repr__(self):
+        return "TOUS_LES_THEMES"
+
+
+TOUS_LES_THEMES = _TousLesThemes()
+
+
+def poids_difficultes(niveau, selectivite=1.0):
+    """
+    Calcule le poids de chaque difficulté pour un niveau de joueur donné.
+    Les difficultés proches du niveau sont favorisées, les autres restent possibles.
+
+    Args:
+        niveau (float): Le niveau de difficulté du joueur (1 à 3).
+        selectivite (float): Plus elle est grande, plus les tirages collent au niveau.
+
+    Returns:
+        list: Les poids des difficultés 1, 2 et 3.
+    """
+    return [math.exp(-selectivite * (d - niveau) ** 2) for d in DIFFICULTES]
+
+
+class TableAlias:
+    """
+    Table d'alias (méthode de Vose) pour tirer un indice selon des poids en O(1).
+    """
+
+    def __init__(self, poids):
+        """
+        Args:
+            poids (list): Les poids positifs de chaque indice.
+
+        Raises:
+            ValueError: Si la liste est vide ou si la somme des poids est nulle.
+        """
+        total = sum(poids)
+        if not poids or total <= 0:
+            raise ValueError("Les poids doivent être positifs et de somme non nulle.")
+        n = len(poids)
+        self.probabilites = [0.0] * n
+        self.alias = [0] * n
+        echelle = [p * n / total for p in poids]
+        petits = [i for i, p in enumerate(echelle) if p < 1]
+        grands = [i for i, p in enumerate(echelle) if p >= 1]
+        while petits and grands:
+            petit, grand = petits.pop(), grands.pop()
+            self.probabilites[petit] = echelle[petit]
+            self.alias[petit] = grand
+            echelle[grand] -= 1 - echelle[petit]
+            (petits if echelle[grand] < 1 else grands).append(grand)
+        for i in petits + grands:
+            self.probabilites[i] = 1.0
+
+    def tirer(self, rng=random):
+        """
+        Tire un indice selon les poids de la table.
+
+        Args:
+            rng: Le générateur aléatoire (module random par défaut).
+
+        Returns:
+            int: L'indice tiré.
+        """
+        i = rng.randrange(len(self.probabilites))
+        return i if rng.random() < self.probabilites[i] else self.alias[i]
+
+
+class EnsembleBits:
+    """
+    Ensemble d'identifiants 0..n-1 stocké sur un bit par identifiant.
+    """
+
+    def __init__(self, taille):
+        self._octets = bytearray((taille + 7) // 8)
+        self.nombre = 0
+
+    def __contains__(self, identifiant):
+        return self._octets[identifiant >> 3] >> (identifiant & 7) & 1 == 1
+
+    def ajouter(self, identifiant):
+        if identifiant not in self:
+            self._octets[identifiant >> 3] |= 1 << (identifiant & 7)
+            self.nombre += 1
+
+    def __len__(self):
+        return self.nombre
+
+
+class IndexQuestions:
+    """
+    Index des questions par (thème, difficulté), construit une fois au chargement.
+    Les seaux (TOUS_LES_THEMES, difficulté) regroupent tous les thèmes, pour que les tirages sans
+    filtre de thème restent un seul tirage. Une requête sur des thèmes et des difficultés
+    ne parcourt que la liste des seaux (au plus 3 par thème), jamais les questions.
+    """
+
+    def __init__(self, difficultes, themes=None):
+        """
+        Args:
+            difficultes (iterable): La difficulté (1-3) de chaque question ; l'identifiant
+                d'une question est sa position.
+            themes (iterable, optional): Le thème de chaque question, dans le même ordre.
+        """
+        difficultes = list(difficultes)
+        themes = [""] * len(difficultes) if themes is None else list(themes)
+        if len(themes) != len(difficultes):
+            raise ValueError("Il faut un thème par question.")
+        self.seaux = {}
+        for identifiant, (theme, difficulte) in enumerate(zip(themes, difficultes)):
+            self.seaux.setdefault((theme, difficulte), array("l")).append(identifiant)
+            self.seaux.setdefault((TOUS_LES_THEMES, difficulte), array("l")).append(identifiant)
+        self.themes = sorted({theme for theme, _ in self.seaux if theme is not TOUS_LES_THEMES},
+                             key=lambda theme: (theme is None, theme or ""))
+        self.taille = len(difficultes)
+        self._requetes = {}
+
+    def __len__(self):
+        return self.taille
+
+    def cles(self, difficultes=None, themes=None):
+        """
+        Retourne les seaux correspondant aux difficultés et aux thèmes demandés.
+
+        Args:
+            difficultes (iterable, optional): Les difficultés acceptées (toutes par défaut).
+            themes (iterable, optional): Les thèmes acceptés (tous par défaut).
+
+        Returns:
+            list: Les clés (thème, difficulté) des seaux (à ne pas modifier, la liste est mémorisée).
+        """
+        requete = (None if difficultes is None else tuple(difficultes), None if themes is None else tuple(themes))
+        cles = self._requetes.get(requete)
+        if cles is None:
+            difficultes = None if difficultes is None else set(difficultes)
+            themes = None if themes is None else set(themes)
+            cles = self._requetes[requete] = [
+                cle for cle in self.seaux
+                if (cle[0] is TOUS_LES_THEMES if themes is None else cle[0] in themes)
+                and (difficultes is None or cle[1] in difficultes)]
+        return cles
+
+
+class EchantillonneurAdaptatif:
+    """
+    Échantillonneur de questions pondéré par le niveau du joueur.
+
+    Les identifiants de questions sont rangés une fois pour toutes par thème et par
+    difficulté (IndexQuestions), et une table d'alias est précalculée pour chaque
+    niveau possible du joueur.
+    L'échantillonneur est immuable et peut être partagé entre plusieurs sessions.
+    """
+
+    def __init__(self, difficultes, selectivite=1.0, themes=None):
+        """
+        Args:
+            difficultes (iterable): La difficulté (1-3) de chaque question ; l'identifiant
+                d'une question est sa position.
+            selectivite (float): Voir poids_difficultes.
+            themes (iterable, optional): Le thème de chaque question, pour les tirages par thème.
+        """
+        self.index = IndexQuestions(difficultes, themes)
+        self.tables = {niveau: TableAlias(poids_difficultes(niveau, selectivite)) for niveau in NIVEAUX}
+
+    def __len__(self):
+        return len(self.index)
+
+    def table(self, niveau):
+        """
+        Retourne la table d'alias du niveau précalculé le plus proche.
+
+        Args:
+            niveau (float): Le niveau de difficulté du joueur.
+
+        Returns:
+            TableAlias: La table d'alias correspondante.
+        """
+        return self.tables[min(3, max(1, round(niveau * 2) / 2))]
+
+    def session(self, rng=None):
+        """
+        Démarre une session de tirage sans remise.
+
+        Args:
+            rng: Le générateur aléatoire de la session (module random par défaut).
+
+        Returns:
+            SessionTirage: La nouvelle session.
+        """
+        return SessionTirage(self, rng or random)
+
+
+class SessionTirage:
+    """
+    Session de tirage sans remise sur un EchantillonneurAdaptatif.
+
+    Chaque seau de l'index est mélangé paresseusement (Fisher-Yates creux) : seules
+    les positions déjà échangées sont mémorisées, si bien qu'un tirage coûte O(1) amorti
+    et qu'une session ne consomme de la mémoire que pour les questions tirées.
+    Les questions déjà posées sont notées dans un ensemble de bits : une question tirée
+    par un seau, ou marquée par ailleurs (marquer), est simplement sautée quand un
+    autre seau qui la contient la tire à son tour.
+    """
+
+    def __init__(self, echantillonneur, rng=random):
+        self.echantillonneur = echantillonneur
+        self.index = echantillonneur.index
+        self.rng = rng
+        self.posees = EnsembleBits(len(self.index))
+        self.restants = {cle: len(seau) for cle, seau in self.index.seaux.items()}
+        self._permutes = {cle: {} for cle in self.index.seaux}
+
+    def __len__(self):
+        return len(self.index) - len(self.posees)
+
+    def deja_posee(self, identifiant):
+        return identifiant in self.posees
+
+    def marquer(self, identifiant):
+        """
+        Note une question comme posée : elle ne sera plus tirée dans la session.
+        """
+        self.posees.ajouter(identifiant)
+
+    def _tirer_seau(self, cle):
+        seau, permutes = self.index.seaux[cle], self._permutes[cle]
+        while self.restants[cle]:
+            dernier = self.restants[cle] - 1
+            position = self.rng.randrange(dernier + 1)
+            valeur_derniere = permutes.pop(dernier, dernier)
+            if position == dernier:
+                choisi = valeur_derniere
+            else:
+                choisi = permutes.get(position, position)
+                permutes[position] = valeur_derniere
+            self.restants[cle] = dernier
+            identifiant = seau[choisi]
+            if identifiant not in self.posees:
+                self.posees.ajouter(identifiant)
+                return identifiant
+        return None
+
+    def tirer_parmi(self, difficultes=None, themes=None):
+        """
+        Tire uniformément une question pas encore posée parmi des difficultés et des thèmes,
+        par exemple tirer_parmi([3], ["Histoire", "Science"]).
+
+        Args:
+            difficultes (iterable, optional): Les difficultés acceptées (toutes par défaut).
+            themes (iterable, optional): Les thèmes acceptés (tous par défaut).
+
+        Returns:
+            int: L'identifiant de la question, ou None s'il n'en reste aucune.
+        """
+        cles = self.index.cles(difficultes, themes)
+        if len(cles) == 1:
+            return self._tirer_seau(cles[0])
+        while True:
+            total = sum(self.restants[cle] for cle in cles)
+            if not total:
+                return None
+            tirage = self.rng.randrange(total)
+            for cle in cles:
+                tirage -= self.restants[cle]
+                if tirage < 0:
+                    break
+            identifiant = self._tirer_seau(cle)
+            if identifiant is not None:
+                return identifiant
+
+    def tirer(self, niveau, themes=None):
+        """
+        Tire une question pas encore posée dans la session, pondérée par le niveau.
+        Si la difficulté tirée est épuisée, la plus proche du niveau est utilisée.
+
+        Args:
+            niveau (float): Le niveau de difficulté du joueur.
+            themes (iterable, optional): Les thèmes acceptés (tous par défaut).
+
+        Returns:
+            int: L'identifiant de la question, ou None si toutes ont été posées.
+        """
+        tiree = DIFFICULTES[self.echantillonneur.table(niveau).tirer(self.rng)]
+        identifiant = self.tirer_parmi((tiree,), themes)
+        if identifiant is not None:
+            return identifiant
+        for difficulte in sorted(DIFFICULTES, key=lambda d: abs(d - niveau)):
+            identifiant = self.tirer_parmi((difficulte,), themes)
+            if identifiant is not None:
+                return identifiant
+        return None
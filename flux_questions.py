@@ -0,0 +1,155 @@
+import hashlib
+import os
+import random
+import sqlite3
+from urllib.request import pathname2url
+
+
+class PermutationCle:
+    """
+    Permutation pseudo-aléatoire de [0, n) définie par une clé (réseau de Feistel
+    avec « cycle walking »). Elle se parcourt sans jamais matérialiser la liste
+    des n éléments : la mémoire utilisée est constante.
+    """
+
+    TOURS = 4
+
+    def __init__(self, n, cle=None):
+        """
+        Args:
+            n (int): La taille du domaine.
+            cle (int, optional): La clé de la permutation (aléatoire par défaut).
+        """
+        self.n = n
+        self.cle = random.getrandbits(64) if cle is None else cle
+        bits = max(2, (max(n, 1) - 1).bit_length())
+        self._demi_bits = (bits + 1) // 2
+        self._masque = (1 << self._demi_bits) - 1
+
+    def _tour(self, numero, valeur):
+        empreinte = hashlib.blake2b(f"{self.cle}:{numero}:{valeur}".encode(), digest_size=8).digest()
+        return int.from_bytes(empreinte, "little") & self._masque
+
+    def _chiffrer(self, x):
+        gauche, droite = x >> self._demi_bits, x & self._masque
+        for numero in range(self.TOURS):
+            gauche, droite = droite, gauche ^ self._tour(numero, droite)
+        return (gauche << self._demi_bits) | droite
+
+    def __getitem__(self, i):
+        """
+        Retourne l'image de i par la permutation.
+
+        Args:
+            i (int): Un entier de [0, n).
+
+        Returns:
+            int: Un entier de [0, n).
+        """
+        if not 0 <= i < self.n:
+            raise IndexError("Indice hors de la permutation.")
+        x = self._chiffrer(i)
+        while x >= self.n:
+            x = self._chiffrer(x)
+        return x
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self[i]
+
+
+def connecter_lecture_seule(db_name, immuable=False):
+    """
+    Ouvre une base SQLite en lecture seule.
+
+    Args:
+        db_name (str): Le chemin de la base.
+        immuable (bool): Déclare la base immuable pendant la session ; SQLite
+            n'y pose alors aucun verrou. À réserver aux fichiers qui ne sont pas modifiés.
+
+    Returns:
+        sqlite3.Connection: La connexion ouverte.
+    """
+    uri = f"file:{pathname2url(os.path.abspath(db_name))}?mode=ro"
+    if immuable:
+        uri += "&immutable=1"
+    return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+
+class FluxQuestions:
+    """
+    Flux de questions d'une session de quiz vocal.
+
+    Une seule connexion est ouverte pour toute la session. Les identifiants sont
+    parcourus dans l'ordre d'une permutation à clé et chaque question est lue
+    individuellement par sa clé primaire : une question coûte O(1) et la mémoire
+    ne dépend pas de la taille de questions.db.
+    """
+
+    def __init__(self, db_name, cle=None, immuable=False):
+        """
+        Args:
+            db_name (str): Le chemin de questions.db.
+            cle (int, optional): La clé de mélange (aléatoire par défaut).
+            immuable (bool): Voir connecter_lecture_seule.
+        """
+        self.db_name = db_name
+        self.conn = connecter_lecture_seule(db_name, immuable)
+        self.cle = cle
+        self.melanger()
+
+    def melanger(self):
+        """
+        Démarre un nouveau parcours de toutes les questions, dans un nouvel ordre.
+        """
+        id_max = self.conn.execute("SELECT MAX(id) FROM questions").fetchone()[0] or 0
+        self.permutation = PermutationCle(id_max, self.cle)
+        self.cle = None
+        self._position = 0
+
+    def nombre_questions(self):
+        """
+        Returns:
+            int: Le nombre de questions dans la base.
+        """
+        return self.conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def suivante(self, asked_questions=()):
+        """
+        Retourne la prochaine question du parcours.
+
+        Args:
+            asked_questions (set): Les identifiants à ignorer.
+
+        Returns:
+            tuple: (id, question, context), ou None si le parcours est terminé.
+        """
+        curseur = self.conn.cursor()
+        while self._position < len(self.permutation):
+            q_id = self.permutation[self._position] + 1
+            self._position += 1
+            if q_id in asked_questions:
+                continue
+            ligne = curseur.execute("SELECT id, question, context FROM questions WHERE id = ?", (q_id,)).fetchone()
+            if ligne is not None:
+                return ligne
+        return None
+
+    def __iter__(self):
+        while True:
+            ligne = self.suivante()
+            if ligne is None:
+                return
+            yield ligne
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
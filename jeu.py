@@ -1,10 +1,17 @@
+import bisect
 import random
-import time
-import json
-import os
+import string
 import sys
 import subprocess
 from abc import ABC, abstractmethod
+import saisie
+from verification_environnement import verifier_environnement
+import weakref
+from sources_questions import SourceListe, PaginateurQuestions, QuestionsADemande, TAILLE_PAGE_DEFAUT
+from echantillonneur import EchantillonneurAdaptatif
+from journal_scores import JournalScores, TableauJournal
+from sorties import SortieTamponnee, vider_sortie
+from qbank import BanqueMmap
 
 def verifier_et_installer_modules():
     """
@@ -29,8 +36,6 @@ def verifier_et_installer_modules():
             print(f"Le module {module} est installé. Vérification des mises à jour...")
             subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", module])
 
-verifier_et_installer_modules()
-
 def verifier_code():
     """
     Vérifie les erreurs de syntaxe dans le fichier jeu.py avec flake8.
@@ -45,7 +50,15 @@ def verifier_code():
         print(f"Erreur lors de l'exécution de flake8 : {e}")
         sys.exit(1)
 
-verifier_code()
+def preparer_environnement(mode=None):
+    """
+    Vérifie l'environnement avant le lancement du jeu.
+    Les vérifications ne sont refaites que si requirements.txt, les modules installés
+    ou les sources ont changé (voir verification_environnement).
+
+    :param mode: Mode de vérification ("cache", "toujours" ou "desactive").
+    """
+    verifier_environnement([verifier_et_installer_modules, verifier_code], mode=mode)
 
 class IVoixOff(ABC):
     """
@@ -65,7 +78,13 @@ class VoixOff(IVoixOff):
     """
     Classe pour gérer les annonces de la Voix Off.
     """
-    def __init__(self):
+    def __init__(self, sortie=print):
+        """
+        Initialise la voix off.
+
+        :param sortie: Fonction ou Sortie recevant chaque message (print par défaut).
+        """
+        self.sortie = sortie
         self.repliques = {
             'debut': [
                 "Accrochez vos ceintures, on commence l'aventure !",
@@ -100,6 +119,36 @@ class VoixOff(IVoixOff):
                 "Attention, ça va chauffer entre {joueur1} et {joueur2} ! 🔥"
             ]
         }
+        self.compiler_repliques()
+
+    def compiler_repliques(self):
+        """
+        Analyse une fois pour toutes chaque réplique, pour ne pas réanalyser
+        le gabarit str.format à chaque annonce.
+        À rappeler après avoir modifié self.repliques.
+        """
+        self._repliques_compilees = {
+            type_message: [self._compiler(replique) for replique in repliques]
+            for type_message, repliques in self.repliques.items()
+        }
+
+    @staticmethod
+    def _compiler(replique):
+        """
+        Compile une réplique : le texte final si elle n'a pas de champ, sinon un gabarit
+        « % » et la liste ordonnée de ses champs.
+
+        :raises ValueError: Si un champ a un format ou une conversion ({reponse:>10}, {joueur!r}).
+        """
+        morceaux = list(string.Formatter().parse("[Voix off] " + replique))
+        champs = tuple(champ for _, champ, _, _ in morceaux if champ is not None)
+        if not champs:
+            return "".join(texte for texte, _, _, _ in morceaux)
+        if any(format_champ or conversion for _, _, format_champ, conversion in morceaux):
+            raise ValueError(f"Les répliques n'acceptent que des champs simples : {replique!r}")
+        gabarit = "".join(texte.replace("%", "%%") + ("%s" if champ is not None else "")
+                          for texte, champ, _, _ in morceaux)
+        return gabarit, champs
 
     def annoncer(self, type_message, **kwargs):
         """
@@ -108,22 +157,28 @@ class VoixOff(IVoixOff):
         :param type_message: Type de message à annoncer.
         :param kwargs: Arguments supplémentaires pour formater le message.
         """
-        replique = random.choice(self.repliques[type_message])
-        print(f"[Voix off] {replique.format(**kwargs)}")
+        replique = random.choice(self._repliques_compilees[type_message])
+        if isinstance(replique, str):
+            self.sortie(replique)
+        else:
+            gabarit, champs = replique
+            self.sortie(gabarit % tuple([kwargs[champ] for champ in champs]))
 
 class Presentateur:
     """
     Classe pour gérer les annonces du présentateur.
     """
-    def __init__(self, nom, voix_off: IVoixOff = None):
+    def __init__(self, nom, voix_off: IVoixOff = None, sortie=print):
         """
         Initialise le présentateur avec un nom et une voix off optionnelle.
         
         :param nom: Nom du présentateur.
         :param voix_off: Instance de IVoixOff pour les annonces vocales.
+        :param sortie: Fonction recevant chaque message (print par défaut).
         """
         self.nom = nom
         self.voix_off = voix_off
+        self.sortie = sortie
 
     def annoncer_phase(self, nom_phase):
         """
@@ -131,7 +186,7 @@ class Presentateur:
         
         :param nom_phase: Nom de la phase.
         """
-        print(f"\n{self.nom} : --- {nom_phase} ---")
+        self.sortie(f"\n{self.nom} : --- {nom_phase} ---")
         if self.voix_off:
             self.voix_off.annoncer('phase')
 
@@ -141,7 +196,7 @@ class Presentateur:
         
         :param nom_joueur: Nom du joueur.
         """
-        print(f"\n{self.nom} : {nom_joueur}, à vous de jouer !")
+        self.sortie(f"\n{self.nom} : {nom_joueur}, à vous de jouer !")
 
     def annoncer_resultat(self, resultat, question=None):
         """
@@ -187,8 +242,8 @@ class Presentateur:
         """
         if self.voix_off:
             self.voix_off.annoncer('etoile')
-        print(f"\n{self.nom} : {nom_joueur}, vous allez maintenant tenter de découvrir l'Étoile Mystérieuse !")
-        print(f"{self.nom} : Répondez correctement à au moins 3 questions sur 5 pour remporter l'étoile.")
+        self.sortie(f"\n{self.nom} : {nom_joueur}, vous allez maintenant tenter de découvrir l'Étoile Mystérieuse !")
+        self.sortie(f"{self.nom} : Répondez correctement à au moins 3 questions sur 5 pour remporter l'étoile.")
 
 class Joueur:
     """
@@ -203,6 +258,9 @@ class Joueur:
         self.nom = nom
         self.score = 0
         self.niveau_difficulte = 1  # Échelle de 1 (facile) à 3 (difficile)
+        self.serie = 0  # Bonnes réponses consécutives
+        self.badges = []  # Badges obtenus, dans l'ordre d'obtention
+        self.curseurs_badges = {}  # Par champ, nombre de seuils de Recompense déjà franchis
 
     def ajuster_difficulte(self, reussite):
         """
@@ -222,6 +280,8 @@ class Question:
     """
     Classe représentant une question de quiz.
     """
+    __slots__ = ("enonce", "options", "reponse_correcte", "difficulte", "theme", "explication")
+
     def __init__(self, enonce, options, reponse_correcte, difficulte, theme, explication):
         """
         Initialise une question de quiz.
@@ -237,52 +297,86 @@ class Question:
         self.options = options
         self.reponse_correcte = reponse_correcte
         self.difficulte = difficulte  # 1-3
-        self.theme = theme
+        self.theme = sys.intern(theme) if theme is not None else None  # Une seule chaîne par thème, quelle que soit la source
         self.explication = explication
 
-    def poser(self, presentateur, joueur):
+    def poser(self, presentateur, joueur, analyse=None):
         """
         Pose une question au joueur et traite sa réponse.
         
         :param presentateur: Instance de Presentateur pour annoncer la question.
         :param joueur: Instance de Joueur à qui la question est posée.
+        :param analyse: Instance d'AnalyseReponses recevant la réponse et son temps (aucune par défaut).
         """
         presentateur.annoncer_tour(joueur.nom)
-        print(f"\n[{self.theme}] {self.enonce}")
-        for i, opt in enumerate(self.options, 1):
-            print(f"{i}. {opt}")
+        presentateur.sortie(self.rendu())
+        vider_sortie(presentateur.sortie)  # Toute la question en une écriture, avant d'attendre la réponse
+
+        debut = saisie.horloge()
+        reponse = self.valider_entree_utilisateur(len(self.options), debut + saisie.temps_limite(self.difficulte))
+        temps = saisie.horloge() - debut
+
+        if reponse is None:
+            presentateur.sortie(f"\nTemps écoulé : {temps:.1f}s")
+        reussite = self.evaluer(reponse, presentateur, joueur)
+        if analyse is not None:
+            analyse.enregistrer(self, reussite, temps, reponse is None)
+        return reussite
+
+    def rendu(self):
+        """
+        Construit le texte affiché pour la question : thème, énoncé et options numérotées.
+
+        :return: Le texte de la question.
+        """
+        lignes = [f"\n[{self.theme}] {self.enonce}"]
+        lignes.extend(f"{i}. {opt}" for i, opt in enumerate(self.options, 1))
+        return "\n".join(lignes)
 
-        debut = time.time()
-        reponse = self.valider_entree_utilisateur(len(self.options))
-        temps = time.time() - debut
+    def evaluer(self, reponse, presentateur, joueur):
+        """
+        Évalue la réponse du joueur, met à jour son score et son niveau, et annonce le résultat.
 
-        temps_limite = 5 si self.difficulte == 1 sinon 7 si self.difficulte == 2 sinon 10
-        if temps > temps_limite:
-            print(f"\nTemps écoulé : {temps:.1f}s")
+        :param reponse: Numéro de l'option choisie, ou None si le temps est écoulé.
+        :param presentateur: Instance de Presentateur pour annoncer le résultat.
+        :param joueur: Instance de Joueur qui a répondu.
+        :return: Vrai si la réponse est correcte.
+        """
+        if reponse is None:
+            joueur.serie = 0
             presentateur.annoncer_resultat(False)
             return False
 
         if reponse == self.reponse_correcte:
             joueur.score += self.difficulte
+            joueur.serie += 1
             joueur.ajuster_difficulte(True)
             presentateur.annoncer_resultat(True)
             return True
         else:
+            joueur.serie = 0
             joueur.ajuster_difficulte(False)
             presentateur.annoncer_resultat(False, self)
             return False
 
     @staticmethod
-    def valider_entree_utilisateur(nb_options):
+    def valider_entree_utilisateur(nb_options, echeance=None):
         """
         Valide l'entrée utilisateur pour s'assurer qu'elle est un numéro valide.
         
         :param nb_options: Nombre d'options disponibles.
-        :return: Choix de l'utilisateur.
+        :param echeance: Instant (horloge saisie.horloge) où la question se termine, None pour attendre sans limite.
+        :return: Choix de l'utilisateur, ou None si l'échéance est dépassée.
         """
         while True:
+            if echeance is None:
+                entree = input("\nVotre réponse (numéro) : ")
+            else:
+                entree = saisie.lecteur.lire("\nVotre réponse (numéro) : ", echeance)
+                if entree is None:
+                    return None
             try:
-                choix = int(input("\nVotre réponse (numéro) : "))
+                choix = int(entree)
                 if 1 <= choix <= nb_options:
                     return choix
                 print(f"⚠️ Entrez un numéro entre 1 et {nb_options}.")
@@ -292,64 +386,227 @@ class Question:
 class Recompense:
     """
     Classe pour gérer les récompenses et badges des joueurs.
+
+    Chaque badge est un seuil sur un champ du joueur (score, niveau_difficulte, serie...).
+    Les seuils sont rangés par champ dans des listes triées, et chaque joueur garde par
+    champ un curseur sur le prochain seuil à franchir : une vérification ne compare que
+    ce prochain seuil, quel que soit le nombre de badges déclarés, et un badge n'est
+    attribué (et annoncé) qu'une seule fois.
     """
-    BADGES = {
-        "Novice": lambda j: j.score >= 10,
-        "Expert": lambda j: j.niveau_difficulte >= 2.5,
-        "Maître": lambda j: j.score >= 30
-    }
+    BADGES = [
+        ("Novice", "score", 10),
+        ("Expert", "niveau_difficulte", 2.5),
+        ("Maître", "score", 30),
+        ("En série", "serie", 5),
+    ]
+    SEUILS = {}  # champ -> (valeurs triées, noms des badges dans le même ordre)
+
+    @classmethod
+    def ajouter_badge(cls, nom, champ, seuil):
+        """
+        Déclare un badge obtenu quand le champ du joueur atteint le seuil.
+        Les badges doivent être déclarés avant les parties : un seuil inséré sous le
+        curseur d'un joueur existant ne lui serait pas attribué.
+
+        :param nom: Nom du badge.
+        :param champ: Attribut du joueur observé.
+        :param seuil: Valeur à atteindre.
+        """
+        valeurs, noms = cls.SEUILS.setdefault(champ, ([], []))
+        position = bisect.bisect_right(valeurs, seuil)
+        valeurs.insert(position, seuil)
+        noms.insert(position, nom)
 
     @classmethod
-    def verifier_badges(cls, joueur):
+    def verifier_badges(cls, joueur, sortie=print, champs=None):
         """
-        Vérifie et attribue les badges gagnés par le joueur.
+        Vérifie et attribue les badges nouvellement gagnés par le joueur.
         
         :param joueur: Instance de Joueur à vérifier.
-        """
-        nouveaux_badges = [nom pour nom, condition in cls.BADGES.items() if condition(joueur)]
+        :param sortie: Fonction recevant l'annonce des badges (print par défaut).
+        :param champs: Champs modifiés depuis la dernière vérification (tous par défaut).
+        :return: La liste des badges nouvellement obtenus.
+        """
+        nouveaux_badges = []
+        curseurs = joueur.curseurs_badges
+        for champ in (cls.SEUILS if champs is None else champs):
+            valeurs, noms = cls.SEUILS[champ]
+            curseur = curseurs.get(champ, 0)
+            valeur = getattr(joueur, champ)
+            if curseur < len(valeurs) and valeur >= valeurs[curseur]:
+                fin = bisect.bisect_right(valeurs, valeur, curseur)
+                nouveaux_badges.extend(nom for nom in noms[curseur:fin] if nom not in joueur.badges)
+                curseurs[champ] = fin
         if nouveaux_badges:
-            print(f"🎉 {joueur.nom} obtient les badges : {', '.join(nouveaux_badges)} !")
+            joueur.badges.extend(nouveaux_badges)
+            sortie(f"🎉 {joueur.nom} obtient les badges : {', '.join(nouveaux_badges)} !")
+        return nouveaux_badges
+
+
+for _nom, _champ, _seuil in Recompense.BADGES:
+    Recompense.ajouter_badge(_nom, _champ, _seuil)
+
+QUESTIONS_INTEGREES = [
+    {"question": "Quel est le plus grand lac d'eau douce du monde?", "options": ["Lac Supérieur", "Lac Victoria", "Lac Baïkal", "Lac Tanganyika"], "correct_option": 1, "difficulty": "moyen", "theme": "Géographie", "explication": "Le plus grand lac d'eau douce du monde est le Lac Supérieur."},
+    {"question": "Quelle est la capitale de la France?", "options": ["Paris", "Londres", "Berlin", "Madrid"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "La capitale de la France est Paris."},
+    {"question": "Quel est le plus grand océan?", "options": ["Atlantique", "Pacifique", "Indien", "Arctique"], "correct_option": 2, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus grand océan est le Pacifique."},
+    {"question": "Quel est le plus long fleuve du monde?", "options": ["Nil", "Amazone", "Yangtsé", "Mississippi"], "correct_option": 2, "difficulty": "moyen", "theme": "Géographie", "explication": "Le plus long fleuve du monde est l'Amazone."},
+    {"question": "Qui a écrit 'Les Misérables'?", "options": ["Victor Hugo", "Émile Zola", "Gustave Flaubert", "Marcel Proust"], "correct_option": 1, "difficulty": "moyen", "theme": "Littérature", "explication": "Victor Hugo a écrit 'Les Misérables'."},
+    {"question": "Quelle est la planète la plus proche du soleil?", "options": ["Mercure", "Vénus", "Terre", "Mars"], "correct_option": 1, "difficulty": "facile", "theme": "Science", "explication": "La planète la plus proche du soleil est Mercure."},
+    {"question": "En quelle année a eu lieu la Révolution française?", "options": ["1789", "1776", "1804", "1815"], "correct_option": 1, "difficulty": "moyen", "theme": "Histoire", "explication": "La Révolution française a eu lieu en 1789."},
+    {"question": "Quel est le symbole chimique de l'or?", "options": ["Au", "Ag", "Fe", "O"], "correct_option": 1, "difficulty": "facile", "theme": "Science", "explication": "L'or a pour symbole chimique Au."},
+    {"question": "Qui a peint la Joconde?", "options": ["Léonard de Vinci", "Michel-Ange", "Raphaël", "Donatello"], "correct_option": 1, "difficulty": "facile", "theme": "Art", "explication": "La Joconde a été peinte par Léonard de Vinci."},
+    {"question": "Quel est le plus grand désert du monde?", "options": ["Sahara", "Gobi", "Antarctique", "Kalahari"], "correct_option": 3, "difficulty": "difficile", "theme": "Géographie", "explication": "Le plus grand désert du monde est l'Antarctique."},
+    {"question": "Quel est le plus haut sommet du monde?", "options": ["Everest", "K2", "Kangchenjunga", "Lhotse"], "correct_option": 1, "difficulty": "moyen", "theme": "Géographie", "explication": "Le plus haut sommet du monde est l'Everest."},
+    {"question": "Qui a découvert la pénicilline?", "options": ["Alexander Fleming", "Marie Curie", "Louis Pasteur", "Isaac Newton"], "correct_option": 1, "difficulty": "moyen", "theme": "Science", "explication": "Alexander Fleming a découvert la pénicilline."},
+    {"question": "Quel est le plus grand mammifère marin?", "options": ["Baleine bleue", "Orque", "Dauphin", "Requin blanc"], "correct_option": 1, "difficulty": "facile", "theme": "Science", "explication": "Le plus grand mammifère marin est la baleine bleue."},
+    {"question": "Quel est le plus petit pays du monde?", "options": ["Vatican", "Monaco", "Nauru", "San Marin"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus petit pays du monde est le Vatican."},
+    {"question": "Qui a écrit 'Le Petit Prince'?", "options": ["Antoine de Saint-Exupéry", "Jules Verne", "Albert Camus", "Jean-Paul Sartre"], "correct_option": 1, "difficulty": "moyen", "theme": "Littérature", "explication": "Antoine de Saint-Exupéry a écrit 'Le Petit Prince'."},
+    {"question": "Quelle est la capitale de l'Australie?", "options": ["Sydney", "Melbourne", "Canberra", "Brisbane"], "correct_option": 3, "difficulty": "moyen", "theme": "Géographie", "explication": "La capitale de l'Australie est Canberra."},
+    {"question": "Quel est le plus grand continent?", "options": ["Asie", "Afrique", "Amérique du Nord", "Europe"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus grand continent est l'Asie."},
+    {"question": "Qui a inventé l'ampoule électrique?", "options": ["Thomas Edison", "Nikola Tesla", "Alexander Graham Bell", "Benjamin Franklin"], "correct_option": 1, "difficulty": "moyen", "theme": "Science", "explication": "Thomas Edison a inventé l'ampoule électrique."},
+    {"question": "Quel est le plus grand pays du monde par superficie?", "options": ["Russie", "Canada", "Chine", "États-Unis"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus grand pays du monde par superficie est la Russie."},
+    {"question": "Quel est le plus grand volcan actif du monde?", "options": ["Mauna Loa", "Krakatoa", "Etna", "Vésuve"], "correct_option": 1, "difficulty": "difficile", "theme": "Géographie", "explication": "Le plus grand volcan actif du monde est le Mauna Loa."},
+    {"question": "Qui a écrit 'La Divine Comédie'?", "options": ["Dante Alighieri", "Geoffrey Chaucer", "John Milton", "Homer"], "correct_option": 1, "difficulty": "difficile", "theme": "Littérature", "explication": "Dante Alighieri a écrit 'La Divine Comédie'."}
+]
+
+_echantillonneurs = weakref.WeakKeyDictionary()
+
+
+def echantillonneur_source(source):
+    """
+    Retourne l'échantillonneur d'une source à accès direct. Il est construit une seule fois
+    par source, à partir de ses colonnes de difficulté et de thème, puis partagé par tous
+    les jeux qui utilisent la source (il est immuable ; chaque partie a sa propre session).
+
+    :param source: Instance de SourceQuestions à accès direct (qui ne doit plus changer).
+    :return: L'EchantillonneurAdaptatif de la source.
+    """
+    echantillonneur = _echantillonneurs.get(source)
+    if echantillonneur is None:
+        difficultes, themes = source.colonnes()
+        echantillonneur = _echantillonneurs[source] = EchantillonneurAdaptatif(difficultes, themes=themes)
+    return echantillonneur
 
 class Jeu:
     """
     Classe principale pour gérer le jeu.
     """
-    def __init__(self):
-        """
-        Initialise le jeu en chargeant les questions et les scores.
-        """
-        self.presentateur = Presentateur("Jean-Luc Reichmann", voix_off=VoixOff())
-        self.questions = self._charger_questions()
-        self.scores = self._charger_scores()
-
-     def _charger_questions(self):
-        """
-        Charge les questions depuis une source de données.
-        """
-        questions = [
-            {"question": "Quel est le plus grand lac d'eau douce du monde?", "options": ["Lac Supérieur", "Lac Victoria", "Lac Baïkal", "Lac Tanganyika"], "correct_option": 1, "difficulty": "moyen", "theme": "Géographie", "explication": "Le plus grand lac d'eau douce du monde est le Lac Supérieur."},
-            {"question": "Quelle est la capitale de la France?", "options": ["Paris", "Londres", "Berlin", "Madrid"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "La capitale de la France est Paris."},
-            {"question": "Quel est le plus grand océan?", "options": ["Atlantique", "Pacifique", "Indien", "Arctique"], "correct_option": 2, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus grand océan est le Pacifique."},
-            {"question": "Quel est le plus long fleuve du monde?", "options": ["Nil", "Amazone", "Yangtsé", "Mississippi"], "correct_option": 2, "difficulty": "moyen", "theme": "Géographie", "explication": "Le plus long fleuve du monde est l'Amazone."},
-            {"question": "Qui a écrit 'Les Misérables'?", "options": ["Victor Hugo", "Émile Zola", "Gustave Flaubert", "Marcel Proust"], "correct_option": 1, "difficulty": "moyen", "theme": "Littérature", "explication": "Victor Hugo a écrit 'Les Misérables'."},
-            {"question": "Quelle est la planète la plus proche du soleil?", "options": ["Mercure", "Vénus", "Terre", "Mars"], "correct_option": 1, "difficulty": "facile", "theme": "Science", "explication": "La planète la plus proche du soleil est Mercure."},
-            {"question": "En quelle année a eu lieu la Révolution française?", "options": ["1789", "1776", "1804", "1815"], "correct_option": 1, "difficulty": "moyen", "theme": "Histoire", "explication": "La Révolution française a eu lieu en 1789."},
-            {"question": "Quel est le symbole chimique de l'or?", "options": ["Au", "Ag", "Fe", "O"], "correct_option": 1, "difficulty": "facile", "theme": "Science", "explication": "L'or a pour symbole chimique Au."},
-            {"question": "Qui a peint la Joconde?", "options": ["Léonard de Vinci", "Michel-Ange", "Raphaël", "Donatello"], "correct_option": 1, "difficulty": "facile", "theme": "Art", "explication": "La Joconde a été peinte par Léonard de Vinci."},
-            {"question": "Quel est le plus grand désert du monde?", "options": ["Sahara", "Gobi", "Antarctique", "Kalahari"], "correct_option": 3, "difficulty": "difficile", "theme": "Géographie", "explication": "Le plus grand désert du monde est l'Antarctique."},
-            {"question": "Quel est le plus haut sommet du monde?", "options": ["Everest", "K2", "Kangchenjunga", "Lhotse"], "correct_option": 1, "difficulty": "moyen", "theme": "Géographie", "explication": "Le plus haut sommet du monde est l'Everest."},
-            {"question": "Qui a découvert la pénicilline?", "options": ["Alexander Fleming", "Marie Curie", "Louis Pasteur", "Isaac Newton"], "correct_option": 1, "difficulty": "moyen", "theme": "Science", "explication": "Alexander Fleming a découvert la pénicilline."},
-            {"question": "Quel est le plus grand mammifère marin?", "options": ["Baleine bleue", "Orque", "Dauphin", "Requin blanc"], "correct_option": 1, "difficulty": "facile", "theme": "Science", "explication": "Le plus grand mammifère marin est la baleine bleue."},
-            {"question": "Quel est le plus petit pays du monde?", "options": ["Vatican", "Monaco", "Nauru", "San Marin"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus petit pays du monde est le Vatican."},
-            {"question": "Qui a écrit 'Le Petit Prince'?", "options": ["Antoine de Saint-Exupéry", "Jules Verne", "Albert Camus", "Jean-Paul Sartre"], "correct_option": 1, "difficulty": "moyen", "theme": "Littérature", "explication": "Antoine de Saint-Exupéry a écrit 'Le Petit Prince'."},
-            {"question": "Quelle est la capitale de l'Australie?", "options": ["Sydney", "Melbourne", "Canberra", "Brisbane"], "correct_option": 3, "difficulty": "moyen", "theme": "Géographie", "explication": "La capitale de l'Australie est Canberra."},
-            {"question": "Quel est le plus grand continent?", "options": ["Asie", "Afrique", "Amérique du Nord", "Europe"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus grand continent est l'Asie."},
-            {"question": "Qui a inventé l'ampoule électrique?", "options": ["Thomas Edison", "Nikola Tesla", "Alexander Graham Bell", "Benjamin Franklin"], "correct_option": 1, "difficulty": "moyen", "theme": "Science", "explication": "Thomas Edison a inventé l'ampoule électrique."},
-            {"question": "Quel est le plus grand pays du monde par superficie?", "options": ["Russie", "Canada", "Chine", "États-Unis"], "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "Le plus grand pays du monde par superficie est la Russie."},
-            {"question": "Quel est le plus grand volcan actif du monde?", "options": ["Mauna Loa", "Krakatoa", "Etna", "Vésuve"], "correct_option": 1, "difficulty": "difficile", "theme": "Géographie", "explication": "Le plus grand volcan actif du monde est le Mauna Loa."},
-            {"question": "Qui a écrit 'La Divine Comédie'?", "options": ["Dante Alighieri", "Geoffrey Chaucer", "John Milton", "Homer"], "correct_option": 1, "difficulty": "difficile", "theme": "Littérature", "explication": "Dante Alighieri a écrit 'La Divine Comédie'."}
-        ]
-        return [Question(q["question"], q["options"], q["correct_option"], self._convertir_difficulte(q["difficulty"]), q["theme"], q["explication"]) for q in questions]
+    def __init__(self, source=None, taille_fenetre=TAILLE_PAGE_DEFAUT, sortie=None, rng=None, scores=None,
+                 tableau=None, analyse=None):
+        """
+        Initialise le jeu et les scores. Les questions sont tirées à la demande de la source.
+
+        :param source: Instance de SourceQuestions (par défaut, les questions intégrées).
+        :param taille_fenetre: Nombre maximal de questions gardées en mémoire pour une source lue par pages
+                               (une source à accès direct est indexée en entière, sans page).
+        :param sortie: Fonction ou Sortie recevant tous les messages du jeu
+                       (par défaut, une SortieTamponnee vidée à chaque question).
+        :param rng: Générateur aléatoire des tirages de questions (module random par défaut).
+        :param scores: Instance de JournalScores partagée (par défaut, scores.db).
+        :param tableau: Instance de TableauDesScores partagée (par défaut, les classements sont lus
+                        dans le journal des scores, sans charger l'historique en mémoire).
+        :param analyse: Instance d'AnalyseReponses recevant chaque réponse (aucune par défaut).
+        """
+        self.sortie = sortie if sortie is not None else SortieTamponnee()
+        self.presentateur = Presentateur("Jean-Luc Reichmann", voix_off=VoixOff(self.sortie), sortie=self.sortie)
+        self.source = source or SourceListe(QUESTIONS_INTEGREES, self._convertir_difficulte)
+        self.rng = rng
+        self.questions = []
+        self._echantillonneur = None
+        self._session = None
+        self._debut_page = 0
+        self._posees = set()  # Positions dans la source des questions posées pendant la partie (pages)
+        if getattr(self.source, "acces_direct", False):
+            # Un seul index sur toute la source ; seules les questions tirées sont construites.
+            self.paginateur = None
+            self._echantillonneur = echantillonneur_source(self.source)
+            self.questions = QuestionsADemande(self.source, Question)
+            self._session = self._echantillonneur.session(self.rng)
+        else:
+            self.paginateur = PaginateurQuestions(self.source, Question, taille_fenetre)
+        self.scores = scores if scores is not None else self._charger_scores()
+        self.tableau = tableau if tableau is not None else TableauJournal(self.scores)
+        self.analyse = analyse
+
+    def _charger_questions(self):
+        """
+        Charge la page suivante de questions depuis une source lue par pages.
+        Seule la page courante (au plus taille_fenetre questions) est gardée en mémoire ;
+        les questions de la page déjà posées pendant la partie ne seront pas tirées.
+        """
+        self.questions = self.paginateur.page_suivante()
+        self._debut_page = self.paginateur.debut
+        self._echantillonneur = EchantillonneurAdaptatif([q.difficulte for q in self.questions],
+                                                         themes=[q.theme for q in self.questions])
+        self._session = self._echantillonneur.session(self.rng)
+        fin = self._debut_page + len(self.questions)
+        for position in self._posees:
+            if self._debut_page <= position < fin:
+                self._session.marquer(position - self._debut_page)
+        return self.questions
+
+    def nouvelle_partie(self):
+        """
+        Démarre une nouvelle partie : toutes les questions peuvent de nouveau être tirées.
+        """
+        self._posees.clear()
+        if self._echantillonneur is not None:
+            self._session = self._echantillonneur.session(self.rng)
+
+    def reinitialiser(self):
+        """
+        Remet le jeu dans l'état d'un jeu neuf : aucune question posée et, pour une source
+        lue par pages, aucune page chargée (la lecture reprend au début de la source).
+        """
+        self._posees.clear()
+        if self.paginateur is None:
+            self._session = self._echantillonneur.session(self.rng)
+            return
+        self.paginateur.reprendre()
+        self.questions = []
+        self._echantillonneur = None
+        self._session = None
+        self._debut_page = 0
+
+    def _partie_commencee(self):
+        if self.paginateur is None:
+            return len(self._session) < len(self._echantillonneur)
+        return bool(self._posees)
+
+    def _chercher_dans_les_pages(self, tirage):
+        """
+        Parcourt les pages suivantes, au plus un tour complet de la source, jusqu'à une page
+        où tirage(session) trouve une question. Si aucune page ne convient, la page courante
+        et ses questions restantes sont gardées.
+
+        :param tirage: Fonction recevant la SessionTirage d'une page et retournant un indice ou None.
+        :return: L'indice de la question dans la nouvelle page courante, ou None.
+        """
+        if self.paginateur is None:
+            return None  # L'index couvre déjà toute la source
+        courante = self.questions, self._debut_page, self._echantillonneur, self._session
+        depart = precedent = self._debut_page
+        tour_complet = False
+        while True:
+            self._charger_questions()
+            if self._debut_page <= precedent:
+                tour_complet = True  # La source a été reprise depuis le début
+            if tour_complet and self._debut_page >= depart:
+                break
+            precedent = self._debut_page
+            indice = tirage(self._session)
+            if indice is not None:
+                return indice
+        self.questions, self._debut_page, self._echantillonneur, self._session = courante
+        return None
+
+    def _retenir(self, indice):
+        if indice is None:
+            return None
+        if self.paginateur is not None:
+            self._posees.add(self._debut_page + indice)
+        return self.questions[indice]
 
     def _convertir_difficulte(self, difficulte):
         """
@@ -365,47 +622,177 @@ class Jeu:
 
     def _charger_scores(self):
         """
-        Charge les scores depuis un fichier JSON.
+        Ouvre le journal des scores (l'historique n'est pas relu au démarrage).
+        """
+        return JournalScores()
+
+    def _sauvegarder_scores(self, joueurs):
+        """
+        Ajoute les résultats de la partie au journal des scores et aux classements.
+
+        :param joueurs: Liste de Joueur ayant participé à la partie.
+        """
+        self.scores.enregistrer_partie(joueurs)
+        self.tableau.enregistrer_partie(joueurs)
+
+    def tirer_question(self, joueur, themes=None):
+        """
+        Tire une question selon le niveau du joueur, sans répétition pendant la partie.
+        Pour une source lue par pages, passe aux pages suivantes quand la page courante
+        n'a plus de question. Une fois toutes les questions de la source posées, elles
+        peuvent l'être de nouveau.
+
+        :param joueur: Instance de Joueur dont le niveau oriente le tirage.
+        :param themes: Thèmes acceptés (tous par défaut).
+        :return: La question, ou None si aucune question de ces thèmes n'est disponible.
         """
-        if os.path.exists("scores.json"):
-            with open("scores.json", "r") as f:
-                return json.load(f)
-        return {}
+        if self._session is None:
+            self._charger_questions()
+        indice = self._session.tirer(joueur.niveau_difficulte, themes)
+        if indice is None:
+            tirage = lambda session: session.tirer(joueur.niveau_difficulte, themes)
+            indice = self._chercher_dans_les_pages(tirage)
+            if indice is None and self._partie_commencee():
+                self.nouvelle_partie()
+                indice = tirage(self._session)
+        return self._retenir(indice)
 
-    def _sauvegarder_scores(self):
+    def tirer_question_parmi(self, difficultes=None, themes=None):
         """
-        Sauvegarde les scores dans un fichier JSON.
+        Tire une question pas encore posée pendant la partie parmi des difficultés et des thèmes,
+        par exemple tirer_question_parmi([3], ["Histoire", "Science"]), à l'aide de l'index de la source
+        (ou de la page courante, puis des pages suivantes, pour une source lue par pages).
+
+        :param difficultes: Difficultés acceptées (toutes par défaut).
+        :param themes: Thèmes acceptés (tous par défaut).
+        :return: La question, ou None si aucune question de la source ne correspond.
         """
-        with open("scores.json", "w") as f:
-            json.dump(self.scores, f)
+        if self._session is None:
+            self._charger_questions()
+        indice = self._session.tirer_parmi(difficultes, themes)
+        if indice is None:
+            indice = self._chercher_dans_les_pages(lambda session: session.tirer_parmi(difficultes, themes))
+        return self._retenir(indice)
+
+    def poser_question(self, question, joueur):
+        """
+        Pose une question à un joueur ; toutes les phases du jeu passent par cette méthode
+        (les joueurs simulés la redéfinissent, voir simulation.JeuSimule).
+
+        :param question: Instance de Question à poser.
+        :param joueur: Instance de Joueur qui répond.
+        :return: Vrai si la réponse est correcte.
+        """
+        return question.poser(self.presentateur, joueur, self.analyse)
 
     def jouer_tour(self, joueur):
         """
         Joue un tour de jeu pour un joueur donné.
         """
-        question = random.choice(self.questions)
-        reussite = question.poser(self.presentateur, joueur)
-        Recompense.verifier_badges(joueur)
+        question = self.tirer_question(joueur)
+        reussite = self.poser_question(question, joueur)
+        Recompense.verifier_badges(joueur, self.sortie)
+        vider_sortie(self.sortie)
         return reussite
 
-    def jouer(self):
+    def _tirer_question_duel(self):
+        return self.tirer_question_parmi([3]) or self.tirer_question_parmi([2])
+
+    def duel_final(self, joueur1, joueur2, nb_questions=3):
         """
-        Démarre le jeu.
+        Duel entre les deux meilleurs joueurs, sur des questions difficiles pas encore posées
+        (moyennes quand il n'y en a plus). Le duel s'arrête plus tôt si la banque ne permet
+        plus de poser une question à chacun des deux joueurs.
+
+        :param joueur1: Premier joueur.
+        :param joueur2: Deuxième joueur.
+        :param nb_questions: Nombre de questions posées à chaque joueur.
+        :return: Le vainqueur du duel (joueur1 en cas d'égalité).
+        """
+        self.presentateur.annoncer_duel(joueur1, joueur2)
+        points = {joueur1.nom: 0, joueur2.nom: 0}
+        for _ in range(nb_questions):
+            questions = (self._tirer_question_duel(), self._tirer_question_duel())
+            if None in questions:
+                break
+            for joueur, question in zip((joueur1, joueur2), questions):
+                if self.poser_question(question, joueur):
+                    points[joueur.nom] += 1
+                    self.sortie(f"{joueur.nom} marque {question.difficulte} point(s) !")
+                vider_sortie(self.sortie)
+        vainqueur = joueur2 if points[joueur2.nom] > points[joueur1.nom] else joueur1
+        self.sortie(f"\n{vainqueur.nom} remporte le duel final !")
+        return vainqueur
+
+    def etoile_mysterieuse(self, joueur, themes=None, nb_questions=5, bonnes_reponses=3):
+        """
+        Phase de l'Étoile Mystérieuse : le joueur doit répondre correctement à au moins
+        bonnes_reponses questions sur nb_questions, de difficulté moyenne ou difficile.
+
+        :param joueur: Instance de Joueur qui tente l'étoile.
+        :param themes: Thèmes des questions (tous par défaut).
+        :return: Vrai si le joueur remporte l'étoile.
+        """
+        self.presentateur.annoncer_etoile_mysterieuse(joueur.nom)
+        reussites = 0
+        for _ in range(nb_questions):
+            question = self.tirer_question_parmi([2, 3], themes)
+            if question is None:
+                break
+            if self.poser_question(question, joueur):
+                reussites += 1
+            vider_sortie(self.sortie)
+        gagne = reussites >= bonnes_reponses
+        self.sortie(f"\n{joueur.nom} {'découvre' if gagne else 'ne découvre pas'} l'Étoile Mystérieuse "
+                    f"({reussites}/{nb_questions}).")
+        return gagne
+
+    def jouer_phases(self, joueurs, nb_tours=5):
+        """
+        Joue les phases d'une partie : les tours, puis le duel final entre les deux meilleurs
+        joueurs et l'Étoile Mystérieuse pour son vainqueur. Rien n'est enregistré ni affiché
+        à la fin (voir jouer).
+
+        :param joueurs: Liste de Joueur.
+        :param nb_tours: Nombre de tours de jeu.
         """
         self.presentateur.annoncer_phase("Début du jeu")
-        joueurs = [Joueur("Alice"), Joueur("Bob"), Joueur("Charlie")]
         
-        for tour in range(5):
+        for tour in range(nb_tours):
             for joueur in joueurs:
                 self.jouer_tour(joueur)
+
+        if len(joueurs) >= 2:
+            premier, second = sorted(joueurs, key=lambda j: j.score, reverse=True)[:2]
+            self.presentateur.annoncer_phase("Duel final")
+            vainqueur = self.duel_final(premier, second)
+            self.presentateur.annoncer_phase("Étoile Mystérieuse")
+            self.etoile_mysterieuse(vainqueur)
+
+    def jouer(self, joueurs=None, nb_tours=5):
+        """
+        Démarre le jeu.
+
+        :param joueurs: Liste de Joueur (par défaut Alice, Bob et Charlie).
+        :param nb_tours: Nombre de tours de jeu.
+        """
+        joueurs = joueurs or [Joueur("Alice"), Joueur("Bob"), Joueur("Charlie")]
+        self.jouer_phases(joueurs, nb_tours)
         
         self.presentateur.annoncer_phase("Fin du jeu")
-        self._sauvegarder_scores()
+        self._sauvegarder_scores(joueurs)
 
-        print("\nScores finaux :")
+        self.sortie("\nScores finaux :")
         for joueur in joueurs:
-            print(joueur)
+            self.sortie(f"{joueur} (classement général : {self.tableau.general.rang(joueur.nom)}e)")
+
+        self.sortie("\nMeilleurs joueurs de la semaine :")
+        for rang, (nom, score) in enumerate(self.tableau.semaine.top(5), 1):
+            self.sortie(f"{rang}. {nom} : {score} points")
+        vider_sortie(self.sortie)
 
 if __name__ == "__main__":
-    jeu = Jeu()
+    preparer_environnement()
+    # python jeu.py [banque.qbank] : banque compilée par qbank.py, projetée en mémoire
+    jeu = Jeu(BanqueMmap(sys.argv[1]) if len(sys.argv) > 1 else None)
     jeu.jouer()
\ No newline at end of file
@@ -1,4 +1,7 @@
 import logging
+from journalisation import journal, evenement
+
+_journal = journal("joueur")
 
 class Joueur:
     """
@@ -23,7 +26,7 @@ class Joueur:
             raise ValueError("Le nom du joueur doit être une chaîne de caractères non vide.")
         self.nom = nom
         self.score = 0
-        logging.info(f"Joueur {nom} créé avec un score initial de {self.score}")
+        evenement(_journal, "joueur_cree", logging.DEBUG, joueur=nom, score=self.score)
 
     def __str__(self):
         """
@@ -0,0 +1,288 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from classement import JOUR, SEMAINE
+
+CHEMIN_DEFAUT = "scores.db"
+COMPACTION_TOUTES = 1000
+# Les classements glissants (jour, semaine) relisent le détail des résultats de la dernière semaine.
+CONSERVATION = SEMAINE
+
+
+class JournalScores:
+    """
+    Stockage des résultats de parties dans une base SQLite en mode WAL.
+
+    Chaque résultat est ajouté au journal (table resultats) et cumulé dans la
+    table totaux dans la même transaction : une écriture coûte O(1), une
+    écriture interrompue par un arrêt brutal est annulée en entier, et plusieurs
+    processus peuvent écrire en même temps (verrou d'écriture de SQLite).
+    Le démarrage ne relit pas l'historique : les totaux sont lus à la demande.
+    La compaction, régulièrement lancée dans un fil d'exécution séparé, supprime
+    les résultats plus anciens que la durée de conservation (ils sont déjà dans
+    les totaux) et tronque le fichier WAL : le journal ne grandit pas sans fin.
+
+    S'utilise comme un dictionnaire en lecture : journal[nom] retourne
+    {"total": ..., "parties": ..., "meilleur": ...}.
+    """
+
+    def __init__(self, chemin=CHEMIN_DEFAUT, compaction_toutes=COMPACTION_TOUTES, ancien_fichier="scores.json",
+                 conservation=CONSERVATION):
+        """
+        Args:
+            chemin (str): Le chemin de la base des scores.
+            compaction_toutes (int): Le nombre d'écritures entre deux compactions (0 pour n'en faire aucune).
+            ancien_fichier (str): L'ancien fichier scores.json à importer à la création de la base.
+            conservation (float): La durée, en secondes, pendant laquelle le détail d'un résultat est gardé.
+        """
+        self.chemin = chemin
+        self.compaction_toutes = compaction_toutes
+        self.conservation = conservation
+        self.ancien_fichier = ancien_fichier
+        self._conn = None
+        self._ecritures = 0
+        self._compaction = None
+
+    def _connexion(self):
+        # La base n'est ouverte qu'à la première utilisation : créer un Jeu n'écrit rien sur disque.
+        if self._conn is None:
+            conn = sqlite3.connect(self.chemin, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS resultats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nom TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    horodatage REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS resultats_horodatage ON resultats (horodatage)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS totaux (
+                    nom TEXT PRIMARY KEY,
+                    total INTEGER NOT NULL,
+                    parties INTEGER NOT NULL,
+                    meilleur INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS totaux_classement ON totaux (total DESC, nom)")
+            self._conn = conn
+            self._importer_ancien_fichier()
+        return self._conn
+
+    def _importer_ancien_fichier(self):
+        if not self.ancien_fichier or not os.path.exists(self.ancien_fichier):
+            return
+        if self._conn.execute("SELECT 1 FROM totaux LIMIT 1").fetchone():
+            return
+        try:
+            with open(self.ancien_fichier, "r") as f:
+                anciens = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning("Impossible d'importer %s : %s", self.ancien_fichier, e)
+            return
+        self.enregistrer_partie((nom, score) for nom, score in anciens.items() if isinstance(score, int))
+
+    def enregistrer(self, nom, score, horodatage=None):
+        """
+        Enregistre le résultat d'un joueur pour une partie.
+
+        Args:
+            nom (str): Le nom du joueur.
+            score (int): Son score dans la partie.
+            horodatage (float, optional): L'instant de la partie (maintenant par défaut).
+        """
+        self.enregistrer_partie([(nom, score)], horodatage)
+
+    def enregistrer_partie(self, resultats, horodatage=None):
+        """
+        Enregistre les résultats d'une partie en une seule transaction.
+
+        Args:
+            resultats (iterable): Couples (nom, score), ou instances de Joueur.
+            horodatage (float, optional): L'instant de la partie (maintenant par défaut).
+        """
+        horodatage = time.time() if horodatage is None else horodatage
+        lignes = [(r.nom, r.score) if hasattr(r, "nom") else tuple(r) for r in resultats]
+        conn = self._connexion()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("INSERT INTO resultats (nom, score, horodatage) VALUES (?, ?, ?)",
+                             [(nom, score, horodatage) for nom, score in lignes])
+            conn.executemany("""
+                INSERT INTO totaux (nom, total, parties, meilleur) VALUES (?, ?, 1, ?)
+                ON CONFLICT(nom) DO UPDATE SET
+                    total = total + excluded.total,
+                    parties = parties + 1,
+                    meilleur = MAX(meilleur, excluded.meilleur)
+            """, [(nom, score, score) for nom, score in lignes])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._ecritures += 1
+        if self.compaction_toutes and self._ecritures % self.compaction_toutes == 0:
+            self.compacter_en_arriere_plan()
+
+    def resultats(self, depuis=None):
+        """
+        Parcourt les résultats conservés (voir compacter), dans l'ordre d'enregistrement.
+
+        Args:
+            depuis (float, optional): Ne retourne que les résultats postérieurs à cet instant.
+
+        Yields:
+            tuple: (nom, score, horodatage).
+        """
+        requete = "SELECT nom, score, horodatage FROM resultats"
+        if depuis is None:
+            yield from self._connexion().execute(requete + " ORDER BY id")
+        else:
+            yield from self._connexion().execute(requete + " WHERE horodatage >= ? ORDER BY id", (depuis,))
+
+    def totaux(self):
+        """
+        Parcourt les totaux de tous les joueurs.
+
+        Yields:
+            tuple: (nom, total, parties, meilleur).
+        """
+        yield from self._connexion().execute("SELECT nom, total, parties, meilleur FROM totaux")
+
+    def compacter(self, maintenant=None):
+        """
+        Supprime les résultats plus anciens que la durée de conservation, puis reporte
+        le contenu du WAL dans la base et le tronque. Chaque résultat est cumulé dans
+        les totaux dès son enregistrement : les totaux restent exacts.
+        Utilise sa propre connexion pour pouvoir tourner dans un autre fil d'exécution.
+
+        Args:
+            maintenant (float, optional): L'instant de référence (maintenant par défaut).
+        """
+        maintenant = time.time() if maintenant is None else maintenant
+        conn = sqlite3.connect(self.chemin, timeout=30, isolation_level=None)
+        try:
+            conn.execute("DELETE FROM resultats WHERE horodatage < ?", (maintenant - self.conservation,))
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+
+    def compacter_en_arriere_plan(self):
+        """
+        Lance une compaction dans un fil d'exécution, sauf si une compaction est déjà en cours.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        self._compaction = threading.Thread(target=self.compacter, name="compaction-scores", daemon=True)
+        self._compaction.start()
+
+    def __getitem__(self, nom):
+        ligne = self._connexion().execute("SELECT total, parties, meilleur FROM totaux WHERE nom = ?", (nom,)).fetchone()
+        if ligne is None:
+            raise KeyError(nom)
+        return dict(zip(("total", "parties", "meilleur"), ligne))
+
+    def __contains__(self, nom):
+        return self._connexion().execute("SELECT 1 FROM totaux WHERE nom = ?", (nom,)).fetchone() is not None
+
+    def __len__(self):
+        return self._connexion().execute("SELECT COUNT(*) FROM totaux").fetchone()[0]
+
+    def get(self, nom, defaut=None):
+        try:
+            return self[nom]
+        except KeyError:
+            return defaut
+
+    def close(self):
+        if self._compaction is not None:
+            self._compaction.join()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class ClassementJournal:
+    """
+    Classement lu directement dans un JournalScores, sans rien charger en mémoire :
+    adapté à un processus qui ne consulte que quelques rangs en fin de partie
+    (un serveur de longue durée garde plutôt un TableauDesScores incrémental).
+
+    Le classement général parcourt l'index des totaux : le top K coûte O(log n + K).
+    Un classement glissant agrège les résultats conservés de sa fenêtre.
+    À score égal, les joueurs sont classés par nom.
+    """
+
+    def __init__(self, journal, duree=None, horloge=time.time):
+        """
+        Args:
+            journal (JournalScores): Le journal des scores.
+            duree (float, optional): La durée de la fenêtre en secondes (aucune pour le classement général).
+            horloge (callable): L'horloge qui situe la fenêtre.
+        """
+        self.journal = journal
+        self.duree = duree
+        self.horloge = horloge
+
+    def _scores(self):
+        # Requête (nom, score) du classement et ses paramètres.
+        if self.duree is None:
+            return "SELECT nom, total AS score FROM totaux", ()
+        return ("SELECT nom, SUM(score) AS score FROM resultats WHERE horodatage >= ? GROUP BY nom",
+                (self.horloge() - self.duree,))
+
+    def top(self, k=10):
+        """
+        Retourne les k premiers joueurs.
+
+        Returns:
+            list: Couples (nom, score), du meilleur au moins bon.
+        """
+        requete, parametres = self._scores()
+        return [tuple(ligne) for ligne in self.journal._connexion().execute(
+            f"SELECT nom, score FROM ({requete}) ORDER BY score DESC, nom LIMIT ?", parametres + (k,))]
+
+    def _score(self, conn, nom):
+        requete, parametres = self._scores()
+        ligne = conn.execute(f"SELECT score FROM ({requete}) WHERE nom = ?", parametres + (nom,)).fetchone()
+        return ligne[0] if ligne else None
+
+    def score(self, nom):
+        """
+        Retourne le score d'un joueur (0 s'il n'est pas classé).
+        """
+        return self._score(self.journal._connexion(), nom) or 0
+
+    def rang(self, nom):
+        """
+        Retourne le rang d'un joueur (1 pour le premier), ou None s'il n'est pas classé.
+        """
+        conn = self.journal._connexion()
+        score = self._score(conn, nom)
+        if score is None:
+            return None
+        requete, parametres = self._scores()
+        devant = conn.execute(f"SELECT COUNT(*) FROM ({requete}) WHERE score > ? OR (score = ? AND nom < ?)",
+                              parametres + (score, score, nom)).fetchone()[0]
+        return devant + 1
+
+
+class TableauJournal:
+    """
+    Classements général, du jour et de la semaine lus dans un JournalScores
+    (même interface que TableauDesScores).
+    """
+
+    def __init__(self, journal, horloge=time.time):
+        self.general = ClassementJournal(journal)
+        self.jour = ClassementJournal(journal, JOUR, horloge)
+        self.semaine = ClassementJournal(journal, SEMAINE, horloge)
+
+    def enregistrer_partie(self, resultats, horodatage=None):
+        """
+        Ne fait rien : les classements sont lus dans le journal, où les résultats sont déjà enregistrés.
+        """
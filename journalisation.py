@@ -0,0 +1,114 @@
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+RACINE = "quiz"
+
+_ecoute = None
+_relais = None
+
+
+class FormateurJSON(logging.Formatter):
+    """
+    Formate chaque enregistrement en une ligne JSON :
+    {"horodatage": ..., "niveau": ..., "source": ..., "evenement": ..., <champs de l'événement>}.
+    """
+
+    def format(self, record):
+        ligne = {
+            "horodatage": round(record.created, 6),
+            "niveau": record.levelname,
+            "source": record.name,
+            "evenement": record.getMessage(),
+        }
+        ligne.update(getattr(record, "champs", {}))
+        if record.exc_info:
+            ligne["exception"] = self.formatException(record.exc_info)
+        return json.dumps(ligne, ensure_ascii=False, default=str)
+
+
+class _RelaisFile(logging.handlers.QueueHandler):
+    """
+    Dépose les enregistrements tels quels dans la file : ils restent dans le processus,
+    inutile de les copier et de les mettre en forme dans le fil du jeu.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def journal(nom):
+    """
+    Retourne le logger d'un module du jeu, sous le logger racine « quiz ».
+
+    Args:
+        nom (str): Le nom du module (par exemple "question").
+
+    Returns:
+        logging.Logger: Le logger quiz.<nom>.
+    """
+    return logging.getLogger(f"{RACINE}.{nom}")
+
+
+def evenement(logger, nom, niveau=logging.INFO, **champs):
+    """
+    Journalise un événement structuré. Rien n'est construit si le niveau est désactivé :
+    le nom de l'événement est une constante et les champs ne sont mis en forme
+    (en JSON) que par le fil d'écoute.
+
+    Args:
+        logger (logging.Logger): Le logger du module.
+        nom (str): Le nom de l'événement (par exemple "question_creee").
+        niveau (int): Le niveau de journalisation.
+        **champs: Les champs de l'événement (joueur, question, latence...).
+    """
+    if logger.isEnabledFor(niveau):
+        logger.log(niveau, nom, extra={"champs": champs})
+
+
+def demarrer_journalisation(chemin=None, niveau=logging.INFO, flux=None):
+    """
+    Envoie les événements du jeu, en lignes JSON, vers un fichier ou un flux.
+    Le jeu ne fait que déposer les enregistrements dans une file ; l'écriture
+    est faite par un fil d'exécution séparé (QueueListener) et ne bloque jamais le jeu.
+
+    Args:
+        chemin (str, optional): Le fichier de destination (ajout en fin de fichier).
+        niveau (int): Le niveau minimal des événements journalisés.
+        flux (TextIO, optional): Le flux de destination si aucun fichier n'est donné (sys.stderr par défaut).
+
+    Returns:
+        logging.handlers.QueueListener: Le fil d'écoute démarré.
+    """
+    global _ecoute, _relais
+    arreter_journalisation()
+    destination = logging.FileHandler(chemin, encoding="utf-8") if chemin else logging.StreamHandler(flux or sys.stderr)
+    destination.setFormatter(FormateurJSON())
+    file = queue.SimpleQueue()
+    _relais = _RelaisFile(file)
+    racine = logging.getLogger(RACINE)
+    racine.addHandler(_relais)
+    racine.setLevel(niveau)
+    racine.propagate = False
+    _ecoute = logging.handlers.QueueListener(file, destination)
+    _ecoute.start()
+    return _ecoute
+
+
+def arreter_journalisation():
+    """
+    Écrit les événements encore en file puis arrête le fil d'écoute.
+    """
+    global _ecoute, _relais
+    if _ecoute is None:
+        return
+    racine = logging.getLogger(RACINE)
+    racine.removeHandler(_relais)
+    racine.setLevel(logging.NOTSET)
+    racine.propagate = True
+    _ecoute.stop()
+    for handler in _ecoute.handlers:
+        handler.close()
+    _ecoute = _relais = None
@@ -1,7 +1,9 @@
-from jeu import Jeu  # Assurez-vous que le nom du fichier où la classe Jeu est définie est 'jeu.py'
+import sys
+from jeu import Jeu, preparer_environnement  # Assurez-vous que le nom du fichier où la classe Jeu est définie est 'jeu.py'
 
 if __name__ == "__main__":
     try:
+        preparer_environnement()
         jeu = Jeu()
         
         if input("Mode entraînement ? (o/n) : ").lower() == 'o':
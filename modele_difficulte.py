@@ -0,0 +1,141 @@
+import time
+import numpy as np
+
+DIFFICULTES = np.array([1, 2, 3])
+
+
+class ModeleReponse:
+    """
+    Probabilité de bonne réponse d'un joueur synthétique selon sa compétence et la difficulté.
+
+    Par défaut, modèle logistique : p = plancher + (1 - plancher) / (1 + exp(-pente * (competence - difficulte))),
+    où plancher est la chance de trouver au hasard. Une table de précisions par difficulté
+    (indépendante de la compétence) peut être donnée à la place.
+    """
+
+    def __init__(self, pente=2.0, plancher=0.25, precisions=None):
+        """
+        Args:
+            pente (float): La sensibilité de la réussite à l'écart compétence - difficulté.
+            plancher (float): La probabilité de réussite minimale (réponse au hasard).
+            precisions (dict, optional): Probabilité de bonne réponse par difficulté (1-3), qui remplace le modèle logistique.
+        """
+        self.pente = pente
+        self.plancher = plancher
+        self.precisions = None if precisions is None else np.array([precisions[d] for d in DIFFICULTES.tolist()])
+
+    def probabilites(self, competences, difficultes):
+        """
+        Calcule la probabilité de bonne réponse de chaque joueur à sa question.
+
+        Args:
+            competences (np.ndarray): La compétence de chaque joueur (sur l'échelle 1-3 des difficultés).
+            difficultes (np.ndarray): La difficulté (1-3) de la question de chaque joueur.
+
+        Returns:
+            np.ndarray: Les probabilités.
+        """
+        if self.precisions is not None:
+            return self.precisions[difficultes - 1]
+        return self.plancher + (1 - self.plancher) / (1 + np.exp(-self.pente * (competences - difficultes)))
+
+
+class SimulationMonteCarlo:
+    """
+    Modèle vectorisé des règles d'ajustement de la difficulté (voir Joueur.ajuster_difficulte
+    et Question.evaluer) : tous les joueurs synthétiques avancent d'un tour à la fois,
+    sous forme de tableaux NumPy de niveaux, de scores et de compétences.
+
+    À chaque tour, chaque joueur reçoit une question dont la difficulté est tirée selon
+    son niveau (mêmes poids que echantillonneur.poids_difficultes), répond juste selon
+    le modèle de réponse, gagne difficulte points s'il a raison, et son niveau monte
+    ou descend de pas entre niveau_min et niveau_max.
+    """
+
+    def __init__(self, nb_joueurs, modele=None, competences=None, pas=0.5, niveau_min=1.0, niveau_max=3.0,
+                 points=(1, 2, 3), selectivite=1.0, graine=None):
+        """
+        Args:
+            nb_joueurs (int): Le nombre de joueurs synthétiques.
+            modele (ModeleReponse, optional): Le modèle de réponse (logistique par défaut).
+            competences (np.ndarray, optional): La compétence de chaque joueur (par défaut,
+                loi normale de moyenne 2 et d'écart-type 0.5).
+            pas (float): La variation du niveau après chaque réponse.
+            niveau_min (float): Le niveau minimal.
+            niveau_max (float): Le niveau maximal.
+            points (tuple): Les points gagnés pour une bonne réponse de difficulté 1, 2 et 3.
+            selectivite (float): Voir echantillonneur.poids_difficultes.
+            graine (int, optional): La graine du générateur aléatoire.
+        """
+        self.rng = np.random.default_rng(graine)
+        self.modele = modele or ModeleReponse()
+        self.competences = (np.asarray(competences, dtype=float) if competences is not None
+                            else self.rng.normal(2.0, 0.5, nb_joueurs))
+        if len(self.competences) != nb_joueurs:
+            raise ValueError("Il faut une compétence par joueur.")
+        self.niveaux = np.full(nb_joueurs, float(niveau_min))
+        self.scores = np.zeros(nb_joueurs, dtype=np.int64)
+        self.pas = pas
+        self.niveau_min = niveau_min
+        self.niveau_max = niveau_max
+        self.points = np.asarray(points)
+        self.selectivite = selectivite
+
+    def _tirer_difficultes(self):
+        poids = np.exp(-self.selectivite * (DIFFICULTES[None, :] - self.niveaux[:, None]) ** 2)
+        cumul = np.cumsum(poids, axis=1)
+        tirages = self.rng.random(len(self.niveaux)) * cumul[:, -1]
+        return (tirages[:, None] >= cumul).sum(axis=1) + 1
+
+    def tour(self):
+        """
+        Fait jouer une question à tous les joueurs.
+
+        Returns:
+            np.ndarray: Les réussites (booléens) de chaque joueur.
+        """
+        difficultes = self._tirer_difficultes()
+        reussites = self.rng.random(len(self.niveaux)) < self.modele.probabilites(self.competences, difficultes)
+        self.scores += np.where(reussites, self.points[difficultes - 1], 0)
+        self.niveaux = np.clip(self.niveaux + np.where(reussites, self.pas, -self.pas), self.niveau_min, self.niveau_max)
+        return reussites
+
+    def simuler(self, nb_tours):
+        """
+        Joue nb_tours tours et résume les distributions après chaque tour.
+
+        Args:
+            nb_tours (int): Le nombre de tours.
+
+        Returns:
+            list: Pour chaque tour, un dictionnaire (tour, precision, score_moyen, score_p10,
+                score_p50, score_p90, niveau_moyen, niveaux : part des joueurs à chaque niveau).
+        """
+        resumes = []
+        for numero in range(1, nb_tours + 1):
+            reussites = self.tour()
+            p10, p50, p90 = np.percentile(self.scores, [10, 50, 90])
+            valeurs, effectifs = np.unique(self.niveaux, return_counts=True)
+            resumes.append({
+                "tour": numero,
+                "precision": float(reussites.mean()),
+                "score_moyen": float(self.scores.mean()),
+                "score_p10": float(p10),
+                "score_p50": float(p50),
+                "score_p90": float(p90),
+                "niveau_moyen": float(self.niveaux.mean()),
+                "niveaux": dict(zip(valeurs.tolist(), (effectifs / len(self.niveaux)).tolist())),
+            })
+        return resumes
+
+
+if __name__ == "__main__":
+    for pas in (0.5, 0.25):
+        debut = time.perf_counter()
+        resumes = SimulationMonteCarlo(1_000_000, pas=pas, graine=0).simuler(15)
+        duree = time.perf_counter() - debut
+        dernier = resumes[-1]
+        print(f"Pas {pas} : 1 000 000 joueurs x 15 tours en {duree:.1f}s")
+        print(f"  score moyen {dernier['score_moyen']:.2f} (p10 {dernier['score_p10']:.0f}, "
+              f"p90 {dernier['score_p90']:.0f}), niveau moyen {dernier['niveau_moyen']:.2f}, "
+              f"précision au dernier tour {dernier['precision']:.2f}")
@@ -1,4 +1,7 @@
-import logging
+from journalisation import journal, evenement
+from sorties import SortieTerminal
+
+_journal = journal("presentateur")
 
 class Presentateur:
     """
@@ -6,14 +9,17 @@ class Presentateur:
 
     Attributs:
         nom (str): Le nom du présentateur.
+        sortie (callable): La fonction ou Sortie recevant chaque message.
     """
 
-    def __init__(self, nom):
+    def __init__(self, nom, sortie=None):
         """
         Initialise une instance de la classe Presentateur.
 
         Args:
             nom (str): Le nom du présentateur.
+            sortie (callable, optional): La fonction ou Sortie recevant chaque message
+                (écriture immédiate sur sys.stdout par défaut).
 
         Raises:
             ValueError: Si le nom n'est pas une chaîne de caractères non vide.
@@ -21,6 +27,7 @@ class Presentateur:
         if not nom or not isinstance(nom, str):
             raise ValueError("Le nom du présentateur doit être une chaîne de caractères non vide.")
         self.nom = nom
+        self.sortie = sortie if sortie is not None else SortieTerminal()
 
     def annoncer_phase(self, nom_phase):
         """
@@ -34,8 +41,8 @@ class Presentateur:
         """
         if not nom_phase or not isinstance(nom_phase, str):
             raise ValueError("Le nom de la phase doit être une chaîne de caractères non vide.")
-        logging.info(f"Annoncer phase: {nom_phase}")
-        print(f"\n{self.nom} : --- {nom_phase} ---")
+        evenement(_journal, "annonce_phase", phase=nom_phase)
+        self.sortie(f"\n{self.nom} : --- {nom_phase} ---")
 
     def annoncer_tour(self, nom_joueur):
         """
@@ -49,8 +56,8 @@ class Presentateur:
         """
         if not nom_joueur or not isinstance(nom_joueur, str):
             raise ValueError("Le nom du joueur doit être une chaîne de caractères non vide.")
-        logging.info(f"Annoncer tour de: {nom_joueur}")
-        print(f"\n{self.nom} : {nom_joueur}, à vous de jouer !")
+        evenement(_journal, "annonce_tour", joueur=nom_joueur)
+        self.sortie(f"\n{self.nom} : {nom_joueur}, à vous de jouer !")
 
     def annoncer_resultat(self, resultat, reponse_correcte=None):
         """
@@ -66,15 +73,15 @@ class Presentateur:
         if not isinstance(resultat, bool):
             raise ValueError("Le résultat doit être un booléen.")
         if resultat:
-            logging.info("Bonne réponse")
-            print(f"{self.nom} : Bonne réponse !")
+            evenement(_journal, "annonce_resultat", correcte=True)
+            self.sortie(f"{self.nom} : Bonne réponse !")
         else:
             if reponse_correcte:
-                logging.info(f"Mauvaise réponse. La bonne réponse était: {reponse_correcte}")
-                print(f"{self.nom} : Mauvaise réponse. La bonne réponse était : {reponse_correcte}.")
+                evenement(_journal, "annonce_resultat", correcte=False, reponse_correcte=reponse_correcte)
+                self.sortie(f"{self.nom} : Mauvaise réponse. La bonne réponse était : {reponse_correcte}.")
             else:
-                logging.info("Temps écoulé")
-                print(f"{self.nom} : Temps écoulé !")
+                evenement(_journal, "annonce_resultat", correcte=False, temps_ecoule=True)
+                self.sortie(f"{self.nom} : Temps écoulé !")
 
     def annoncer_duel(self, joueur1, joueur2):
         """
@@ -89,8 +96,8 @@ class Presentateur:
         """
         if not joueur1 or not joueur2:
             raise ValueError("Les deux joueurs doivent être fournis pour le duel.")
-        logging.info(f"Duel entre {joueur1.nom} et {joueur2.nom}")
-        print(f"\n{self.nom} : Duel final entre {joueur1.nom} et {joueur2.nom} !")
+        evenement(_journal, "annonce_duel", joueur1=joueur1.nom, joueur2=joueur2.nom)
+        self.sortie(f"\n{self.nom} : Duel final entre {joueur1.nom} et {joueur2.nom} !")
 
     def annoncer_etoile_mysterieuse(self, nom_joueur):
         """
@@ -104,5 +111,5 @@ class Presentateur:
         """
         if not nom_joueur or not isinstance(nom_joueur, str):
             raise ValueError("Le nom du joueur doit être une chaîne de caractères non vide.")
-        logging.info(f"{nom_joueur} tente de découvrir l'Étoile Mystérieuse")
-        print(f"\n{self.nom} : {nom_joueur}, vous allez tenter de découvrir l'Étoile Mystérieuse !")
\ No newline at end of file
+        evenement(_journal, "annonce_etoile_mysterieuse", joueur=nom_joueur)
+        self.sortie(f"\n{self.nom} : {nom_joueur}, vous allez tenter de découvrir l'Étoile Mystérieuse !")
\ No newline at end of file
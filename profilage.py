@@ -0,0 +1,302 @@
+import argparse
+import cProfile
+import functools
+import importlib
+import inspect
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Phases mesurées : (module, classe ou None pour une fonction du module, attribut, nom de la phase).
+# Seuls les modules déjà importés au démarrage du profilage sont instrumentés.
+CIBLES = [
+    ("jeu", "Jeu", "jouer", "partie"),
+    ("jeu", "Jeu", "jouer_tour", "tour"),
+    ("jeu", "Jeu", "_sauvegarder_scores", "scores"),
+    ("jeu", "Question", "poser", "question"),
+    ("jeu", "Question", "rendu", "rendu"),
+    ("jeu", "Question", "evaluer", "evaluation"),
+    ("jeu", "Question", "valider_entree_utilisateur", "saisie"),
+    ("jeu", "Recompense", "verifier_badges", "badges"),
+    ("jeu", "VoixOff", "annoncer", "voix_off"),
+    *(("jeu", "Presentateur", methode, "presentateur") for methode in (
+        "annoncer_phase", "annoncer_tour", "annoncer_resultat", "annoncer_elimination",
+        "annoncer_duel", "annoncer_etoile_mysterieuse")),
+    ("question", "Question", "poser", "question"),
+    ("question", "Question", "rendu", "rendu"),
+    *(("presentateur", "Presentateur", methode, "presentateur") for methode in (
+        "annoncer_phase", "annoncer_tour", "annoncer_resultat", "annoncer_duel", "annoncer_etoile_mysterieuse")),
+    ("saisie", "LecteurEntree", "lire", "saisie"),
+    ("sorties", "SortieTamponnee", "vider", "affichage"),
+    ("sorties", "SortieTerminal", "vider", "affichage"),
+    ("journal_scores", "JournalScores", "enregistrer_partie", "scores"),
+    ("logging", "Logger", "_log", "journalisation"),
+    ("quiz_vocal", None, "speak", "synthese_vocale"),
+    ("quiz_vocal", None, "get_random_question", "tirage"),
+    ("synthese_vocale", "TravailleurVocal", "dire", "synthese_vocale"),
+]
+
+
+class Profileur:
+    """
+    Profilage à la demande d'une partie : temps passé par phase (rendu, journalisation,
+    synthèse vocale, attente de saisie, badges, scores...), éventuellement complété par
+    cProfile ou par un profileur par échantillonnage.
+
+    Les phases sont mesurées en remplaçant, le temps du profilage seulement, les fonctions
+    listées dans les cibles par des enveloppes chronométrées ; les originales sont remises
+    à l'arrêt. Hors profilage, le jeu n'exécute donc aucun code supplémentaire.
+
+    Les phases s'imbriquent (une question contient son rendu et sa saisie) : chaque pile de
+    phases reçoit son temps propre, exportable en piles repliées pour un flamegraph
+    (flamegraph.pl, speedscope, inferno).
+
+    Exemple :
+        with Profileur(intervalle_echantillons=0.001) as profileur:
+            Jeu().jouer()
+        profileur.exporter_piles("phases.txt")
+    """
+
+    def __init__(self, cibles=CIBLES, cprofile=False, intervalle_echantillons=None):
+        """
+        Args:
+            cibles (list): Les fonctions à chronométrer (voir CIBLES).
+            cprofile (bool): Profile aussi chaque appel de fonction avec cProfile.
+            intervalle_echantillons (float, optional): Si fourni, relève la pile de tous les fils
+                d'exécution toutes les intervalle_echantillons secondes.
+        """
+        self.cibles = cibles
+        self.intervalle_echantillons = intervalle_echantillons
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self.appels = Counter()
+        self.durees = Counter()  # Temps inclusif par phase
+        self.piles = Counter()  # Temps propre par pile de phases
+        self.echantillons = Counter()
+        self.duree = 0.0
+        self._originales = []
+        self._local = threading.local()
+        self._verrou = threading.Lock()
+        self._arret = threading.Event()
+        self._fil = None
+        self._debut = None
+
+    def _entrer(self, nom):
+        local = self._local
+        pile = getattr(local, "pile", None)
+        if pile is None:
+            pile = local.pile = []
+        chemin = f"{pile[-1][0]};{nom}" if pile else nom
+        pile.append([chemin, nom, time.perf_counter(), 0.0])
+
+    def _sortir(self):
+        pile = self._local.pile
+        chemin, nom, debut, enfants = pile.pop()
+        duree = time.perf_counter() - debut
+        if pile:
+            pile[-1][3] += duree
+        with self._verrou:
+            self.appels[nom] += 1
+            if not any(parent[1] == nom for parent in pile):  # Appels récursifs : compté une fois
+                self.durees[nom] += duree
+            self.piles[chemin] += duree - enfants
+
+    @contextmanager
+    def phase(self, nom):
+        """
+        Chronomètre un bloc de code comme une phase, par exemple :
+            with profileur.phase("chargement"): ...
+        """
+        self._entrer(nom)
+        try:
+            yield
+        finally:
+            self._sortir()
+
+    def _envelopper(self, fonction, nom):
+        entrer, sortir = self._entrer, self._sortir
+
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            entrer(nom)
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                sortir()
+        return enveloppe
+
+    def _instrumenter(self):
+        for module, classe, attribut, nom in self.cibles:
+            if module not in sys.modules:
+                continue
+            proprietaire = sys.modules[module]
+            if classe is not None:
+                proprietaire = getattr(proprietaire, classe, None)
+            if proprietaire is None or not hasattr(proprietaire, attribut):
+                continue
+            originale = inspect.getattr_static(proprietaire, attribut)
+            if isinstance(originale, (staticmethod, classmethod)):
+                remplacante = type(originale)(self._envelopper(originale.__func__, nom))
+            else:
+                remplacante = self._envelopper(originale, nom)
+            # Une méthode héritée est remplacée dans la sous-classe, puis simplement retirée.
+            heritee = classe is not None and attribut not in vars(proprietaire)
+            setattr(proprietaire, attribut, remplacante)
+            self._originales.append((proprietaire, attribut, None if heritee else originale))
+
+    def _restaurer(self):
+        while self._originales:
+            proprietaire, attribut, originale = self._originales.pop()
+            if originale is None:
+                delattr(proprietaire, attribut)
+            else:
+                setattr(proprietaire, attribut, originale)
+
+    def _echantillonner(self):
+        fil_courant = threading.get_ident()
+        noms = {}
+        while not self._arret.wait(self.intervalle_echantillons):
+            for identifiant, cadre in sys._current_frames().items():
+                if identifiant == fil_courant:
+                    continue
+                fonctions = []
+                while cadre is not None:
+                    code = cadre.f_code
+                    fonctions.append(f"{cadre.f_globals.get('__name__', '?')}.{code.co_name}")
+                    cadre = cadre.f_back
+                if identifiant not in noms:
+                    noms = {fil.ident: fil.name for fil in threading.enumerate()}
+                fonctions.append(noms.get(identifiant, str(identifiant)))
+                self.echantillons[";".join(reversed(fonctions))] += 1
+
+    def demarrer(self):
+        """
+        Instrumente les phases et démarre les profileurs demandés.
+
+        Raises:
+            ValueError: Si le profilage est déjà démarré.
+        """
+        if self._debut is not None:
+            raise ValueError("Le profilage est déjà démarré.")
+        self._instrumenter()
+        if self.intervalle_echantillons:
+            self._arret.clear()
+            self._fil = threading.Thread(target=self._echantillonner, name="profilage", daemon=True)
+            self._fil.start()
+        if self.cprofile:
+            self.cprofile.enable()
+        self._debut = time.perf_counter()
+        return self
+
+    def arreter(self):
+        """
+        Arrête les profileurs et remet les fonctions d'origine.
+        """
+        if self._debut is None:
+            return
+        self.duree += time.perf_counter() - self._debut
+        self._debut = None
+        if self.cprofile:
+            self.cprofile.disable()
+        if self._fil is not None:
+            self._arret.set()
+            self._fil.join()
+            self._fil = None
+        self._restaurer()
+
+    def __enter__(self):
+        return self.demarrer()
+
+    def __exit__(self, *exc):
+        self.arreter()
+
+    def rapport(self):
+        """
+        Returns:
+            list: Pour chaque phase, du plus long au plus court : (phase, appels, temps total
+                en secondes, temps propre en secondes, part du temps profilé).
+        """
+        propres = Counter()
+        for chemin, duree in self.piles.items():
+            propres[chemin.rsplit(";", 1)[-1]] += duree
+        return [(nom, self.appels[nom], duree, propres[nom], duree / self.duree if self.duree else 0.0)
+                for nom, duree in self.durees.most_common()]
+
+    def afficher_rapport(self, sortie=print):
+        sortie(f"{'Phase':<18}{'Appels':>8}{'Total (ms)':>12}{'Propre (ms)':>13}{'Part':>7}")
+        for nom, appels, total, propre, part in self.rapport():
+            sortie(f"{nom:<18}{appels:>8}{total * 1000:>12.2f}{propre * 1000:>13.2f}{part:>7.1%}")
+
+    def exporter_piles(self, chemin, echantillons=False):
+        """
+        Écrit les piles repliées (« phase;sous-phase poids » par ligne), format d'entrée
+        des outils de flamegraph.
+
+        Args:
+            chemin (str): Le fichier à écrire.
+            echantillons (bool): Exporte les piles de fonctions échantillonnées (poids : nombre
+                d'échantillons) au lieu des piles de phases (poids : microsecondes).
+
+        Returns:
+            int: Le nombre de piles écrites.
+        """
+        if echantillons:
+            piles = self.echantillons
+        else:
+            piles = Counter({chemin: round(duree * 1e6) for chemin, duree in self.piles.items()})
+        with open(chemin, "w", encoding="utf-8") as f:
+            for pile, poids in sorted(piles.items()):
+                if poids > 0:
+                    f.write(f"{pile} {poids}\n")
+        return len(piles)
+
+    def exporter_pstats(self, chemin):
+        """
+        Écrit les statistiques cProfile (lisibles avec pstats, snakeviz...).
+
+        Raises:
+            ValueError: Si le profileur a été créé sans cprofile.
+        """
+        if self.cprofile is None:
+            raise ValueError("Profileur créé sans cProfile.")
+        self.cprofile.dump_stats(chemin)
+
+
+def _jouer_jeu():
+    from jeu import Jeu
+    Jeu().jouer()
+
+
+def _quiz_vocal():
+    import quiz_vocal
+    quiz_vocal.main()
+
+
+PROGRAMMES = {"jeu": _jouer_jeu, "quiz_vocal": _quiz_vocal}
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Joue une partie en mesurant le temps passé dans chaque phase.")
+    parseur.add_argument("programme", choices=sorted(PROGRAMMES))
+    parseur.add_argument("--piles", help="Fichier où écrire les piles de phases repliées (flamegraph).")
+    parseur.add_argument("--echantillons", type=float, metavar="INTERVALLE",
+                         help="Échantillonne les piles de fonctions toutes les INTERVALLE secondes.")
+    parseur.add_argument("--piles-echantillons", help="Fichier où écrire les piles échantillonnées repliées.")
+    parseur.add_argument("--pstats", help="Active cProfile et écrit ses statistiques dans ce fichier.")
+    arguments = parseur.parse_args()
+    # Les modules du jeu doivent être importés avant le démarrage pour être instrumentés.
+    for module in ("jeu", "quiz_vocal"):
+        importlib.import_module(module)
+    profileur = Profileur(cprofile=bool(arguments.pstats), intervalle_echantillons=arguments.echantillons)
+    try:
+        with profileur:
+            PROGRAMMES[arguments.programme]()
+    finally:
+        profileur.afficher_rapport()
+        if arguments.piles:
+            profileur.exporter_piles(arguments.piles)
+        if arguments.piles_echantillons:
+            profileur.exporter_piles(arguments.piles_echantillons, echantillons=True)
+        if arguments.pstats:
+            profileur.exporter_pstats(arguments.pstats)
@@ -0,0 +1,209 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from sources_questions import SourceQuestions, SourceJSONL, SourceCSV, SourceSQLite
+
+# Format .qbank (entiers petit-boutistes) :
+#   en-tête    : signature, version, nombre de questions, nombre de thèmes,
+#                positions de la table des thèmes et de l'index
+#   charges    : pour chaque question, énoncé, explication et options en UTF-8, séparés par SEPARATEUR
+#   thèmes     : pour chaque thème, longueur (2 octets) puis nom en UTF-8
+#   index      : une entrée de taille fixe par question (position et longueur de la charge,
+#                difficulté, réponse correcte, numéro du thème)
+SIGNATURE = b"QBNK"
+VERSION = 1
+EN_TETE = struct.Struct("<4sHxxQIxxxxQQ")
+ENTREE = struct.Struct("<QIBBH")
+LONGUEUR_THEME = struct.Struct("<H")
+SEPARATEUR = "\x1f"
+MAX_THEMES = 65535
+
+
+def compiler(source, chemin):
+    """
+    Compile une source de questions en fichier .qbank, en un seul passage sur la source.
+    Un thème ou une explication None sont écrits comme des chaînes vides. Le fichier est
+    écrit sous un nom temporaire, retiré si la compilation échoue.
+
+    Args:
+        source (SourceQuestions): La source (ou tout itérable de questions normalisées).
+        chemin (str): Le fichier .qbank à écrire.
+
+    Returns:
+        int: Le nombre de questions compilées.
+
+    Raises:
+        ValueError: Si un texte contient le séparateur, ou s'il y a trop de thèmes.
+    """
+    numeros_themes = {}
+    index = bytearray()
+    temporaire = chemin + ".tmp"
+    try:
+        with open(temporaire, "wb") as f:
+            f.write(bytes(EN_TETE.size))
+            position = EN_TETE.size
+            nombre = 0
+            for enonce, options, reponse_correcte, difficulte, theme, explication in source:
+                theme, explication = theme or "", explication or ""
+                champs = [enonce, explication, *options]
+                if any(SEPARATEUR in champ for champ in champs):
+                    raise ValueError(f"Question {nombre + 1} : caractère de séparation interdit dans le texte.")
+                numero = numeros_themes.setdefault(theme, len(numeros_themes))
+                if numero >= MAX_THEMES:
+                    raise ValueError(f"Un fichier .qbank accepte au plus {MAX_THEMES} thèmes.")
+                charge = SEPARATEUR.join(champs).encode("utf-8")
+                f.write(charge)
+                index += ENTREE.pack(position, len(charge), difficulte, reponse_correcte, numero)
+                position += len(charge)
+                nombre += 1
+            position_themes = position
+            for theme in numeros_themes:
+                nom = theme.encode("utf-8")
+                f.write(LONGUEUR_THEME.pack(len(nom)) + nom)
+                position += LONGUEUR_THEME.size + len(nom)
+            f.write(index)
+            f.seek(0)
+            f.write(EN_TETE.pack(SIGNATURE, VERSION, nombre, len(numeros_themes), position_themes, position))
+        os.replace(temporaire, chemin)
+    finally:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+    return nombre
+
+
+class BanqueMmap(SourceQuestions):
+    """
+    Banque de questions lue dans un fichier .qbank projeté en mémoire (mmap).
+
+    L'ouverture ne lit que l'en-tête et la table des thèmes : elle prend le même temps
+    quelle que soit la taille de la banque. Le jeu indexe la banque à partir des colonnes
+    de difficulté et de thème de l'index (colonnes) ; une question n'est décodée que
+    lorsqu'elle est tirée, et plusieurs processus ouvrant le même fichier partagent les mêmes
+    pages du cache du système au lieu d'en garder chacun une copie.
+    """
+
+    acces_direct = True
+
+    def __init__(self, chemin):
+        """
+        Args:
+            chemin (str): Le fichier .qbank (voir compiler).
+
+        Raises:
+            ValueError: Si le fichier n'est pas un fichier .qbank valide.
+        """
+        super().__init__()
+        self.chemin = chemin
+        with open(chemin, "rb") as f:
+            self._donnees = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._donnees) < EN_TETE.size:
+            self.close()
+            raise ValueError(f"{chemin} n'est pas un fichier .qbank.")
+        signature, version, self._nombre, nb_themes, position, self._index = EN_TETE.unpack_from(self._donnees)
+        if signature != SIGNATURE or version != VERSION:
+            self.close()
+            raise ValueError(f"{chemin} n'est pas un fichier .qbank (version {VERSION}).")
+        self.noms_themes = []
+        for _ in range(nb_themes):
+            longueur, = LONGUEUR_THEME.unpack_from(self._donnees, position)
+            position += LONGUEUR_THEME.size
+            self.noms_themes.append(sys.intern(self._donnees[position:position + longueur].decode("utf-8")))
+            position += longueur
+
+    def __len__(self):
+        return self._nombre
+
+    def _entree(self, indice):
+        if not 0 <= indice < self._nombre:
+            raise IndexError("Indice de question hors de la banque.")
+        return ENTREE.unpack_from(self._donnees, self._index + indice * ENTREE.size)
+
+    def difficulte(self, indice):
+        """
+        Retourne la difficulté d'une question, lue dans l'index sans décoder la question.
+        """
+        return self._entree(indice)[2]
+
+    def theme(self, indice):
+        """
+        Retourne le thème d'une question, lu dans l'index sans décoder la question.
+        """
+        return self.noms_themes[self._entree(indice)[4]]
+
+    def difficultes(self):
+        """
+        Retourne la colonne des difficultés de toutes les questions.
+
+        Returns:
+            array: Les difficultés, dans l'ordre des questions.
+        """
+        vue = memoryview(self._donnees)[self._index:self._index + self._nombre * ENTREE.size]
+        try:
+            return array("b", vue[12::ENTREE.size])
+        finally:
+            vue.release()
+
+    def colonnes(self):
+        # Lues dans l'index, sans décoder les questions. Dans chaque entrée de 16 octets,
+        # la difficulté est l'octet 12 et le numéro du thème le 8e entier de 2 octets.
+        vue = memoryview(self._donnees)[self._index:self._index + self._nombre * ENTREE.size]
+        try:
+            difficultes = array("b", vue[12::ENTREE.size])
+            numeros = array("H", vue.cast("H")[7::ENTREE.size // 2])
+        finally:
+            vue.release()
+        if sys.byteorder == "big":
+            numeros.byteswap()
+        return difficultes, [self.noms_themes[numero] for numero in numeros]
+
+    def question(self, indice):
+        """
+        Décode une question.
+
+        Returns:
+            tuple: (enonce, options, reponse_correcte, difficulte, theme, explication).
+        """
+        position, longueur, difficulte, reponse_correcte, theme = self._entree(indice)
+        enonce, explication, *options = self._donnees[position:position + longueur].decode("utf-8").split(SEPARATEUR)
+        return enonce, options, reponse_correcte, difficulte, self.noms_themes[theme], explication
+
+    __getitem__ = question
+
+    def enregistrements(self):
+        for enonce, options, reponse_correcte, difficulte, theme, explication in self:
+            yield {"question": enonce, "options": options, "correct_option": reponse_correcte,
+                   "difficulty": difficulte, "theme": theme, "explication": explication}
+
+    def depuis(self, position):
+        # Les questions sont déjà normalisées : pas de conversion de difficulté.
+        for indice in range(position, self._nombre):
+            yield self.question(indice)
+
+    def close(self):
+        self._donnees.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _ouvrir_source(chemin):
+    extension = os.path.splitext(chemin)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return SourceJSONL(chemin)
+    if extension == ".csv":
+        return SourceCSV(chemin)
+    if extension in (".db", ".sqlite"):
+        return SourceSQLite(chemin)
+    raise ValueError(f"Format non pris en charge : {chemin} (attendu .jsonl, .ndjson, .csv ou .db).")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage : python qbank.py SOURCE(.jsonl|.csv|.db) DESTINATION.qbank")
+        sys.exit(1)
+    print(f"{compiler(_ouvrir_source(sys.argv[1]), sys.argv[2])} questions compilées dans {sys.argv[2]}.")
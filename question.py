@@ -1,6 +1,99 @@
+import hashlib
+import json
 import logging
-import time
-from functools import lru_cache
+from collections import OrderedDict
+import saisie
+from journalisation import journal, evenement
+from sorties import vider_sortie
+
+_journal = journal("question")
+
+TAILLE_CACHE_RENDUS = 1024
+LIBELLES = {
+    "fr": {"question": "Question", "reponse": "Réponse"},
+    "en": {"question": "Question", "reponse": "Answer"},
+}
+
+
+class CacheRendus:
+    """
+    Cache borné des textes rendus des questions (affichage et synthèse vocale).
+
+    Les entrées sont indexées par (identifiant de la question, locale, type de rendu)
+    et évincées de la moins récemment utilisée à la plus récente au-delà de taille_max.
+    Seuls des textes sont gardés : ni les questions ni les joueurs ne sont retenus.
+    """
+
+    def __init__(self, taille_max=TAILLE_CACHE_RENDUS):
+        """
+        Args:
+            taille_max (int): Le nombre maximal de textes gardés.
+        """
+        self.taille_max = taille_max
+        self._textes = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+
+    def __len__(self):
+        return len(self._textes)
+
+    def obtenir(self, cle, fabrique):
+        """
+        Retourne le texte associé à la clé, en le construisant avec fabrique() s'il est absent.
+
+        Args:
+            cle (tuple): (identifiant, locale, type de rendu).
+            fabrique (callable): Construit le texte.
+
+        Returns:
+            str: Le texte rendu.
+        """
+        texte = self._textes.get(cle)
+        if texte is not None:
+            self._textes.move_to_end(cle)
+            self.succes += 1
+            return texte
+        self.echecs += 1
+        texte = self._textes[cle] = fabrique()
+        if len(self._textes) > self.taille_max:
+            self._textes.popitem(last=False)
+        return texte
+
+    def invalider(self, identifiant):
+        """
+        Retire tous les rendus d'une question (à appeler si la question est modifiée).
+
+        Args:
+            identifiant (str): L'identifiant de la question.
+        """
+        for cle in [cle for cle in self._textes if cle[0] == identifiant]:
+            del self._textes[cle]
+
+    def vider(self):
+        """
+        Retire tous les rendus.
+        """
+        self._textes.clear()
+
+
+cache_rendus = CacheRendus()
+
+
+def empreinte_question(enonce, options):
+    """
+    Calcule l'identifiant par défaut d'une question à partir de tout ce qui est rendu.
+    Deux questions de même énoncé mais d'options différentes ont des identifiants différents,
+    et l'empreinte de 128 bits rend les collisions négligeables même sur des millions de questions.
+
+    Args:
+        enonce (str): L'énoncé de la question.
+        options (list): Les options de réponse.
+
+    Returns:
+        str: L'empreinte BLAKE2b (32 caractères hexadécimaux).
+    """
+    contenu = json.dumps([enonce, options], ensure_ascii=False).encode()
+    return hashlib.blake2b(contenu, digest_size=16).hexdigest()
 
 class Question:
     """
@@ -11,9 +104,12 @@ class Question:
         options (list): Les options de réponse.
         reponse_correcte (int): L'indice de la réponse correcte.
         difficulte (int): Le niveau de difficulté de la question.
+        identifiant (str): L'identifiant stable de la question.
     """
 
-    def __init__(self, enonce, options, reponse_correcte, difficulte):
+    __slots__ = ("enonce", "options", "reponse_correcte", "difficulte", "identifiant")
+
+    def __init__(self, enonce, options, reponse_correcte, difficulte, identifiant=None):
         """
         Initialise une instance de la classe Question.
 
@@ -22,6 +118,8 @@ class Question:
             options (list): Les options de réponse.
             reponse_correcte (int): L'indice de la réponse correcte.
             difficulte (int): Le niveau de difficulté de la question.
+            identifiant (str, optional): L'identifiant de la question (par défaut, empreinte de
+                l'énoncé et des options).
 
         Raises:
             ValueError: Si les arguments ne sont pas valides.
@@ -39,16 +137,60 @@ class Question:
         self.options = options
         self.reponse_correcte = reponse_correcte
         self.difficulte = difficulte
-        logging.info(f"Question créée: {self.enonce} avec difficulté {self.difficulte}")
+        self.identifiant = identifiant if identifiant is not None else empreinte_question(enonce, options)
+        evenement(_journal, "question_creee", logging.DEBUG, question=self.identifiant, difficulte=difficulte)
 
-    @lru_cache(maxsize=32)
-    def poser(self, presentateur, joueur):
+    def rendu(self, locale="fr"):
+        """
+        Retourne le bloc affiché pour la question : énoncé et options numérotées.
+        Le texte est construit une fois par question et par locale (voir cache_rendus).
+
+        Args:
+            locale (str): La langue de l'interface.
+
+        Returns:
+            str: Le texte de la question.
+        """
+        return cache_rendus.obtenir((self.identifiant, locale, "texte"), self._construire_rendu)
+
+    def _construire_rendu(self):
+        lignes = [f"\n{self.enonce}"]
+        lignes.extend(f"{i}. {option}" for i, option in enumerate(self.options, 1))
+        return "\n".join(lignes)
+
+    def texte_vocal(self, locale="fr"):
+        """
+        Retourne le texte à lire par la synthèse vocale pour la question.
+
+        Args:
+            locale (str): La langue de l'interface ("fr" ou "en").
+
+        Returns:
+            str: Le texte à prononcer.
+
+        Raises:
+            ValueError: Si la locale n'est pas prise en charge.
+        """
+        if locale not in LIBELLES:
+            raise ValueError(f"Locale non prise en charge : {locale}.")
+        return cache_rendus.obtenir((self.identifiant, locale, "vocal"), lambda: self._construire_texte_vocal(locale))
+
+    def _construire_texte_vocal(self, locale):
+        libelles = LIBELLES[locale]
+        phrases = [f"{libelles['question']} : {self.enonce}"]
+        phrases.extend(f"{libelles['reponse']} {i} : {option}." for i, option in enumerate(self.options, 1))
+        return " ".join(phrases)
+
+    def poser(self, presentateur, joueur, locale="fr"):
         """
         Pose la question à un joueur et gère la réponse.
+        Seul le rendu de la question est mis en cache : la réponse est toujours demandée et évaluée.
 
         Args:
-            presentateur (Presentateur): Le présentateur du jeu.
+            presentateur (Presentateur): Le présentateur du jeu (ses messages et la question
+                passent par presentateur.sortie).
             joueur (Joueur): Le joueur à qui la question est posée.
+            locale (str): La langue de l'interface.
 
         Returns:
             bool: Vrai si le joueur a donné la bonne réponse, Faux sinon.
@@ -57,38 +199,38 @@ class Question:
             ValueError: Si la réponse de l'utilisateur est hors limites.
         """
         presentateur.annoncer_tour(joueur.nom)
-        print(f"\n{self.enonce}")
-        for i, option in enumerate(self.options, 1):
-            print(f"{i}. {option}")
+        presentateur.sortie(self.rendu(locale))
+        vider_sortie(presentateur.sortie)
 
-        debut = time.time()
+        debut = saisie.horloge()
         try:
-            reponse = int(input("\nVotre réponse (numéro) : ").strip())
+            entree = saisie.lecteur.lire("\nVotre réponse (numéro) : ", debut + saisie.temps_limite(self.difficulte))
+            temps = saisie.horloge() - debut
+            if entree is None:
+                evenement(_journal, "temps_ecoule", joueur=joueur.nom, question=self.identifiant, latence=temps)
+                presentateur.sortie(f"\nTemps écoulé : {temps:.1f} secondes")
+                presentateur.annoncer_resultat(False)
+                return False
+            reponse = int(entree.strip())
             if reponse < 1 or reponse > len(self.options):
                 raise ValueError("Réponse hors limites")
-            temps = time.time() - debut
         except ValueError:
-            logging.error("Réponse hors limites ou erreur de saisie")
+            evenement(_journal, "reponse_invalide", logging.WARNING, joueur=joueur.nom, question=self.identifiant)
             presentateur.annoncer_resultat(False)
             return False
         except Exception as e:
-            logging.error(f"Erreur inattendue : {e}")
-            presentateur.annoncer_resultat(False)
-            return False
-
-        temps_limite = 5 + 2 * (self.difficulte - 1)
-        if temps > temps_limite:
-            logging.info(f"Temps écoulé : {temps:.1f} secondes")
-            print(f"\nTemps écoulé : {temps:.1f} secondes")
+            evenement(_journal, "erreur_saisie", logging.ERROR, joueur=joueur.nom, question=self.identifiant, erreur=repr(e))
             presentateur.annoncer_resultat(False)
             return False
 
         if reponse == self.reponse_correcte:
             joueur.score += self.difficulte
-            logging.info(f"Bonne réponse de {joueur.nom}, score actuel : {joueur.score}")
+            evenement(_journal, "reponse", joueur=joueur.nom, question=self.identifiant, correcte=True,
+                      latence=temps, score=joueur.score)
             presentateur.annoncer_resultat(True)
             return True
         else:
-            logging.info(f"Mauvaise réponse de {joueur.nom}, la bonne réponse était : {self.options[self.reponse_correcte - 1]}")
+            evenement(_journal, "reponse", joueur=joueur.nom, question=self.identifiant, correcte=False,
+                      latence=temps, score=joueur.score)
             presentateur.annoncer_resultat(False, self.options[self.reponse_correcte - 1])
             return False
\ No newline at end of file
@@ -1,25 +1,31 @@
-import sqlite3
-import pyttsx3
-import random
+from flux_questions import FluxQuestions
+from synthese_vocale import TravailleurVocal
+
+_voix = None
+
+def get_voice():
+    """Retourne le travailleur vocal partagé (un seul moteur pyttsx3 pour toute la session)."""
+    global _voix
+    if _voix is None:
+        _voix = TravailleurVocal()
+    return _voix
 
 def speak(text):
-    """Utilise pyttsx3 pour lire un texte à haute voix."""
-    engine = pyttsx3.init()
-    engine.say(text)
-    engine.runAndWait()
+    """Met un texte en file pour être lu à haute voix, sans attendre la fin de la lecture."""
+    get_voice().dire(text)
+
+_flux = {}
 
 def get_random_question(db_name, asked_questions):
-    """Récupère une question aléatoire qui n'a pas encore été posée."""
-    conn = sqlite3.connect(db_name)
-    cursor = conn.cursor()
-    cursor.execute('SELECT id, question, context FROM questions')
-    all_questions = cursor.fetchall()
-    conn.close()
-
-    remaining_questions = [q for q in all_questions if q[0] not in asked_questions]
-    if not remaining_questions:
-        return None
-    return random.choice(remaining_questions)
+    """Récupère une question aléatoire qui n'a pas encore été posée (flux et connexion conservés par base)."""
+    flux = _flux.get(db_name)
+    if flux is None:
+        flux = _flux[db_name] = FluxQuestions(db_name)
+    question = flux.suivante(asked_questions)
+    if question is None and len(asked_questions) < flux.nombre_questions():
+        flux.melanger()
+        question = flux.suivante(asked_questions)
+    return question
 
 def ask_question(question, context):
     """Pose une question et vérifie la réponse."""
@@ -30,19 +36,14 @@ def ask_question(question, context):
 
 def main():
     db_name = 'questions.db'
-    asked_questions = set()
-
-    while True:
-        question_data = get_random_question(db_name, asked_questions)
-        if not question_data:
-            print("Toutes les questions ont été posées.")
-            break
-
-        q_id, question, context = question_data
-        answer = ask_question(question, context)
-        asked_questions.add(q_id)
-        speak("Merci pour votre réponse.")
-        print("Merci pour votre réponse.")
+
+    with FluxQuestions(db_name) as flux:
+        for q_id, question, context in flux:
+            answer = ask_question(question, context)
+            speak("Merci pour votre réponse.")
+            print("Merci pour votre réponse.")
+    print("Toutes les questions ont été posées.")
+    get_voice().arreter()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,29 +1,84 @@
-import subprocess
+import os
 import sys
 
+# Un fichier du projet qui porte le nom d'un module de la bibliothèque standard (random.py...)
+# le remplace pour tout le processus, bibliothèque standard comprise : il est signalé avant
+# toute autre importation, qui pourrait le charger.
+MODULES_MASQUANTS = sorted(nom[:-3] for nom in os.listdir(os.path.dirname(os.path.abspath(__file__)))
+                           if nom.endswith(".py") and nom[:-3] in sys.stdlib_module_names)
+if MODULES_MASQUANTS:
+    print("Le jeu ne peut pas être lancé : "
+          f"{', '.join(nom + '.py' for nom in MODULES_MASQUANTS)} masque la bibliothèque standard, "
+          "renommez ou supprimez ce fichier.")
+    sys.exit(1)
+
+import argparse
+import runpy
+import time
+from concurrent.futures import ProcessPoolExecutor
+from check_and_install_modules import check_and_install_modules, REQUIRED_MODULES
+from controle_code import ControleCode
+
+def afficher_resultats_tests(controle, futurs):
+    """Attend les tests lancés en arrière-plan, enregistre leurs résultats et retourne les modules en échec."""
+    echecs = []
+    total = 0
+    for futur in futurs:
+        module, reussite, nb_tests, sortie = futur.result()
+        controle.enregistrer_resultat(module, reussite)
+        total += nb_tests
+        if not reussite:
+            echecs.append(module)
+            print(f"Erreurs dans les tests de {module} :\n{sortie}")
+    controle.sauvegarder()
+    if futurs and not echecs:
+        print(f"Tests unitaires exécutés avec succès ({total} tests, {len(futurs)} modules modifiés).")
+    return echecs
+
 def main():
-    # Vérification et installation des modules requis
-    try:
-        subprocess.check_call([sys.executable, "check_and_install_modules.py"])
-    except subprocess.CalledProcessError as e:
-        print(f"Erreur lors de l'installation des modules requis: {e}")
-        sys.exit(1)
+    parseur = argparse.ArgumentParser(description="Vérifie le projet, lance les tests et le jeu.")
+    parseur.add_argument("--attendre-tests", action="store_true",
+                         help="Attend la réussite des tests avant de lancer le jeu.")
+    arguments, reste = parseur.parse_known_args()
+    debut = time.perf_counter()
+    repertoire = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(repertoire)
 
-    # Exécution des tests unitaires
-    try:
-        subprocess.check_call([sys.executable, "-m", "unittest", "discover"])
-        print("Tests unitaires exécutés avec succès.")
-    except subprocess.CalledProcessError as e:
-        print(f"Erreur lors de l'exécution des tests unitaires: {e}")
-        sys.exit(1)
+    # Vérification et installation des modules requis (dans ce processus)
+    check_and_install_modules(REQUIRED_MODULES, verbeux=False)
 
-    # Lancement du jeu
-    try:
-        subprocess.check_call([sys.executable, "jeu.py"])
-        print("Jeu lancé avec succès.")
-    except subprocess.CalledProcessError as e:
-        print(f"Erreur lors du lancement du jeu: {e}")
+    # Vérification de la syntaxe : seuls les fichiers modifiés depuis la dernière vérification sont compilés
+    controle = ControleCode(repertoire)
+    erreurs = controle.verifier_syntaxe()
+    for module, erreur in sorted(erreurs.items()):
+        print(f"Erreurs de syntaxe trouvées dans {module}.py : {erreur}")
+    erreurs_jeu = controle.dependances("jeu") & set(erreurs)
+    if erreurs_jeu:
+        print(f"Le jeu ne peut pas être lancé : erreurs dans {', '.join(sorted(erreurs_jeu))}.")
         sys.exit(1)
 
+    # Tests unitaires des modules modifiés, dans un pool de processus, pendant que le jeu démarre
+    modules_tests = controle.tests_a_executer()
+    with ProcessPoolExecutor(max(1, min(controle.nb_processus, len(modules_tests)))) as executeur:
+        futurs = controle.lancer_tests(modules_tests, executeur)
+        print(f"Vérifications terminées en {(time.perf_counter() - debut) * 1000:.0f} ms "
+              f"({len(modules_tests)} modules de tests à exécuter).")
+        if arguments.attendre_tests and afficher_resultats_tests(controle, futurs):
+            sys.exit(1)
+
+        # Lancement du jeu
+        sys.argv = ["jeu.py", *reste]
+        try:
+            runpy.run_path("jeu.py", run_name="__main__")
+        except (KeyboardInterrupt, EOFError):
+            print("\n\nLe jeu a été interrompu. À bientôt !")
+        except SystemExit as e:
+            if e.code:
+                print(f"Erreur lors du lancement du jeu : {e}")
+                sys.exit(1)
+
+        if not arguments.attendre_tests and afficher_resultats_tests(controle, futurs):
+            sys.exit(1)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
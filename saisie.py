@@ -0,0 +1,159 @@
+import builtins
+import os
+import queue
+import selectors
+import stat
+import sys
+import threading
+import time
+
+try:
+    import termios
+except ImportError:  # Windows
+    termios = None
+
+horloge = time.perf_counter
+
+
+def temps_limite(difficulte):
+    """
+    Retourne le temps de réponse accordé pour une difficulté.
+
+    Args:
+        difficulte (int): La difficulté de la question (1-3).
+
+    Returns:
+        int: Le temps limite en secondes.
+    """
+    return 5 if difficulte == 1 else 7 if difficulte == 2 else 10
+
+
+class LecteurEntree:
+    """
+    Lecture d'une ligne avec échéance.
+
+    Quand l'entrée est un terminal ou un tube POSIX, son descripteur est surveillé
+    avec selectors et la lecture s'arrête exactement à l'échéance ; les octets sont
+    lus directement sur le descripteur, si bien qu'aucune ligne déjà reçue ne reste
+    cachée dans le tampon du flux : les lignes arrivées ensemble sont rendues une à
+    une. Sur un terminal, ce qui a été tapé avant l'invite (réponse arrivée après
+    l'échéance de la question précédente, frappe anticipée) est jeté.
+    Sinon (Windows, fichier, /dev/null, flux sans descripteur), une lecture est
+    confiée à un fil d'exécution et attendue jusqu'à l'échéance ; une ligne arrivée
+    après l'échéance d'une question n'est jamais comptée pour la question suivante.
+    """
+
+    def __init__(self, flux=None):
+        """
+        Args:
+            flux: Le flux d'entrée (sys.stdin par défaut, lu au moment de la lecture
+                avec input()).
+        """
+        self._flux = flux
+        self._lignes = queue.Queue()
+        self._lecture_en_cours = False
+        self._tampon = b""  # Octets lus sur le descripteur après la dernière ligne rendue
+
+    @property
+    def flux(self):
+        return self._flux or sys.stdin
+
+    def _descripteur(self):
+        # Seuls les terminaux et les tubes peuvent être surveillés : epoll refuse les fichiers.
+        if os.name != "posix":
+            return None
+        try:
+            descripteur = self.flux.fileno()
+            mode = os.fstat(descripteur).st_mode
+        except (AttributeError, OSError, ValueError):
+            return None
+        if os.isatty(descripteur) or stat.S_ISFIFO(mode):
+            return descripteur
+        return None
+
+    def lire(self, invite, echeance):
+        """
+        Lit une ligne avant l'échéance.
+
+        Args:
+            invite (str): Le message d'invite.
+            echeance (float): L'échéance, en secondes de l'horloge saisie.horloge.
+
+        Returns:
+            str: La ligne lue (sans fin de ligne), ou None si l'échéance est dépassée.
+
+        Raises:
+            EOFError: Si l'entrée est fermée.
+        """
+        descripteur = self._descripteur()
+        if descripteur is None:
+            return self._lire_par_fil(invite, echeance)
+        return self._lire_par_selecteur(invite, echeance, descripteur)
+
+    def _ligne_du_tampon(self, fin=False):
+        position = self._tampon.find(b"\n")
+        if position < 0:
+            if not fin or not self._tampon:
+                return None
+            position = len(self._tampon)
+        ligne, self._tampon = self._tampon[:position], self._tampon[position + 1:]
+        return ligne.decode(getattr(self.flux, "encoding", None) or "utf-8", errors="replace")
+
+    def _lire_par_selecteur(self, invite, echeance, descripteur):
+        if termios is not None and os.isatty(descripteur):
+            termios.tcflush(descripteur, termios.TCIFLUSH)
+            self._tampon = b""
+        print(invite, end="", flush=True)
+        ligne = self._ligne_du_tampon()
+        if ligne is not None:
+            return ligne
+        with selectors.DefaultSelector() as selecteur:
+            selecteur.register(descripteur, selectors.EVENT_READ)
+            while True:
+                restant = echeance - horloge()
+                if restant <= 0 or not selecteur.select(restant):
+                    print()
+                    return None
+                octets = os.read(descripteur, 4096)
+                self._tampon += octets
+                ligne = self._ligne_du_tampon(fin=not octets)
+                if ligne is not None:
+                    return ligne
+                if not octets:
+                    raise EOFError
+
+    def _lire_une_ligne(self, invite):
+        try:
+            if self._flux is None:
+                ligne = builtins.input(invite)
+            else:
+                print(invite, end="", flush=True)
+                ligne = self._flux.readline()
+                ligne = ligne.rstrip("\n") if ligne else None
+        except EOFError:
+            ligne = None
+        self._lignes.put((horloge(), ligne))
+
+    def _lire_par_fil(self, invite, echeance):
+        debut = horloge()
+        while True:
+            if not self._lecture_en_cours:
+                self._lecture_en_cours = True
+                threading.Thread(target=self._lire_une_ligne, args=(invite,), daemon=True).start()
+            restant = echeance - horloge()
+            if restant <= 0:
+                print()
+                return None
+            try:
+                instant, ligne = self._lignes.get(timeout=restant)
+            except queue.Empty:
+                print()
+                return None
+            self._lecture_en_cours = False
+            if ligne is None:
+                raise EOFError
+            if instant >= debut:
+                return ligne
+
+
+lecteur = LecteurEntree()
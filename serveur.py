@@ -0,0 +1,249 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from jeu import Jeu, Joueur, Recompense, SourceListe, QUESTIONS_INTEGREES
+from classement import TableauDesScores
+from journal_scores import JournalScores
+from qbank import BanqueMmap
+from saisie import temps_limite
+from sorties import SortieTamponnee
+from statistiques_reponses import AnalyseReponses
+
+NB_TOURS = 5
+MAX_SESSIONS = 10000
+DELAI_CONNEXION = 30
+FILE_CONNEXIONS = 4096
+
+
+def encoder(message):
+    """
+    Encode un message du protocole (un objet JSON par ligne).
+
+    Args:
+        message (dict): Le message à envoyer.
+
+    Returns:
+        bytes: La ligne encodée.
+    """
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode()
+
+
+def decoder_message(ligne):
+    """
+    Décode la réponse d'un client : {"reponse": n, "numero": q}, {"reponse": n} ou simplement n.
+
+    Args:
+        ligne (bytes): La ligne reçue.
+
+    Returns:
+        tuple: (numéro de la question à laquelle le client répond, ou None s'il ne l'indique pas ;
+            numéro de l'option choisie, ou None si la ligne est invalide).
+    """
+    try:
+        message = json.loads(ligne)
+    except ValueError:
+        return None, None
+    numero = None
+    if isinstance(message, dict):
+        numero = message.get("numero")
+        message = message.get("reponse")
+    return numero if isinstance(numero, int) else None, message if isinstance(message, int) else None
+
+
+def decoder_reponse(ligne):
+    """
+    Décode la réponse d'un client, sans son numéro de question (voir decoder_message).
+
+    Returns:
+        int: Le numéro de l'option choisie, ou None si la ligne est invalide.
+    """
+    return decoder_message(ligne)[1]
+
+
+class SessionJeu:
+    """
+    Partie d'un client connecté : un Jeu dont tous les messages du présentateur
+    et de la voix off sont dirigés vers ce client.
+
+    Protocole (JSON, une ligne par message) :
+        client -> serveur : {"nom": "Alice"} puis {"reponse": 2, "numero": 1} pour chaque question
+        serveur -> client : {"type": "message", "texte": ...},
+                            {"type": "question", "numero": 1, "texte": ..., "options": [...], "delai": 5},
+                            {"type": "fin", "score": 12, "rang": 3}, {"type": "erreur", "texte": ...}
+
+    Une réponse arrivée après le délai d'une question reste dans le flux : grâce au numéro
+    de question, elle est ignorée au lieu de compter comme réponse à la question suivante.
+    """
+
+    def __init__(self, lecteur, ecrivain, source, nb_tours=NB_TOURS, scores=None, tableau=None, analyse=None,
+                 ecritures=None):
+        self.lecteur = lecteur
+        self.ecrivain = ecrivain
+        self.nb_tours = nb_tours
+        # Exécuteur des écritures de scores (celui de la boucle d'événements par défaut).
+        self.ecritures = ecritures
+        # Les messages d'un tour sont regroupés en un seul message texte, envoyé avant la question.
+        self.jeu = Jeu(source, sortie=SortieTamponnee(self.envoyer_texte), scores=scores, tableau=tableau,
+                       analyse=analyse)
+
+    def envoyer(self, message):
+        self.ecrivain.write(encoder(message))
+
+    def envoyer_texte(self, texte):
+        self.envoyer({"type": "message", "texte": texte})
+
+    async def _lire_reponse(self, delai, numero):
+        echeance = time.perf_counter() + delai
+        while True:
+            try:
+                ligne = await asyncio.wait_for(self.lecteur.readline(), max(0.0, echeance - time.perf_counter()))
+            except asyncio.TimeoutError:
+                return None
+            if not ligne:
+                raise ConnectionResetError("Client déconnecté.")
+            numero_recu, reponse = decoder_message(ligne)
+            if numero_recu is None or numero_recu == numero:
+                return reponse
+            # Réponse tardive à une question précédente : ignorée.
+
+    def _enregistrer(self, joueur):
+        # Exécuté hors de la boucle d'événements : l'écriture SQLite bloquerait tous les clients.
+        self.jeu._sauvegarder_scores([joueur])
+        return self.jeu.tableau.general.rang(joueur.nom)
+
+    async def jouer(self):
+        """
+        Déroule la partie : présentation, tours de questions, score final.
+        """
+        bonjour = json.loads(await asyncio.wait_for(self.lecteur.readline(), DELAI_CONNEXION) or b"{}")
+        if not isinstance(bonjour, dict):
+            raise ValueError("Message de bienvenue invalide : un objet JSON est attendu.")
+        joueur = Joueur(bonjour.get("nom") or "Joueur")
+        presentateur = self.jeu.presentateur
+        presentateur.annoncer_phase("Début du jeu")
+        for numero in range(1, self.nb_tours + 1):
+            question = self.jeu.tirer_question(joueur)
+            presentateur.annoncer_tour(joueur.nom)
+            delai = temps_limite(question.difficulte)
+            self.jeu.sortie.vider()
+            self.envoyer({"type": "question", "numero": numero, "texte": question.rendu(), "options": question.options,
+                          "delai": delai})
+            await self.ecrivain.drain()
+            debut = time.perf_counter()
+            reponse = await self._lire_reponse(delai, numero)
+            latence = time.perf_counter() - debut
+            if reponse is not None and not 1 <= reponse <= len(question.options):
+                reponse = 0
+            reussite = question.evaluer(reponse, presentateur, joueur)
+            if self.jeu.analyse is not None:
+                self.jeu.analyse.enregistrer(question, reussite, latence, reponse is None)
+            Recompense.verifier_badges(joueur, self.jeu.sortie)
+        presentateur.annoncer_phase("Fin du jeu")
+        rang = await asyncio.get_running_loop().run_in_executor(self.ecritures, self._enregistrer, joueur)
+        self.jeu.sortie.vider()
+        self.envoyer({"type": "fin", "score": joueur.score, "rang": rang})
+        await self.ecrivain.drain()
+        return joueur
+
+
+class ServeurJeu:
+    """
+    Serveur asyncio hébergeant de nombreuses parties simultanées dans un seul processus.
+    La source de questions est partagée ; chaque connexion a sa propre SessionJeu.
+    """
+
+    def __init__(self, source=None, nb_tours=NB_TOURS, max_sessions=MAX_SESSIONS, scores=None, analyse=None):
+        """
+        Args:
+            source (SourceQuestions): La source de questions (questions intégrées par défaut).
+            nb_tours (int): Le nombre de questions par partie.
+            max_sessions (int): Le nombre maximal de parties simultanées.
+            scores (JournalScores): Le journal des scores partagé par toutes les parties (scores.db par défaut).
+            analyse (AnalyseReponses, optional): Les statistiques des réponses, partagées par toutes les parties.
+        """
+        self.source = source or SourceListe(QUESTIONS_INTEGREES)
+        self.scores = scores if scores is not None else JournalScores()
+        self.tableau = None
+        # Un seul fil d'écriture : le journal et les classements ne sont jamais modifiés en parallèle.
+        self.ecritures = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scores")
+        self.analyse = analyse
+        self.nb_tours = nb_tours
+        self.max_sessions = max_sessions
+        self.sessions = 0
+        self.parties_terminees = 0
+        self.serveur = None
+
+    async def _gerer_client(self, lecteur, ecrivain):
+        if self.sessions >= self.max_sessions:
+            ecrivain.write(encoder({"type": "erreur", "texte": "Serveur complet, réessayez plus tard."}))
+            await ecrivain.drain()
+            ecrivain.close()
+            return
+        self.sessions += 1
+        try:
+            await SessionJeu(lecteur, ecrivain, self.source, self.nb_tours, self.scores, self.tableau,
+                             self.analyse, self.ecritures).jouer()
+            self.parties_terminees += 1
+        except (ConnectionError, asyncio.TimeoutError, ValueError) as e:
+            logging.info("Session interrompue : %s", e)
+        finally:
+            self.sessions -= 1
+            ecrivain.close()
+
+    async def demarrer(self, hote="127.0.0.1", port=8765, chemin_unix=None):
+        """
+        Démarre l'écoute en TCP, ou sur une socket Unix si chemin_unix est fourni.
+
+        Returns:
+            asyncio.base_events.Server: Le serveur démarré.
+        """
+        self.tableau = TableauDesScores.depuis_journal(self.scores)
+        # Une file d'attente trop courte fait perdre des connexions simultanées
+        # (réémises par le client une seconde plus tard).
+        if chemin_unix:
+            self.serveur = await asyncio.start_unix_server(self._gerer_client, chemin_unix, backlog=FILE_CONNEXIONS)
+        else:
+            self.serveur = await asyncio.start_server(self._gerer_client, hote, port, backlog=FILE_CONNEXIONS)
+        return self.serveur
+
+    async def arreter(self):
+        if self.serveur:
+            self.serveur.close()
+            await self.serveur.wait_closed()
+        self.ecritures.shutdown()
+
+
+async def _principal(arguments):
+    source = BanqueMmap(arguments.banque) if arguments.banque else None
+    analyse = AnalyseReponses() if arguments.statistiques else None
+    serveur = ServeurJeu(source, nb_tours=arguments.tours, max_sessions=arguments.max_sessions, analyse=analyse)
+    instance = await serveur.demarrer(arguments.hote, arguments.port, arguments.unix)
+    print(f"Serveur de jeu à l'écoute sur {arguments.unix or f'{arguments.hote}:{arguments.port}'}.")
+    try:
+        async with instance:
+            await instance.serve_forever()
+    finally:
+        if analyse is not None:
+            # Les statistiques des exécutions précédentes (ou d'autres serveurs) sont fusionnées.
+            if os.path.exists(arguments.statistiques):
+                analyse.fusionner(AnalyseReponses.charger(arguments.statistiques))
+            analyse.sauvegarder(arguments.statistiques)
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Serveur de parties de quiz simultanées.")
+    parseur.add_argument("--hote", default="127.0.0.1")
+    parseur.add_argument("--port", type=int, default=8765)
+    parseur.add_argument("--unix", help="Chemin d'une socket Unix (remplace hôte et port).")
+    parseur.add_argument("--tours", type=int, default=NB_TOURS)
+    parseur.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    parseur.add_argument("--banque", help="Fichier .qbank (voir qbank.py) à la place des questions intégrées.")
+    parseur.add_argument("--statistiques", help="Fichier JSON où ajouter les statistiques des réponses à l'arrêt.")
+    try:
+        asyncio.run(_principal(parseur.parse_args()))
+    except KeyboardInterrupt:
+        print("\nServeur arrêté.")
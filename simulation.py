@@ -0,0 +1,364 @@
+import os
+import random
+import statistics
+import sys
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from jeu import Jeu, Joueur
+from saisie import temps_limite
+from sorties import SortieNulle
+
+
+sortie_nulle = SortieNulle()
+
+
+class Strategie(ABC):
+    """
+    Stratégie d'un joueur simulé.
+    Une stratégie choisit une réponse et le temps (simulé) mis à la donner.
+    """
+
+    nom = "Stratégie"
+
+    @abstractmethod
+    def repondre(self, question, joueur, rng):
+        """
+        Choisit la réponse du joueur simulé.
+
+        Args:
+            question (Question): La question posée.
+            joueur (Joueur): Le joueur simulé.
+            rng (random.Random): Le générateur aléatoire de la simulation.
+
+        Returns:
+            tuple: (numéro de l'option choisie, temps de réponse simulé en secondes).
+        """
+
+
+class ToujoursJuste(Strategie):
+    """
+    Répond toujours juste, instantanément.
+    """
+
+    nom = "Toujours juste"
+
+    def repondre(self, question, joueur, rng):
+        return question.reponse_correcte, 0.0
+
+
+class PrecisionParDifficulte(Strategie):
+    """
+    Répond juste avec une probabilité qui dépend de la difficulté de la question,
+    sinon choisit une mauvaise option au hasard (une question à une seule option
+    ne peut qu'être répondue juste).
+    """
+
+    def __init__(self, precisions, nom=None):
+        """
+        Args:
+            precisions (dict | float): Probabilité de bonne réponse par difficulté (1-3),
+                ou une probabilité unique pour toutes les difficultés.
+            nom (str, optional): Le nom de la stratégie dans les résultats.
+        """
+        if not isinstance(precisions, dict):
+            precisions = {d: precisions for d in (1, 2, 3)}
+        self.precisions = precisions
+        self.nom = nom or f"Précision {precisions}"
+
+    def repondre(self, question, joueur, rng):
+        if len(question.options) < 2 or rng.random() < self.precisions[question.difficulte]:
+            return question.reponse_correcte, 0.0
+        mauvaise = rng.randrange(1, len(question.options))
+        return (mauvaise if mauvaise < question.reponse_correcte else mauvaise + 1), 0.0
+
+
+class ReponseApres(Strategie):
+    """
+    Répond comme une autre stratégie, mais après un temps donné (simulé, sans attente réelle).
+    """
+
+    def __init__(self, temps, strategie=None, nom=None):
+        """
+        Args:
+            temps (float | callable): Le temps de réponse en secondes, ou une fonction
+                (question, rng) -> temps.
+            strategie (Strategie): La stratégie qui choisit la réponse (ToujoursJuste par défaut).
+            nom (str, optional): Le nom de la stratégie dans les résultats.
+        """
+        self.temps = temps
+        self.strategie = strategie or ToujoursJuste()
+        self.nom = nom or f"Réponse après {temps}s"
+
+    def repondre(self, question, joueur, rng):
+        reponse, _ = self.strategie.repondre(question, joueur, rng)
+        temps = self.temps(question, rng) if callable(self.temps) else self.temps
+        return reponse, temps
+
+
+class JeuSimule(Jeu):
+    """
+    Jeu dont les joueurs sont des stratégies : chaque question posée (tours, duel final,
+    Étoile Mystérieuse) est répondue par la stratégie du joueur, en temps simulé.
+    """
+
+    def __init__(self, source=None, rng=None, sortie=sortie_nulle, scores=None):
+        """
+        Args:
+            source (SourceQuestions): La source de questions (questions intégrées par défaut).
+            rng (random.Random): Le générateur aléatoire des tirages et des stratégies.
+            sortie (callable): La sortie des messages du jeu.
+            scores (JournalScores, optional): Le journal des scores (aucun par défaut).
+        """
+        self.rng = rng or random.Random()
+        super().__init__(source, sortie=sortie, rng=self.rng, scores=scores if scores is not None else {})
+        self.presentateur.voix_off = None
+        self.strategies = {}
+
+    def poser_question(self, question, joueur):
+        reponse, temps = self.strategies[joueur.nom].repondre(question, joueur, self.rng)
+        if temps > temps_limite(question.difficulte):
+            reponse = None
+        reussite = question.evaluer(reponse, self.presentateur, joueur)
+        if self.analyse is not None:
+            self.analyse.enregistrer(question, reussite, temps, reponse is None)
+        return reussite
+
+
+class TempsUniforme:
+    """
+    Temps de réponse tiré uniformément entre deux bornes, à utiliser avec ReponseApres
+    (contrairement à une fonction lambda, il peut être envoyé à un autre processus).
+    """
+
+    def __init__(self, minimum, maximum):
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def __call__(self, question, rng):
+        return rng.uniform(self.minimum, self.maximum)
+
+    def __repr__(self):
+        return f"{self.minimum}-{self.maximum}"
+
+
+class Simulateur:
+    """
+    Moteur de parties sans affichage ni saisie : les joueurs sont des stratégies,
+    les messages vont vers une sortie nulle et le temps est simulé.
+    Un seul JeuSimule est réutilisé pour toutes les parties, qui suivent les phases
+    d'une vraie partie (tours, duel final, Étoile Mystérieuse).
+    """
+
+    def __init__(self, source=None, nb_tours=5, graine=None, sortie=sortie_nulle):
+        """
+        Args:
+            source (SourceQuestions): La source de questions (questions intégrées par défaut).
+            nb_tours (int): Le nombre de tours par partie.
+            graine (int, optional): La graine du générateur aléatoire, pour des simulations reproductibles.
+            sortie (callable): La sortie des messages du jeu.
+        """
+        self.rng = random.Random(graine)
+        self.nb_tours = nb_tours
+        self.jeu = JeuSimule(source, self.rng, sortie)
+
+    def reinitialiser(self, graine):
+        """
+        Remet le simulateur dans l'état d'un simulateur neuf de même graine, sans reconstruire le jeu.
+
+        Args:
+            graine: La nouvelle graine du générateur aléatoire.
+        """
+        self.rng.seed(graine)
+        self.jeu.reinitialiser()
+
+    def jouer_partie(self, strategies):
+        """
+        Joue une partie complète.
+
+        Args:
+            strategies (list): Une stratégie par joueur.
+
+        Returns:
+            list: Les scores finaux, dans l'ordre des stratégies.
+        """
+        joueurs = [Joueur(f"Joueur {i + 1}") for i in range(len(strategies))]
+        self.jeu.strategies = {joueur.nom: strategie for joueur, strategie in zip(joueurs, strategies)}
+        self.jeu.nouvelle_partie()
+        self.jeu.jouer_phases(joueurs, self.nb_tours)
+        return [joueur.score for joueur in joueurs]
+
+    def simuler(self, nb_parties, strategies):
+        """
+        Joue nb_parties parties et agrège les scores.
+
+        Args:
+            nb_parties (int): Le nombre de parties.
+            strategies (list): Une stratégie par joueur.
+
+        Returns:
+            ResultatsSimulation: Les scores de chaque partie et leur résumé.
+        """
+        debut = time.perf_counter()
+        scores = [self.jouer_partie(strategies) for _ in range(nb_parties)]
+        return ResultatsSimulation([s.nom for s in strategies], scores, time.perf_counter() - debut)
+
+
+class ResultatsSimulation:
+    """
+    Scores d'une série de parties simulées.
+
+    Attributs:
+        noms (list): Le nom de la stratégie de chaque joueur.
+        scores (list): Pour chaque partie, la liste des scores des joueurs.
+        duree (float): La durée de la simulation en secondes.
+        debits (dict): Pour une simulation parallèle, parties par seconde de chaque processus.
+    """
+
+    def __init__(self, noms, scores, duree, debits=None):
+        self.noms = noms
+        self.scores = scores
+        self.duree = duree
+        self.debits = debits or {}
+
+    @property
+    def parties_par_seconde(self):
+        return len(self.scores) / self.duree if self.duree else 0.0
+
+    def resume(self):
+        """
+        Résume les scores de chaque joueur.
+
+        Returns:
+            list: Pour chaque joueur, un dictionnaire (nom, moyenne, ecart_type, min, max, victoires).
+        """
+        resume = []
+        for i, nom in enumerate(self.noms):
+            colonne = [partie[i] for partie in self.scores]
+            victoires = sum(1 for partie in self.scores if partie[i] == max(partie))
+            resume.append({
+                "nom": nom,
+                "moyenne": statistics.fmean(colonne) if colonne else 0.0,
+                "ecart_type": statistics.pstdev(colonne) if colonne else 0.0,
+                "min": min(colonne, default=0),
+                "max": max(colonne, default=0),
+                "victoires": victoires,
+            })
+        return resume
+
+
+TAILLE_LOT = 500
+
+# État de chaque processus de SimulateurParallele, initialisé une seule fois par processus.
+_processus = {}
+
+
+def _initialiser_processus(source, nb_tours, strategies):
+    _processus.update(simulateur=Simulateur(source, nb_tours), strategies=strategies)
+
+
+def _simuler_lot(numero, graine, nb_parties):
+    # Chaque lot a sa propre graine : le résultat ne dépend pas du processus qui l'exécute.
+    simulateur = _processus["simulateur"]
+    simulateur.reinitialiser(f"{graine}:{numero}")
+    debut = time.perf_counter()
+    scores = [simulateur.jouer_partie(_processus["strategies"]) for _ in range(nb_parties)]
+    return numero, scores, time.perf_counter() - debut, os.getpid()
+
+
+class LotSimulation:
+    """
+    Résultat d'un lot de parties simulées par un processus.
+
+    Attributs:
+        numero (int): Le numéro du lot.
+        scores (list): Pour chaque partie du lot, la liste des scores des joueurs.
+        duree (float): Le temps de calcul du lot en secondes.
+        processus (int): L'identifiant du processus qui l'a calculé.
+    """
+
+    def __init__(self, numero, scores, duree, processus):
+        self.numero = numero
+        self.scores = scores
+        self.duree = duree
+        self.processus = processus
+
+
+class SimulateurParallele:
+    """
+    Répartit des parties simulées indépendantes sur plusieurs processus (ProcessPoolExecutor).
+
+    La source de questions et les stratégies ne sont envoyées qu'une fois à chaque
+    processus, qui construit un seul Simulateur pour tous ses lots ; chaque lot de parties a sa propre graine dérivée de la graine de la
+    simulation, si bien que les résultats sont reproductibles quel que soit le
+    nombre de processus. Les stratégies doivent pouvoir être sérialisées (pickle) :
+    pas de fonction lambda dans ReponseApres, par exemple.
+    """
+
+    def __init__(self, source=None, nb_tours=5, graine=None, nb_processus=None, taille_lot=TAILLE_LOT):
+        """
+        Args:
+            source (SourceQuestions): La source de questions (questions intégrées par défaut).
+            nb_tours (int): Le nombre de tours par partie.
+            graine (int, optional): La graine de la simulation (tirée au hasard par défaut).
+            nb_processus (int, optional): Le nombre de processus (un par cœur par défaut).
+            taille_lot (int): Le nombre de parties par lot renvoyé au processus principal.
+        """
+        self.source = source
+        self.nb_tours = nb_tours
+        self.graine = graine if graine is not None else random.randrange(2 ** 32)
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+        self.taille_lot = taille_lot
+
+    def lots(self, nb_parties, strategies):
+        """
+        Joue nb_parties parties et renvoie les lots au fur et à mesure qu'ils sont terminés.
+
+        Args:
+            nb_parties (int): Le nombre de parties.
+            strategies (list): Une stratégie par joueur.
+
+        Yields:
+            LotSimulation: Chaque lot terminé, dans l'ordre de fin de calcul.
+        """
+        tailles = [min(self.taille_lot, nb_parties - debut) for debut in range(0, nb_parties, self.taille_lot)]
+        with ProcessPoolExecutor(self.nb_processus, initializer=_initialiser_processus,
+                                 initargs=(self.source, self.nb_tours, strategies)) as executeur:
+            taches = [executeur.submit(_simuler_lot, numero, self.graine, taille) for numero, taille in enumerate(tailles)]
+            for tache in as_completed(taches):
+                yield LotSimulation(*tache.result())
+
+    def simuler(self, nb_parties, strategies):
+        """
+        Joue nb_parties parties en parallèle et agrège les scores.
+
+        Returns:
+            ResultatsSimulation: Les scores (dans l'ordre des lots), leur résumé et le débit de chaque processus.
+        """
+        debut = time.perf_counter()
+        lots = sorted(self.lots(nb_parties, strategies), key=lambda lot: lot.numero)
+        duree = time.perf_counter() - debut
+        calcul, parties = {}, {}
+        for lot in lots:
+            calcul[lot.processus] = calcul.get(lot.processus, 0.0) + lot.duree
+            parties[lot.processus] = parties.get(lot.processus, 0) + len(lot.scores)
+        debits = {processus: parties[processus] / calcul[processus] if calcul[processus] else 0.0
+                  for processus in calcul}
+        return ResultatsSimulation([s.nom for s in strategies], [scores for lot in lots for scores in lot.scores],
+                                   duree, debits)
+
+
+if __name__ == "__main__":
+    # python simulation.py [--parallele] : les parties sont réparties sur tous les cœurs
+    simulateur = SimulateurParallele(graine=0) if "--parallele" in sys.argv else Simulateur(graine=0)
+    resultats = simulateur.simuler(10000, [
+        ToujoursJuste(),
+        PrecisionParDifficulte({1: 0.9, 2: 0.6, 3: 0.3}, nom="Joueur moyen"),
+        ReponseApres(TempsUniforme(2, 9), nom="Joueur lent"),
+    ])
+    for ligne in resultats.resume():
+        print(f"{ligne['nom']} : {ligne['moyenne']:.2f} points en moyenne "
+              f"(écart-type {ligne['ecart_type']:.2f}, {ligne['victoires']} victoires)")
+    print(f"{resultats.parties_par_seconde:.0f} parties/s")
+    for processus, debit in resultats.debits.items():
+        print(f"  processus {processus} : {debit:.0f} parties/s")
@@ -0,0 +1,115 @@
+import queue
+import sys
+from abc import ABC, abstractmethod
+
+
+class Sortie(ABC):
+    """
+    Destination des messages du jeu.
+
+    Une sortie s'appelle comme print avec un seul texte (sortie("...")), ce qui
+    permet de passer indifféremment une sortie ou une simple fonction partout où
+    le jeu attend une fonction de sortie. vider() termine un lot de messages :
+    le jeu l'appelle juste avant d'attendre une réponse et à la fin de chaque tour.
+    """
+
+    @abstractmethod
+    def __call__(self, texte):
+        """
+        Reçoit un message.
+
+        Args:
+            texte (str): Le message.
+        """
+
+    def vider(self):
+        """
+        Transmet les messages en attente.
+        """
+
+
+class SortieTerminal(Sortie):
+    """
+    Écrit chaque message immédiatement sur un flux texte (sys.stdout par défaut).
+    """
+
+    def __init__(self, flux=None):
+        """
+        Args:
+            flux (TextIO, optional): Le flux d'écriture (sys.stdout au moment de l'écriture par défaut).
+        """
+        self.flux = flux
+
+    def __call__(self, texte):
+        (self.flux or sys.stdout).write(f"{texte}\n")
+
+    def vider(self):
+        (self.flux or sys.stdout).flush()
+
+
+class SortieTamponnee(Sortie):
+    """
+    Accumule les messages et les transmet en un seul bloc à chaque vider().
+
+    Sur un terminal, une question complète (tour, énoncé, options) est ainsi
+    rendue par une seule écriture au lieu d'un print par ligne.
+    """
+
+    def __init__(self, destination=None):
+        """
+        Args:
+            destination (callable, optional): Fonction recevant chaque bloc de texte
+                (écriture sur sys.stdout par défaut).
+        """
+        self.destination = destination
+        self._tampon = []
+
+    def __call__(self, texte):
+        self._tampon.append(texte)
+
+    def vider(self):
+        if not self._tampon:
+            return
+        bloc = "\n".join(self._tampon)
+        self._tampon.clear()
+        if self.destination is None:
+            sys.stdout.write(bloc + "\n")
+            sys.stdout.flush()
+        else:
+            self.destination(bloc)
+
+
+class SortieFile(SortieTamponnee):
+    """
+    Sortie d'une session : chaque lot de messages est déposé en un bloc dans une file,
+    lue par un autre fil d'exécution ou une autre tâche.
+    """
+
+    def __init__(self, file=None):
+        """
+        Args:
+            file (queue.Queue | asyncio.Queue, optional): La file de destination (une nouvelle file par défaut).
+        """
+        self.file = file if file is not None else queue.SimpleQueue()
+        super().__init__(self.file.put_nowait)
+
+
+class SortieNulle(Sortie):
+    """
+    Ignore tous les messages (parties sans affichage).
+    """
+
+    def __call__(self, texte):
+        pass
+
+
+def vider_sortie(sortie):
+    """
+    Vide une sortie si elle en est une ; une simple fonction (print...) n'a rien à vider.
+
+    Args:
+        sortie (callable): La sortie ou la fonction de sortie.
+    """
+    vider = getattr(sortie, "vider", None)
+    if vider is not None:
+        vider()
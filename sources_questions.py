@@ -0,0 +1,344 @@
+import csv
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from itertools import islice
+
+DIFFICULTES = {"facile": 1, "moyen": 2, "difficile": 3}
+TAILLE_PAGE_DEFAUT = 256
+
+
+def convertir_difficulte(difficulte):
+    """
+    Convertit la difficulté de chaîne de caractères à un entier.
+
+    Args:
+        difficulte (str | int): La difficulté ("facile", "moyen", "difficile" ou 1-3).
+
+    Returns:
+        int: La difficulté entre 1 et 3 (1 par défaut).
+    """
+    if isinstance(difficulte, int):
+        return difficulte if 1 <= difficulte <= 3 else 1
+    return DIFFICULTES.get(difficulte, 1)
+
+
+class SourceQuestions(ABC):
+    """
+    Interface pour une source de questions lue en flux.
+
+    Une source produit des enregistrements bruts (dictionnaires au format de
+    jeu.py : question, options, correct_option, difficulty, theme, explication)
+    et les normalise à l'ingestion. La conversion de difficulté est faite une
+    seule fois par libellé distinct et par source, pas une fois par question.
+    Un thème ou une explication absents (ou NULL) deviennent des chaînes vides.
+
+    Les sources à accès direct (acces_direct) connaissent leur nombre de questions
+    (__len__), décodent une question par sa position (question) et fournissent les
+    colonnes de difficulté et de thème (colonnes) : le jeu les indexe une seule fois
+    en entier et ne construit que les questions tirées. Les autres sources (fichiers,
+    bases) sont lues par pages depuis le début, sans compter leurs questions.
+    """
+
+    acces_direct = False
+
+    def __init__(self, convertir=convertir_difficulte):
+        """
+        Args:
+            convertir (callable): Fonction de conversion d'un libellé de difficulté en entier.
+        """
+        self._convertir = convertir
+        self._difficultes = {}
+
+    @abstractmethod
+    def enregistrements(self):
+        """
+        Parcourt les enregistrements bruts de la source, sans les charger tous en mémoire.
+
+        Yields:
+            dict: Un enregistrement brut.
+        """
+        pass
+
+    def _difficulte(self, libelle):
+        try:
+            return self._difficultes[libelle]
+        except KeyError:
+            difficulte = self._difficultes[libelle] = self._convertir(libelle)
+            return difficulte
+
+    def _enregistrements_depuis(self, position):
+        """
+        Parcourt les enregistrements bruts à partir du position-ième. Les sources qui
+        savent sauter des enregistrements sans les décoder redéfinissent cette méthode.
+        """
+        return islice(self.enregistrements(), position, None)
+
+    def depuis(self, position):
+        """
+        Parcourt les questions normalisées de la source à partir de la position-ième.
+
+        Args:
+            position (int): La position de la première question (0 pour toutes).
+
+        Yields:
+            tuple: (enonce, options, reponse_correcte, difficulte, theme, explication).
+        """
+        for e in self._enregistrements_depuis(position):
+            yield self._normaliser(e)
+
+    def _normaliser(self, e):
+        return (e["question"], e["options"], int(e["correct_option"]), self._difficulte(e["difficulty"]),
+                e.get("theme") or "", e.get("explication") or "")
+
+    def question(self, indice):
+        """
+        Décode la question d'une position (sources à accès direct seulement).
+
+        Returns:
+            tuple: (enonce, options, reponse_correcte, difficulte, theme, explication).
+        """
+        raise TypeError(f"{type(self).__name__} n'est pas une source à accès direct.")
+
+    def colonnes(self):
+        """
+        Retourne la difficulté et le thème de chaque question (sources à accès direct seulement).
+        Les sources qui les gardent en colonnes les fournissent sans décoder les questions.
+
+        Returns:
+            tuple: (difficultés, thèmes), dans l'ordre des questions.
+        """
+        questions = [self.question(indice) for indice in range(len(self))]
+        return [question[3] for question in questions], [question[4] for question in questions]
+
+    def question_construite(self, indice, fabrique):
+        """
+        Construit la question d'une position (sources à accès direct seulement).
+
+        Args:
+            indice (int): La position de la question.
+            fabrique (callable): Construit une question à partir d'un enregistrement normalisé.
+        """
+        return fabrique(*self.question(indice))
+
+    def questions_depuis(self, position, fabrique):
+        """
+        Parcourt les questions de la source à partir de la position-ième, construites par fabrique.
+        Les sources qui gardent leurs questions sous une forme que le jeu peut poser
+        directement redéfinissent cette méthode (voir banque_compacte.BanqueCompacte).
+
+        Args:
+            position (int): La position de la première question (0 pour toutes).
+            fabrique (callable): Construit une question à partir d'un enregistrement normalisé.
+
+        Yields:
+            Les questions construites.
+        """
+        for question in self.depuis(position):
+            yield fabrique(*question)
+
+    def __iter__(self):
+        """
+        Parcourt les questions normalisées de la source.
+
+        Yields:
+            tuple: (enonce, options, reponse_correcte, difficulte, theme, explication).
+        """
+        return self.depuis(0)
+
+
+class SourceListe(SourceQuestions):
+    """
+    Source de questions en mémoire (liste de dictionnaires).
+    """
+
+    acces_direct = True
+
+    def __init__(self, questions, convertir=convertir_difficulte):
+        super().__init__(convertir)
+        self.questions = questions
+
+    def __len__(self):
+        return len(self.questions)
+
+    def enregistrements(self):
+        return iter(self.questions)
+
+    def question(self, indice):
+        return self._normaliser(self.questions[indice])
+
+    def colonnes(self):
+        return ([self._difficulte(e["difficulty"]) for e in self.questions],
+                [e.get("theme") or "" for e in self.questions])
+
+
+class SourceJSONL(SourceQuestions):
+    """
+    Source de questions au format JSON Lines (un objet JSON par ligne).
+    """
+
+    def __init__(self, chemin, convertir=convertir_difficulte):
+        super().__init__(convertir)
+        self.chemin = chemin
+
+    def enregistrements(self):
+        return self._enregistrements_depuis(0)
+
+    def _enregistrements_depuis(self, position):
+        # Les lignes sautées ne sont pas décodées.
+        with open(self.chemin, "r", encoding="utf-8") as f:
+            for ligne in f:
+                if ligne.strip():
+                    if position:
+                        position -= 1
+                        continue
+                    yield json.loads(ligne)
+
+
+class SourceCSV(SourceQuestions):
+    """
+    Source de questions au format CSV avec en-tête.
+    La colonne options, si elle est présente, contient les options séparées par separateur_options.
+    """
+
+    def __init__(self, chemin, separateur_options="|", convertir=convertir_difficulte):
+        super().__init__(convertir)
+        self.chemin = chemin
+        self.separateur_options = separateur_options
+
+    def enregistrements(self):
+        with open(self.chemin, "r", encoding="utf-8", newline="") as f:
+            for ligne in csv.DictReader(f):
+                if ligne.get("options"):
+                    ligne["options"] = ligne["options"].split(self.separateur_options)
+                yield ligne
+
+
+class SourceSQLite(SourceQuestions):
+    """
+    Source de questions lue depuis la table questions de questions.db
+    (voir create_questions_db.py). Seules les lignes ayant des options sont utilisées.
+    """
+
+    COLONNES = ("question", "options", "correct_option", "difficulty", "theme", "explication")
+
+    def __init__(self, chemin, convertir=convertir_difficulte):
+        super().__init__(convertir)
+        self.chemin = chemin
+
+    def enregistrements(self):
+        return self._enregistrements_depuis(0)
+
+    def _enregistrements_depuis(self, position):
+        conn = sqlite3.connect(self.chemin)
+        try:
+            colonnes = {ligne[1] for ligne in conn.execute("PRAGMA table_info(questions)")}
+            manquantes = [c for c in self.COLONNES if c not in colonnes]
+            if manquantes:
+                raise ValueError(f"La table questions de {self.chemin} n'a pas les colonnes : {', '.join(manquantes)} "
+                                 "(create_questions_db.create_database les ajoute).")
+            curseur = conn.execute(f"SELECT {', '.join(self.COLONNES)} FROM questions "
+                                   "WHERE options IS NOT NULL ORDER BY id LIMIT -1 OFFSET ?", (position,))
+            for ligne in curseur:
+                enregistrement = dict(zip(self.COLONNES, ligne))
+                enregistrement["options"] = json.loads(enregistrement["options"])
+                yield enregistrement
+        finally:
+            conn.close()
+
+
+class QuestionsADemande:
+    """
+    Questions d'une source à accès direct, vues comme une séquence : une question
+    n'est décodée et construite que lorsqu'elle est demandée.
+    """
+
+    def __init__(self, source, fabrique):
+        """
+        Args:
+            source (SourceQuestions): La source à accès direct.
+            fabrique (callable): Construit une question à partir d'un enregistrement normalisé.
+        """
+        self.source = source
+        self.fabrique = fabrique
+
+    def __len__(self):
+        return len(self.source)
+
+    def __getitem__(self, indice):
+        return self.source.question_construite(indice, self.fabrique)
+
+
+class PaginateurQuestions:
+    """
+    Découpe une source de questions en pages construites à la demande.
+    Au plus une page de questions est matérialisée à la fois ; la source est
+    reparcourue depuis le début quand elle est épuisée. Après chaque page, debut
+    est la position dans la source de sa première question.
+    """
+
+    def __init__(self, source, fabrique, taille_page=TAILLE_PAGE_DEFAUT, depart=0):
+        """
+        Args:
+            source (SourceQuestions): La source de questions.
+            fabrique (callable): Construit une question à partir d'un enregistrement normalisé.
+            taille_page (int): Le nombre maximal de questions par page.
+            depart (int): La position de la première question lue ; la lecture reprend
+                ensuite au début de la source quand elle est épuisée.
+
+        Raises:
+            ValueError: Si la taille de page n'est pas un entier positif.
+        """
+        if not isinstance(taille_page, int) or taille_page < 1:
+            raise ValueError("La taille de page doit être un entier positif.")
+        self.source = source
+        self.fabrique = fabrique
+        self.taille_page = taille_page
+        self.debut = None
+        self._flux = None
+        self._position = 0
+        self._depart = depart
+
+    def reprendre(self, depart=0):
+        """
+        Reprend la lecture à une position de la source, comme un paginateur neuf.
+
+        Args:
+            depart (int): La position de la première question lue.
+        """
+        self.debut = None
+        self._flux = None
+        self._position = 0
+        self._depart = depart
+
+    def page_suivante(self):
+        """
+        Construit la page suivante de questions.
+
+        Returns:
+            list: Au plus taille_page questions.
+
+        Raises:
+            ValueError: Si la source est vide.
+        """
+        page = []
+        relance = False
+        while len(page) < self.taille_page:
+            if self._flux is None:
+                self._position, self._depart = self._depart, 0
+                self._flux = self.source.questions_depuis(self._position, self.fabrique)
+            try:
+                question = next(self._flux)
+            except StopIteration:
+                self._flux = None
+                if page or relance:
+                    break
+                relance = True
+                continue
+            if not page:
+                self.debut = self._position
+            self._position += 1
+            page.append(question)
+        if not page:
+            raise ValueError("La source de questions est vide.")
+        return page
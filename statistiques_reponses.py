@@ -0,0 +1,362 @@
+import json
+import math
+
+COMPRESSION = 100
+
+
+class Moments:
+    """
+    Moyenne et variance calculées en ligne (algorithme de Welford), en mémoire constante.
+    Deux instances calculées séparément se fusionnent exactement (formule de Chan).
+    """
+
+    __slots__ = ("nombre", "moyenne", "m2")
+
+    def __init__(self, nombre=0, moyenne=0.0, m2=0.0):
+        self.nombre = nombre
+        self.moyenne = moyenne
+        self.m2 = m2
+
+    def ajouter(self, valeur):
+        """
+        Ajoute une observation.
+        """
+        self.nombre += 1
+        ecart = valeur - self.moyenne
+        self.moyenne += ecart / self.nombre
+        self.m2 += ecart * (valeur - self.moyenne)
+
+    def fusionner(self, autre):
+        """
+        Ajoute les observations d'une autre instance.
+
+        Args:
+            autre (Moments): Les moments à fusionner.
+        """
+        if not autre.nombre:
+            return
+        total = self.nombre + autre.nombre
+        ecart = autre.moyenne - self.moyenne
+        self.m2 += autre.m2 + ecart * ecart * self.nombre * autre.nombre / total
+        self.moyenne += ecart * autre.nombre / total
+        self.nombre = total
+
+    @property
+    def variance(self):
+        """
+        Variance de l'échantillon (0 s'il y a moins de deux observations).
+        """
+        return self.m2 / (self.nombre - 1) if self.nombre > 1 else 0.0
+
+    @property
+    def ecart_type(self):
+        return math.sqrt(self.variance)
+
+
+class DigestQuantiles:
+    """
+    Esquisse des quantiles d'un flux de valeurs, dans l'esprit du t-digest (variante par fusion).
+
+    Les valeurs sont regroupées en centroïdes (moyenne, poids) d'autant plus petits qu'ils
+    sont proches des extrémités de la distribution : les quantiles extrêmes (p95, p99)
+    restent précis. Le nombre de centroïdes est borné par la compression, quelle que soit
+    la longueur du flux. Les nouvelles valeurs sont gardées dans un tampon et fusionnées
+    par lots ; deux esquisses se fusionnent de la même façon.
+    """
+
+    __slots__ = ("compression", "moyennes", "poids", "tampon", "minimum", "maximum")
+
+    def __init__(self, compression=COMPRESSION):
+        """
+        Args:
+            compression (int): Plus elle est grande, plus l'esquisse est précise et occupe de mémoire.
+        """
+        self.compression = compression
+        self.moyennes = []
+        self.poids = []
+        self.tampon = []
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def __len__(self):
+        return int(sum(self.poids)) + len(self.tampon)
+
+    def ajouter(self, valeur):
+        """
+        Ajoute une valeur.
+        """
+        self.tampon.append(valeur)
+        if valeur < self.minimum:
+            self.minimum = valeur
+        if valeur > self.maximum:
+            self.maximum = valeur
+        if len(self.tampon) >= 2 * self.compression:
+            self._compresser()
+
+    def _limite(self, q):
+        # Échelle k(q) = compression / (2π) · asin(2q - 1) : un centroïde commençant au quantile q
+        # s'étend jusqu'à k⁻¹(k(q) + 1), soit peu de valeurs aux extrémités et beaucoup au centre.
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        return (math.sin(min(k * 2 * math.pi / self.compression, math.pi / 2)) + 1) / 2
+
+    def _compresser(self, autres=()):
+        points = sorted([*zip(self.moyennes, self.poids), *((valeur, 1) for valeur in self.tampon), *autres])
+        self.tampon = []
+        if not points:
+            return
+        total = sum(poids for _, poids in points)
+        moyennes, poids_centroides = [], []
+        moyenne, poids = points[0]
+        cumul = 0
+        limite = self._limite(0.0)
+        for valeur, poids_valeur in points[1:]:
+            fusion = poids + poids_valeur
+            if (cumul + fusion) / total <= limite:
+                moyenne += (valeur - moyenne) * poids_valeur / fusion
+                poids = fusion
+            else:
+                moyennes.append(moyenne)
+                poids_centroides.append(poids)
+                cumul += poids
+                limite = self._limite(cumul / total)
+                moyenne, poids = valeur, poids_valeur
+        moyennes.append(moyenne)
+        poids_centroides.append(poids)
+        self.moyennes = moyennes
+        self.poids = poids_centroides
+
+    def fusionner(self, autre):
+        """
+        Ajoute les valeurs résumées par une autre esquisse.
+
+        Args:
+            autre (DigestQuantiles): L'esquisse à fusionner.
+        """
+        self.minimum = min(self.minimum, autre.minimum)
+        self.maximum = max(self.maximum, autre.maximum)
+        self._compresser([*zip(autre.moyennes, autre.poids), *((valeur, 1) for valeur in autre.tampon)])
+
+    def quantile(self, q):
+        """
+        Estime un quantile par interpolation entre les centres des centroïdes.
+
+        Args:
+            q (float): Le quantile (0 à 1), par exemple 0.95.
+
+        Returns:
+            float: La valeur estimée, ou None si aucune valeur n'a été ajoutée.
+
+        Raises:
+            ValueError: Si q n'est pas entre 0 et 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Le quantile doit être compris entre 0 et 1.")
+        if self.tampon:
+            self._compresser()
+        if not self.poids:
+            return None
+        total = sum(self.poids)
+        cible = q * total
+        precedent_position, precedente_valeur = 0, self.minimum
+        cumul = 0
+        for moyenne, poids in zip(self.moyennes, self.poids):
+            position = cumul + poids / 2
+            if cible <= position:
+                if position == precedent_position:
+                    return moyenne
+                fraction = (cible - precedent_position) / (position - precedent_position)
+                return precedente_valeur + fraction * (moyenne - precedente_valeur)
+            precedent_position, precedente_valeur = position, moyenne
+            cumul += poids
+        if total == precedent_position:
+            return self.maximum
+        fraction = (cible - precedent_position) / (total - precedent_position)
+        return precedente_valeur + fraction * (self.maximum - precedente_valeur)
+
+
+class StatistiquesReponses:
+    """
+    Statistiques en ligne des réponses à une question (ou à un groupe de questions) :
+    nombre de questions posées, de bonnes réponses et de temps écoulés, moments et
+    quantiles du temps de réponse. La mémoire ne dépend pas du nombre de réponses.
+    """
+
+    __slots__ = ("posees", "correctes", "expirees", "latences", "digest")
+
+    def __init__(self, compression=COMPRESSION):
+        self.posees = 0
+        self.correctes = 0
+        self.expirees = 0
+        self.latences = Moments()
+        self.digest = DigestQuantiles(compression)
+
+    def ajouter(self, correcte, latence, expiree=False):
+        """
+        Ajoute une réponse.
+
+        Args:
+            correcte (bool): Vrai si la réponse est correcte.
+            latence (float): Le temps de réponse en secondes.
+            expiree (bool): Vrai si le temps est écoulé sans réponse (la latence n'est alors pas comptée).
+        """
+        self.posees += 1
+        if correcte:
+            self.correctes += 1
+        if expiree:
+            self.expirees += 1
+        else:
+            self.latences.ajouter(latence)
+            self.digest.ajouter(latence)
+
+    def fusionner(self, autre):
+        """
+        Ajoute les réponses comptées par une autre instance (par exemple, d'un autre processus).
+        """
+        self.posees += autre.posees
+        self.correctes += autre.correctes
+        self.expirees += autre.expirees
+        self.latences.fusionner(autre.latences)
+        self.digest.fusionner(autre.digest)
+
+    @property
+    def precision(self):
+        return self.correctes / self.posees if self.posees else 0.0
+
+    def resume(self):
+        """
+        Returns:
+            dict: posees, precision, expirees, latence_moyenne, latence_ecart_type, latence_p50, latence_p95.
+        """
+        return {
+            "posees": self.posees,
+            "precision": self.precision,
+            "expirees": self.expirees,
+            "latence_moyenne": self.latences.moyenne if self.latences.nombre else None,
+            "latence_ecart_type": self.latences.ecart_type,
+            "latence_p50": self.digest.quantile(0.5),
+            "latence_p95": self.digest.quantile(0.95),
+        }
+
+    def etat(self):
+        """
+        Retourne un état sérialisable en JSON, relu par depuis_etat.
+        """
+        if self.digest.tampon:
+            self.digest._compresser()
+        return {
+            "posees": self.posees, "correctes": self.correctes, "expirees": self.expirees,
+            "moments": [self.latences.nombre, self.latences.moyenne, self.latences.m2],
+            "compression": self.digest.compression,
+            "centroides": [self.digest.moyennes, self.digest.poids],
+            "bornes": [self.digest.minimum, self.digest.maximum] if self.digest.poids else None,
+        }
+
+    @classmethod
+    def depuis_etat(cls, etat):
+        statistiques = cls(etat["compression"])
+        statistiques.posees = etat["posees"]
+        statistiques.correctes = etat["correctes"]
+        statistiques.expirees = etat["expirees"]
+        statistiques.latences = Moments(*etat["moments"])
+        statistiques.digest.moyennes, statistiques.digest.poids = (list(colonne) for colonne in etat["centroides"])
+        if etat["bornes"]:
+            statistiques.digest.minimum, statistiques.digest.maximum = etat["bornes"]
+        return statistiques
+
+
+class AnalyseReponses:
+    """
+    Étape d'analyse alimentée par les réponses des joueurs : statistiques par question
+    (indexées par énoncé), par thème et par difficulté, de quoi recalibrer les difficultés
+    des questions et les temps limites (saisie.temps_limite) sur le trafic réel.
+
+    Chaque processus (serveur, simulateurs) tient sa propre analyse ; les analyses se
+    fusionnent avec fusionner, directement ou à partir de leur état JSON (etat, depuis_etat).
+    """
+
+    def __init__(self, compression=COMPRESSION):
+        """
+        Args:
+            compression (int): La compression des esquisses de quantiles (voir DigestQuantiles).
+        """
+        self.compression = compression
+        self.par_question = {}
+        self.par_theme = {}
+        self.par_difficulte = {}
+
+    def _statistiques(self, groupe, cle):
+        statistiques = groupe.get(cle)
+        if statistiques is None:
+            statistiques = groupe[cle] = StatistiquesReponses(self.compression)
+        return statistiques
+
+    def enregistrer(self, question, correcte, latence, expiree=False):
+        """
+        Enregistre la réponse d'un joueur à une question.
+
+        Args:
+            question (Question): La question posée (enonce, theme et difficulte sont lus).
+            correcte (bool): Vrai si la réponse est correcte.
+            latence (float): Le temps de réponse en secondes.
+            expiree (bool): Vrai si le temps est écoulé sans réponse.
+        """
+        self._statistiques(self.par_question, question.enonce).ajouter(correcte, latence, expiree)
+        self._statistiques(self.par_theme, question.theme).ajouter(correcte, latence, expiree)
+        self._statistiques(self.par_difficulte, question.difficulte).ajouter(correcte, latence, expiree)
+
+    def fusionner(self, autre):
+        """
+        Ajoute les réponses enregistrées par une autre analyse.
+
+        Args:
+            autre (AnalyseReponses): L'analyse à fusionner.
+        """
+        for groupe, autre_groupe in ((self.par_question, autre.par_question), (self.par_theme, autre.par_theme),
+                                     (self.par_difficulte, autre.par_difficulte)):
+            for cle, statistiques in autre_groupe.items():
+                self._statistiques(groupe, cle).fusionner(statistiques)
+
+    def resume(self):
+        """
+        Returns:
+            dict: Les résumés (voir StatistiquesReponses.resume) par question, par thème et par difficulté.
+        """
+        return {
+            "questions": {cle: s.resume() for cle, s in self.par_question.items()},
+            "themes": {cle: s.resume() for cle, s in self.par_theme.items()},
+            "difficultes": {cle: s.resume() for cle, s in sorted(self.par_difficulte.items())},
+        }
+
+    def etat(self):
+        """
+        Retourne un état sérialisable en JSON (les difficultés deviennent des clés textuelles).
+        """
+        return {
+            "compression": self.compression,
+            "questions": {cle: s.etat() for cle, s in self.par_question.items()},
+            "themes": {cle: s.etat() for cle, s in self.par_theme.items()},
+            "difficultes": {str(cle): s.etat() for cle, s in self.par_difficulte.items()},
+        }
+
+    @classmethod
+    def depuis_etat(cls, etat):
+        analyse = cls(etat["compression"])
+        analyse.par_question = {cle: StatistiquesReponses.depuis_etat(e) for cle, e in etat["questions"].items()}
+        analyse.par_theme = {cle: StatistiquesReponses.depuis_etat(e) for cle, e in etat["themes"].items()}
+        analyse.par_difficulte = {int(cle): StatistiquesReponses.depuis_etat(e) for cle, e in etat["difficultes"].items()}
+        return analyse
+
+    def sauvegarder(self, chemin):
+        """
+        Écrit l'état de l'analyse dans un fichier JSON.
+        """
+        with open(chemin, "w", encoding="utf-8") as f:
+            json.dump(self.etat(), f, ensure_ascii=False)
+
+    @classmethod
+    def charger(cls, chemin):
+        """
+        Relit une analyse écrite par sauvegarder.
+        """
+        with open(chemin, encoding="utf-8") as f:
+            return cls.depuis_etat(json.load(f))
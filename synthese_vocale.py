@@ -0,0 +1,138 @@
+import logging
+import queue
+import threading
+import time
+
+_FIN = object()
+
+
+class MoteurNul:
+    """
+    Moteur de synthèse vocale factice, compatible avec l'interface de pyttsx3
+    (say, runAndWait, stop). Il mémorise les textes au lieu de les prononcer ;
+    utile pour les tests et les machines sans sortie audio.
+    """
+
+    def __init__(self, delai=0.0):
+        """
+        Args:
+            delai (float): Durée simulée de chaque prononciation, en secondes.
+        """
+        self.delai = delai
+        self.textes = []
+        self._en_attente = []
+
+    def say(self, texte):
+        self._en_attente.append(texte)
+
+    def runAndWait(self):
+        if self.delai:
+            time.sleep(self.delai)
+        self.textes.extend(self._en_attente)
+        self._en_attente.clear()
+
+    def stop(self):
+        self._en_attente.clear()
+
+
+def creer_moteur(nul=False):
+    """
+    Crée un moteur pyttsx3, ou un MoteurNul si demandé ou si pyttsx3 est indisponible.
+
+    Args:
+        nul (bool): Force l'utilisation du moteur factice.
+
+    Returns:
+        Le moteur de synthèse vocale.
+    """
+    if nul:
+        return MoteurNul()
+    try:
+        import pyttsx3
+        return pyttsx3.init()
+    except (ImportError, RuntimeError, OSError) as e:
+        logging.warning("Synthèse vocale indisponible (%s), utilisation du moteur nul.", e)
+        return MoteurNul()
+
+
+class TravailleurVocal:
+    """
+    Fil d'exécution dédié à la synthèse vocale.
+
+    Un seul moteur est créé, dans le fil du travailleur, et réutilisé pour toutes
+    les phrases. Les phrases sont mises en file par dire() sans bloquer le jeu ;
+    vider() attend qu'elles soient prononcées et annuler() abandonne celles en attente.
+    """
+
+    def __init__(self, fabrique_moteur=creer_moteur):
+        """
+        Args:
+            fabrique_moteur (callable): Crée le moteur de synthèse (appelée dans le fil du travailleur).
+        """
+        self._fabrique_moteur = fabrique_moteur
+        self._file = queue.Queue()
+        self._generation = 0
+        self._moteur = None
+        self._pret = threading.Event()
+        self._fil = threading.Thread(target=self._boucle, name="synthese-vocale", daemon=True)
+        self._fil.start()
+
+    @property
+    def moteur(self):
+        self._pret.wait()
+        return self._moteur
+
+    def _boucle(self):
+        try:
+            self._moteur = self._fabrique_moteur()
+        except Exception as e:
+            logging.warning("Échec de la création du moteur vocal (%s), utilisation du moteur nul.", e)
+            self._moteur = MoteurNul()
+        self._pret.set()
+        while True:
+            element = self._file.get()
+            try:
+                if element is _FIN:
+                    return
+                generation, texte = element
+                if generation == self._generation:
+                    self._moteur.say(texte)
+                    self._moteur.runAndWait()
+            except Exception as e:
+                logging.error("Erreur de synthèse vocale : %s", e)
+            finally:
+                self._file.task_done()
+
+    def dire(self, texte):
+        """
+        Met une phrase en file d'attente et rend la main immédiatement.
+
+        Args:
+            texte (str): Le texte à prononcer.
+        """
+        self._file.put((self._generation, texte))
+
+    def vider(self):
+        """
+        Attend que toutes les phrases en file aient été prononcées.
+        """
+        self._file.join()
+
+    def annuler(self):
+        """
+        Abandonne les phrases en attente et interrompt la phrase en cours.
+        """
+        self._generation += 1
+        self.moteur.stop()
+
+    def arreter(self, vider=True):
+        """
+        Arrête le travailleur.
+
+        Args:
+            vider (bool): Prononce d'abord les phrases en attente (sinon elles sont annulées).
+        """
+        if not vider:
+            self.annuler()
+        self._file.put(_FIN)
+        self._fil.join()
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import create_questions_db
+from banque_compacte import BanqueCompacte, VueQuestion, memoire_par_question
+from jeu import Jeu, Joueur, Question, QUESTIONS_INTEGREES, SourceListe
+from sources_questions import SourceSQLite
+
+class TestBanqueCompacte(unittest.TestCase):
+
+    def setUp(self):
+        self.questions = list(SourceListe(QUESTIONS_INTEGREES))
+        self.banque = BanqueCompacte.depuis_source(self.questions)
+
+    def test_aller_retour(self):
+        self.assertEqual(len(self.banque), len(self.questions))
+        self.assertEqual(list(self.banque), self.questions)
+
+    def test_vue(self):
+        vue = self.banque[1]
+        self.assertEqual(vue.enonce, "Quelle est la capitale de la France?")
+        self.assertEqual(vue.options, ["Paris", "Londres", "Berlin", "Madrid"])
+        self.assertEqual((vue.reponse_correcte, vue.difficulte, vue.theme), (1, 1, "Géographie"))
+        with self.assertRaises(AttributeError):
+            vue.autre = 1
+        with self.assertRaises(IndexError):
+            self.banque[len(self.banque)]
+
+    def test_themes_internes(self):
+        self.assertEqual(sorted(self.banque.noms_themes), ["Art", "Géographie", "Histoire", "Littérature", "Science"])
+        self.assertIs(self.banque[0].theme, self.banque[1].theme)
+
+    def test_source_du_jeu(self):
+        jeu = Jeu(self.banque, taille_fenetre=4, sortie=lambda texte: None, scores={})
+        jeu.presentateur.voix_off = None
+        joueur = Joueur("Alice")
+        question = jeu.tirer_question(joueur)
+        self.assertIsInstance(question, VueQuestion)
+        self.assertIs(question.banque, self.banque)
+        self.assertEqual(question.rendu(), Question(*self.banque.question(question.indice)).rendu())
+        with patch("saisie.lecteur.lire", return_value=str(question.reponse_correcte)):
+            self.assertTrue(jeu.poser_question(question, joueur))
+        self.assertEqual(joueur.score, question.difficulte)
+
+    def test_question_sans_theme_depuis_sqlite(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            base = os.path.join(dossier, "questions.db")
+            with patch("builtins.print"):
+                create_questions_db.create_database(base)
+                create_questions_db.add_question(base, "Combien ?", "", ["1", "2"], 2, "facile")
+            banque = BanqueCompacte.depuis_source(SourceSQLite(base))
+        self.assertEqual(banque.question(0), ("Combien ?", ["1", "2"], 2, 1, "", ""))
+        banque.ajouter("Et ici ?", ["a", "b"], 1, 1, None, None)
+        self.assertEqual((banque[1].theme, banque[1].explication), ("", ""))
+
+    def test_plus_compacte_que_des_objets(self):
+        objets = memoire_par_question(lambda questions: [Question(*q) for q in questions], 2000)
+        compacte = memoire_par_question(BanqueCompacte.depuis_source, 2000)
+        self.assertLess(compacte, objets / 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+import unittest
+from benchmarks import comparer, enregistrer, executer, mesurer
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_mesurer(self):
+        temps = mesurer(lambda: sum(range(100)), repetitions=2, duree_min=0.001)
+        self.assertGreater(temps, 0)
+        self.assertLess(temps, 0.001)
+
+    def test_executer_tous_les_cas(self):
+        lignes = []
+        resultats = executer(tailles=(30,), repetitions=1, duree_min=0.001, sortie=lignes.append)
+        for nom in ("question.creation", "question.poser", "jeu.jouer_tour", "scores.enregistrer_partie",
+                    "source.jsonl.chargement[30]", "source.sqlite.chargement[30]", "source.qbank.chargement[30]",
+                    "quiz_vocal.get_random_question[30]"):
+            self.assertGreater(resultats[nom], 0)
+        self.assertEqual(len(lignes), len(resultats))
+        self.assertEqual(list(executer(tailles=(), filtre="totaux", repetitions=1, duree_min=0.001,
+                                       sortie=lignes.append)), ["scores.totaux"])
+
+    def test_comparer(self):
+        comparaison = comparer({"a": 1.5, "b": 1.0, "c": 0.5, "d": 1.0}, {"a": 1.0, "b": 1.1, "c": 1.0}, seuil=0.2)
+        self.assertEqual({nom: c["etat"] for nom, c in comparaison.items()},
+                         {"a": "regression", "b": "stable", "c": "amelioration"})
+
+    def test_historique_et_reference(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            historique = os.path.join(dossier, "historique.json")
+            reference = os.path.join(dossier, "reference.json")
+            premiere = enregistrer({"a": 1.0}, historique, reference)
+            self.assertEqual(premiere["regressions"], [])
+            seconde = enregistrer({"a": 2.0}, historique, reference)
+            self.assertEqual(seconde["regressions"], ["a"])
+            enregistrer({"a": 2.0}, historique, reference, fixer_reference=True)
+            self.assertEqual(enregistrer({"a": 2.1}, historique, reference)["regressions"], [])
+            with open(historique, encoding="utf-8") as f:
+                self.assertEqual([e["resultats"]["a"] for e in json.load(f)], [1.0, 2.0, 2.0, 2.1])
+
+if __name__ == '__main__':
+    unittest.main()
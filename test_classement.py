@@ -0,0 +1,78 @@
+import random
+import unittest
+from classement import ListeSautsIndexee, Classement, ClassementFenetre, TableauDesScores, JOUR
+
+class Horloge:
+
+    def __init__(self):
+        self.maintenant = 0.0
+
+    def __call__(self):
+        return self.maintenant
+
+class TestClassement(unittest.TestCase):
+
+    def test_liste_sauts_comme_liste_triee(self):
+        rng = random.Random(5)
+        liste, reference = ListeSautsIndexee(graine=5), []
+        for _ in range(2000):
+            cle = rng.randrange(500)
+            if cle in reference:
+                liste.retirer(cle)
+                reference.remove(cle)
+            else:
+                liste.ajouter(cle)
+                reference.append(cle)
+            reference.sort()
+        self.assertEqual(list(liste.premiers(len(liste))), reference)
+        for rang, cle in enumerate(reference):
+            self.assertEqual(liste.rang(cle), rang)
+            self.assertEqual(liste[rang], cle)
+
+    def test_top_et_rang(self):
+        classement = Classement()
+        classement.ajouter("Alice", 5)
+        classement.ajouter("Bob", 8)
+        classement.ajouter("Charlie", 3)
+        classement.ajouter("Alice", 4)
+        self.assertEqual(classement.top(2), [("Alice", 9), ("Bob", 8)])
+        self.assertEqual(classement.rang("Charlie"), 3)
+        self.assertIsNone(classement.rang("Inconnu"))
+
+    def test_egalite_premier_arrive_devant(self):
+        classement = Classement()
+        classement.ajouter("Alice", 5)
+        classement.ajouter("Bob", 5)
+        self.assertEqual(classement.rang("Alice"), 1)
+
+    def test_fenetre_glissante(self):
+        horloge = Horloge()
+        jour = ClassementFenetre(JOUR, horloge)
+        jour.ajouter("Alice", 10)
+        horloge.maintenant = JOUR / 2
+        jour.ajouter("Bob", 4)
+        jour.ajouter("Alice", 1)
+        horloge.maintenant = JOUR + 1
+        self.assertEqual(jour.top(), [("Bob", 4), ("Alice", 1)])
+        horloge.maintenant = 2 * JOUR
+        self.assertEqual(jour.top(), [])
+
+    def test_expiration_garde_l_ordre_d_arrivee(self):
+        horloge = Horloge()
+        jour = ClassementFenetre(JOUR, horloge)
+        jour.ajouter("Alice", 2)
+        horloge.maintenant = JOUR / 4
+        jour.ajouter("Alice", 3)
+        horloge.maintenant = JOUR / 2
+        jour.ajouter("Bob", 3)
+        horloge.maintenant = JOUR + 1
+        self.assertEqual(jour.top(), [("Alice", 3), ("Bob", 3)])
+
+    def test_tableau_des_scores(self):
+        tableau = TableauDesScores()
+        tableau.enregistrer_partie([("Alice", 3), ("Bob", 7)])
+        self.assertEqual(tableau.general.rang("Bob"), 1)
+        self.assertEqual(tableau.semaine.top(1), [("Bob", 7)])
+
+if __name__ == '__main__':
+    unittest.main()
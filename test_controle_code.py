@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import controle_code
+from controle_code import ControleCode
+
+class TestControleCode(unittest.TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.repertoire = self.dossier.name
+        self.ecrire("base.py", "VALEUR = 1\n")
+        self.ecrire("calcul.py", "import json\nfrom base import VALEUR\n\ndef double():\n    return 2 * VALEUR\n")
+        self.ecrire("autre.py", "X = 3\n")
+        self.ecrire("test_calcul.py", "import unittest\nfrom calcul import double\n\n"
+                    "class T(unittest.TestCase):\n    def test_double(self):\n        self.assertEqual(double(), 2)\n")
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def ecrire(self, nom, contenu):
+        with open(os.path.join(self.repertoire, nom), "w") as f:
+            f.write(contenu)
+
+    def test_fichiers_inchanges_non_recompiles(self):
+        ControleCode(self.repertoire).verifier_syntaxe()
+        with patch.object(controle_code, "analyser_fichier", wraps=controle_code.analyser_fichier) as analyse:
+            self.ecrire("autre.py", "X = 4\n")
+            self.assertEqual(ControleCode(self.repertoire).verifier_syntaxe(), {})
+        self.assertEqual([appel.args[0] for appel in analyse.call_args_list], [os.path.join(self.repertoire, "autre.py")])
+
+    def test_erreur_de_syntaxe(self):
+        self.ecrire("casse.py", "def f(:\n")
+        self.ecrire("retour.py", "return 1\n")
+        erreurs = ControleCode(self.repertoire).verifier_syntaxe()
+        self.assertEqual(set(erreurs), {"casse", "retour"})
+        self.assertIn("SyntaxError", erreurs["casse"])
+
+    def test_dependances_transitives(self):
+        controle = ControleCode(self.repertoire)
+        controle.verifier_syntaxe()
+        self.assertEqual(controle.dependances("test_calcul"), {"test_calcul", "calcul", "base"})
+
+    def test_module_masquant_la_bibliotheque_standard(self):
+        self.ecrire("random.py", "def f(:\n")
+        controle = ControleCode(self.repertoire)
+        erreurs = controle.verifier_syntaxe()
+        self.assertEqual(controle.modules_masquants(), ["random"])
+        self.assertIn("random", erreurs)
+        # Importé par la bibliothèque standard, il est une dépendance de tous les modules
+        self.assertEqual(controle.dependances("autre"), {"autre", "random"})
+        self.assertIn("random", controle.dependances("test_calcul") & set(erreurs))
+
+    def test_tests_relances_seulement_si_une_dependance_change(self):
+        controle = ControleCode(self.repertoire, nb_processus=2)
+        controle.verifier_syntaxe()
+        resultats = controle.executer_tests()
+        self.assertEqual([(module, reussite, nb) for module, reussite, nb, _ in resultats], [("test_calcul", True, 1)])
+
+        controle = ControleCode(self.repertoire)
+        self.ecrire("autre.py", "X = 5\n")
+        controle.verifier_syntaxe()
+        self.assertEqual(controle.tests_a_executer(), [])
+
+        controle = ControleCode(self.repertoire)
+        self.ecrire("base.py", "VALEUR = 2\n")
+        controle.verifier_syntaxe()
+        self.assertEqual(controle.tests_a_executer(), ["test_calcul"])
+        module, reussite, _, sortie = controle.executer_tests()[0]
+        self.assertFalse(reussite)
+        self.assertIn("AssertionError", sortie)
+        self.assertEqual(ControleCode(self.repertoire).cache["tests"], {})
+
+if __name__ == '__main__':
+    unittest.main()
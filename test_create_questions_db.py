@@ -0,0 +1,83 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from create_questions_db import create_database, bulk_insert, import_file
+from sources_questions import SourceSQLite
+
+class TestCreateQuestionsDb(unittest.TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.dossier.name, "questions.db")
+        create_database(self.db)
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def count(self):
+        conn = sqlite3.connect(self.db)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_bulk_insert_par_lots(self):
+        records = ({"question": f"Question {i}", "context": "Contexte"} for i in range(25))
+        self.assertEqual(bulk_insert(self.db, records, batch_size=10), 25)
+        self.assertEqual(self.count(), 25)
+
+    def test_bulk_insert_reconstruit_les_index(self):
+        conn = sqlite3.connect(self.db)
+        conn.execute("CREATE INDEX idx_theme ON questions (theme)")
+        conn.close()
+        bulk_insert(self.db, [{"question": "Question", "theme": "Science"}])
+        conn = sqlite3.connect(self.db)
+        noms = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        conn.close()
+        self.assertIn("idx_theme", noms)
+
+    def test_bulk_insert_en_echec_garde_les_index(self):
+        conn = sqlite3.connect(self.db)
+        conn.execute("CREATE INDEX idx_theme ON questions (theme)")
+        conn.close()
+        records = [{"question": "Q1", "context": "C"}, {"question": "Q2", "context": "C"}, {"question": None}]
+        with self.assertRaises(sqlite3.IntegrityError):
+            bulk_insert(self.db, records, batch_size=2)
+        conn = sqlite3.connect(self.db)
+        noms = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        conn.close()
+        self.assertIn("idx_theme", noms)
+        self.assertEqual(self.count(), 2)
+
+    def test_import_jsonl_et_csv(self):
+        jsonl = os.path.join(self.dossier.name, "q.jsonl")
+        with open(jsonl, "w", encoding="utf-8") as f:
+            for i in range(3):
+                f.write(json.dumps({"question": f"Q{i}", "context": "C", "options": ["a", "b"], "correct_option": 1}) + "\n")
+        csv = os.path.join(self.dossier.name, "q.csv")
+        with open(csv, "w", encoding="utf-8") as f:
+            f.write("question,context\nQ3,C\nQ4,C\n")
+        self.assertEqual(import_file(self.db, jsonl), 3)
+        self.assertEqual(import_file(self.db, csv), 2)
+        self.assertEqual(self.count(), 5)
+
+    def test_migration_ancienne_table(self):
+        ancienne = os.path.join(self.dossier.name, "ancienne.db")
+        conn = sqlite3.connect(ancienne)
+        conn.execute("CREATE TABLE questions (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                     "question TEXT NOT NULL, context TEXT NOT NULL)")
+        conn.execute("INSERT INTO questions (question, context) VALUES ('Q', 'C')")
+        conn.commit()
+        conn.close()
+        create_database(ancienne)
+        bulk_insert(ancienne, [{"question": "Q2", "options": ["a", "b"], "correct_option": 2, "theme": "Art"}])
+        self.assertEqual(len(list(SourceSQLite(ancienne))), 1)
+
+    def test_import_format_inconnu(self):
+        with self.assertRaises(ValueError):
+            import_file(self.db, "questions.xml")
+
+if __name__ == '__main__':
+    unittest.main()
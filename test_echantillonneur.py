@@ -0,0 +1,78 @@
+import random
+import unittest
+from collections import Counter
+from echantillonneur import TableAlias, EchantillonneurAdaptatif, EnsembleBits
+
+class TestEchantillonneur(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(42)
+
+    def test_table_alias_respecte_les_poids(self):
+        table = TableAlias([1, 3])
+        tirages = Counter(table.tirer(self.rng) for _ in range(20000))
+        self.assertAlmostEqual(tirages[1] / 20000, 0.75, delta=0.02)
+
+    def test_table_alias_poids_invalides(self):
+        with self.assertRaises(ValueError):
+            TableAlias([0, 0])
+
+    def test_session_sans_repetition(self):
+        echantillonneur = EchantillonneurAdaptatif([1, 2, 3] * 100)
+        session = echantillonneur.session(self.rng)
+        tires = [session.tirer(2) for _ in range(300)]
+        self.assertEqual(sorted(tires), list(range(300)))
+        self.assertIsNone(session.tirer(2))
+
+    def test_tirage_oriente_par_le_niveau(self):
+        difficultes = [1, 2, 3] * 1000
+        echantillonneur = EchantillonneurAdaptatif(difficultes)
+        session = echantillonneur.session(self.rng)
+        tirages = Counter(difficultes[session.tirer(3)] for _ in range(500))
+        self.assertGreater(tirages[3], tirages[2])
+        self.assertGreater(tirages[2], tirages[1])
+
+    def test_sessions_independantes(self):
+        echantillonneur = EchantillonneurAdaptatif([1] * 10)
+        premiere = echantillonneur.session(self.rng)
+        for _ in range(10):
+            premiere.tirer(1)
+        self.assertIsNotNone(echantillonneur.session(self.rng).tirer(1))
+
+    def test_tirage_par_theme_et_difficulte(self):
+        difficultes = [1, 2, 3] * 40
+        themes = ["Histoire", "Science", "Art", "Géographie"] * 30
+        session = EchantillonneurAdaptatif(difficultes, themes=themes).session(self.rng)
+        tires = []
+        while (identifiant := session.tirer_parmi([3], ["Histoire", "Science"])) is not None:
+            tires.append(identifiant)
+        attendus = [i for i in range(120) if difficultes[i] == 3 and themes[i] in ("Histoire", "Science")]
+        self.assertEqual(sorted(tires), attendus)
+        self.assertEqual(len(session), 120 - len(attendus))
+
+    def test_theme_none_compte_une_seule_fois(self):
+        echantillonneur = EchantillonneurAdaptatif([1, 1], themes=[None, "Art"])
+        self.assertEqual(echantillonneur.index.themes, ["Art", None])
+        tirages = Counter(echantillonneur.session(random.Random(graine)).tirer_parmi() for graine in range(4000))
+        self.assertAlmostEqual(tirages[0] / 4000, 0.5, delta=0.03)
+        session = echantillonneur.session(self.rng)
+        self.assertEqual(session.tirer_parmi(themes=[None]), 0)
+        self.assertIsNone(session.tirer_parmi(themes=[None]))
+
+    def test_question_marquee_jamais_tiree(self):
+        session = EchantillonneurAdaptatif([1] * 10).session(self.rng)
+        session.marquer(4)
+        tires = [session.tirer(1) for _ in range(9)]
+        self.assertNotIn(4, tires)
+        self.assertIsNone(session.tirer(1))
+
+    def test_ensemble_bits(self):
+        bits = EnsembleBits(20)
+        bits.ajouter(17)
+        bits.ajouter(17)
+        self.assertIn(17, bits)
+        self.assertNotIn(16, bits)
+        self.assertEqual(len(bits), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from create_questions_db import create_database, add_question
+from flux_questions import PermutationCle, FluxQuestions
+
+class TestFluxQuestions(unittest.TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.dossier.name, "questions.db")
+        create_database(self.db)
+        for i in range(20):
+            add_question(self.db, f"Question {i}", f"Contexte {i}")
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_permutation_bijective(self):
+        for n in (1, 2, 7, 100, 1000):
+            self.assertEqual(sorted(PermutationCle(n, cle=3)), list(range(n)))
+
+    def test_permutation_depend_de_la_cle(self):
+        self.assertNotEqual(list(PermutationCle(100, cle=1)), list(PermutationCle(100, cle=2)))
+
+    def test_flux_parcourt_chaque_question_une_fois(self):
+        with FluxQuestions(self.db, cle=7) as flux:
+            ids = [q_id for q_id, _, _ in flux]
+        self.assertEqual(sorted(ids), list(range(1, 21)))
+
+    def test_flux_ignore_questions_posees(self):
+        with FluxQuestions(self.db) as flux:
+            posees = set(range(1, 20))
+            self.assertEqual(flux.suivante(posees)[0], 20)
+            self.assertIsNone(flux.suivante(posees))
+
+    def test_flux_lecture_seule(self):
+        with FluxQuestions(self.db, immuable=True) as flux:
+            with self.assertRaises(Exception):
+                flux.conn.execute("DELETE FROM questions")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+import create_questions_db
+from jeu import Jeu, Joueur, Question, Recompense, VoixOff, QUESTIONS_INTEGREES
+from journal_scores import JournalScores
+from sources_questions import SourceListe, SourceJSONL, SourceSQLite
+
+class TestRecompense(unittest.TestCase):
+
+    def setUp(self):
+        self.annonces = []
+        self.joueur = Joueur("Alice")
+
+    def verifier(self, **champs):
+        for champ, valeur in champs.items():
+            setattr(self.joueur, champ, valeur)
+        return Recompense.verifier_badges(self.joueur, self.annonces.append)
+
+    def test_aucun_badge(self):
+        self.assertEqual(self.verifier(score=5), [])
+        self.assertEqual(self.annonces, [])
+
+    def test_badge_annonce_une_seule_fois(self):
+        self.assertEqual(self.verifier(score=12), ["Novice"])
+        self.assertEqual(self.verifier(score=15), [])
+        self.assertEqual(len(self.annonces), 1)
+
+    def test_plusieurs_seuils_franchis(self):
+        self.assertEqual(self.verifier(score=31, niveau_difficulte=3), ["Novice", "Maître", "Expert"])
+        self.assertEqual(self.joueur.badges, ["Novice", "Maître", "Expert"])
+
+    def test_badge_garde_apres_baisse(self):
+        self.verifier(niveau_difficulte=2.5)
+        self.verifier(niveau_difficulte=1)
+        self.assertEqual(self.verifier(niveau_difficulte=3), [])
+        self.assertEqual(self.joueur.badges, ["Expert"])
+
+    def test_serie(self):
+        self.assertEqual(self.verifier(serie=5), ["En série"])
+
+    def test_champs_limites(self):
+        self.joueur.score = 12
+        self.assertEqual(Recompense.verifier_badges(self.joueur, self.annonces.append, champs=["serie"]), [])
+        self.assertEqual(Recompense.verifier_badges(self.joueur, self.annonces.append, champs=["score"]), ["Novice"])
+
+class TestVoixOff(unittest.TestCase):
+
+    def test_repliques_compilees_comme_format(self):
+        voix_off = VoixOff()
+        valeurs = {"reponse": "Paris", "joueur": "Alice", "joueur1": "Alice", "joueur2": "Bob"}
+        for type_message, repliques in voix_off.repliques.items():
+            for i, replique in enumerate(repliques):
+                messages = []
+                voix_off.sortie = messages.append
+                voix_off._repliques_compilees[type_message] = [voix_off._compiler(replique)]
+                voix_off.annoncer(type_message, **valeurs)
+                self.assertEqual(messages, ["[Voix off] " + replique.format(**valeurs)])
+
+def source_jsonl(dossier, questions):
+    chemin = os.path.join(dossier, "questions.jsonl")
+    with open(chemin, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(question) + "\n" for question in questions)
+    return SourceJSONL(chemin)
+
+def repondre_juste(question, presentateur, joueur, analyse=None):
+    return question.evaluer(question.reponse_correcte, presentateur, joueur)
+
+class TestPhases(unittest.TestCase):
+
+    def setUp(self):
+        self.jeu = Jeu(sortie=lambda texte: None, scores={})
+        self.jeu.presentateur.voix_off = None
+
+    def test_questions_par_theme_et_difficulte(self):
+        questions = [self.jeu.tirer_question_parmi([1], ["Science"]) for _ in range(3)]
+        self.assertEqual({(q.difficulte, q.theme) for q in questions}, {(1, "Science")})
+        self.assertEqual(len({q.enonce for q in questions}), 3)
+
+    def test_duel_final_sans_question_repetee(self):
+        posees = []
+
+        def repondre_et_noter(question, presentateur, joueur, analyse=None):
+            posees.append(question)
+            return repondre_juste(question, presentateur, joueur)
+
+        alice, bob = Joueur("Alice"), Joueur("Bob")
+        with patch.object(Question, "poser", repondre_et_noter):
+            self.assertIs(self.jeu.duel_final(alice, bob), alice)
+        # Trois questions difficiles dans la banque intégrée, puis des questions moyennes
+        self.assertEqual([q.difficulte for q in posees], [3, 3, 3, 2, 2, 2])
+        self.assertEqual(len({q.enonce for q in posees}), 6)
+        self.assertEqual((alice.score, bob.score), (8, 7))
+
+    @patch.object(Question, "poser", repondre_juste)
+    def test_duel_final_s_arrete_quand_la_banque_est_epuisee(self):
+        questions = [dict(QUESTIONS_INTEGREES[0], difficulty="difficile")] * 3
+        jeu = Jeu(SourceListe(questions), sortie=lambda texte: None, scores={})
+        alice, bob = Joueur("Alice"), Joueur("Bob")
+        jeu.duel_final(alice, bob)
+        self.assertEqual((alice.score, bob.score), (3, 3))
+
+    def test_pages_suivantes_sans_perdre_la_page_courante(self):
+        questions = ([dict(QUESTIONS_INTEGREES[1], theme="A")] * 10
+                     + [dict(QUESTIONS_INTEGREES[0], difficulty="difficile", theme="Histoire")] * 3)
+        dossier = tempfile.TemporaryDirectory()
+        self.addCleanup(dossier.cleanup)
+        jeu = Jeu(source_jsonl(dossier.name, questions), taille_fenetre=5, sortie=lambda texte: None, scores={})
+        self.assertEqual(jeu.tirer_question_parmi([1], ["A"]).theme, "A")
+        self.assertEqual(jeu.tirer_question_parmi([3], ["Histoire"]).theme, "Histoire")
+        page = jeu.questions
+        self.assertIsNone(jeu.tirer_question_parmi([2], ["Inconnu"]))
+        self.assertIs(jeu.questions, page)
+        self.assertEqual(len([jeu.tirer_question_parmi([3], ["Histoire"]) for _ in range(2)]), 2)
+        self.assertIsNone(jeu.tirer_question_parmi([3], ["Histoire"]))
+        # La question de thème A déjà posée ne revient pas quand sa page est rechargée
+        self.assertEqual(len([jeu.tirer_question_parmi(themes=["A"]) for _ in range(9)]), 9)
+        self.assertIsNone(jeu.tirer_question_parmi(themes=["A"]))
+
+    def test_tirage_dans_toute_la_source(self):
+        questions = [dict(QUESTIONS_INTEGREES[1], theme=f"Thème {i // 10}") for i in range(1000)]
+        themes = {Jeu(SourceListe(questions), taille_fenetre=10, rng=random.Random(graine), sortie=lambda texte: None,
+                      scores={}).tirer_question(Joueur("Alice")).theme for graine in range(20)}
+        self.assertGreater(len(themes), 10)
+
+    def test_theme_rare_sans_decoder_la_source(self):
+        questions = [dict(QUESTIONS_INTEGREES[1], theme="Courant")] * 5000
+        questions[4321] = dict(QUESTIONS_INTEGREES[0], theme="Rare")
+        source = SourceListe(questions)
+        with patch.object(SourceListe, "question", autospec=True, side_effect=SourceListe.question) as decodage:
+            premier = Jeu(source, sortie=lambda texte: None, scores={})
+            self.assertEqual(premier.tirer_question_parmi(themes=["Rare"]).theme, "Rare")
+            self.assertIsNone(premier.tirer_question_parmi(themes=["Rare"]))
+            second = Jeu(source, sortie=lambda texte: None, scores={})
+            self.assertEqual(second.tirer_question_parmi(themes=["Rare"]).theme, "Rare")
+        # Un seul index pour la source, et seules les questions tirées sont décodées
+        self.assertIs(premier._echantillonneur, second._echantillonneur)
+        self.assertEqual([appel.args[1] for appel in decodage.call_args_list], [4321, 4321])
+
+    def test_questions_reposees_quand_la_source_est_epuisee(self):
+        jeu = Jeu(SourceListe(QUESTIONS_INTEGREES[:4]), taille_fenetre=3, sortie=lambda texte: None, scores={})
+        joueur = Joueur("Alice")
+        enonces = [jeu.tirer_question(joueur).enonce for _ in range(8)]
+        self.assertEqual(len(set(enonces[:4])), 4)
+        self.assertEqual(len(set(enonces[4:])), 4)
+
+    @patch.object(Question, "poser", repondre_juste)
+    def test_etoile_mysterieuse(self):
+        self.assertTrue(self.jeu.etoile_mysterieuse(Joueur("Alice"), themes=["Géographie"]))
+
+    def test_classements_lus_dans_le_journal(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            scores = JournalScores(os.path.join(dossier, "scores.db"))
+            scores.enregistrer_partie([("Bob", 10), ("Chloé", 2)])
+            jeu = Jeu(sortie=lambda texte: None, scores=scores)
+            alice = Joueur("Alice")
+            alice.score = 5
+            with patch("classement.TableauDesScores.depuis_journal") as depuis_journal:
+                jeu._sauvegarder_scores([alice])
+            self.assertEqual(jeu.tableau.general.rang("Alice"), 2)
+            self.assertEqual(jeu.tableau.semaine.top(1), [("Bob", 10)])
+            depuis_journal.assert_not_called()
+            scores.close()
+
+class TestSources(unittest.TestCase):
+
+    def test_question_sans_theme(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            base = os.path.join(dossier, "questions.db")
+            with patch("builtins.print"):
+                create_questions_db.create_database(base)
+                create_questions_db.add_question(base, "Combien ?", "", ["1", "2"], 2, "facile")
+            jeu = Jeu(SourceSQLite(base), sortie=lambda texte: None, scores={})
+            question = jeu.tirer_question(Joueur("Alice"))
+        self.assertEqual(question.theme, "")
+        self.assertEqual(question.enonce, "Combien ?")
+
+    def test_source_en_flux_lue_depuis_le_debut(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            jeu = Jeu(source_jsonl(dossier, QUESTIONS_INTEGREES), taille_fenetre=5, sortie=lambda texte: None, scores={})
+            jeu.tirer_question(Joueur("Alice"))
+        self.assertEqual(jeu.paginateur.debut, 0)
+
+if __name__ == '__main__':
+    unittest.main()
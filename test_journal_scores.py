@@ -0,0 +1,91 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+from journal_scores import JournalScores, TableauJournal
+from joueur import Joueur
+
+def _ecrire(chemin, nom, nb):
+    journal = JournalScores(chemin, compaction_toutes=0)
+    for i in range(nb):
+        journal.enregistrer(nom, 1)
+    journal.close()
+
+class TestJournalScores(unittest.TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "scores.db")
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_creation_paresseuse(self):
+        JournalScores(self.chemin)
+        self.assertFalse(os.path.exists(self.chemin))
+
+    def test_totaux_cumules(self):
+        journal = JournalScores(self.chemin)
+        alice = Joueur("Alice")
+        alice.score = 7
+        journal.enregistrer_partie([alice, ("Bob", 3)])
+        journal.enregistrer("Alice", 4)
+        self.assertEqual(journal["Alice"], {"total": 11, "parties": 2, "meilleur": 7})
+        self.assertIn("Bob", journal)
+        self.assertEqual(len(journal), 2)
+        self.assertEqual(len(list(journal.resultats())), 3)
+        journal.close()
+
+    def test_import_ancien_scores_json(self):
+        ancien = os.path.join(self.dossier.name, "scores.json")
+        with open(ancien, "w") as f:
+            json.dump({"Alice": 12}, f)
+        journal = JournalScores(self.chemin, ancien_fichier=ancien)
+        self.assertEqual(journal["Alice"]["meilleur"], 12)
+        journal.close()
+
+    def test_compaction_tronque_le_wal(self):
+        journal = JournalScores(self.chemin, compaction_toutes=5)
+        for i in range(10):
+            journal.enregistrer("Alice", i)
+        journal.close()
+        self.assertEqual(os.path.getsize(self.chemin + "-wal") if os.path.exists(self.chemin + "-wal") else 0, 0)
+        self.assertEqual(JournalScores(self.chemin)["Alice"]["parties"], 10)
+
+    def test_compaction_supprime_les_anciens_resultats(self):
+        journal = JournalScores(self.chemin, compaction_toutes=0, conservation=100)
+        journal.enregistrer("Alice", 5, horodatage=1000)
+        journal.enregistrer("Alice", 3, horodatage=1950)
+        journal.enregistrer("Bob", 2, horodatage=1000)
+        journal.compacter(maintenant=2000)
+        self.assertEqual(list(journal.resultats()), [("Alice", 3, 1950)])
+        self.assertEqual(journal["Alice"], {"total": 8, "parties": 2, "meilleur": 5})
+        self.assertEqual(journal["Bob"]["total"], 2)
+        journal.close()
+
+    def test_tableau_lu_dans_le_journal(self):
+        journal = JournalScores(self.chemin, compaction_toutes=0)
+        tableau = TableauJournal(journal, horloge=lambda: 10 * 86400)
+        journal.enregistrer_partie([("Alice", 5), ("Bob", 3), ("Chloé", 3)], horodatage=1)
+        journal.enregistrer_partie([("Bob", 4), ("Chloé", 1)], horodatage=10 * 86400 - 60)
+        self.assertEqual(tableau.general.top(2), [("Bob", 7), ("Alice", 5)])
+        self.assertEqual([tableau.general.rang(nom) for nom in ("Alice", "Bob", "Chloé", "Zoé")], [2, 1, 3, None])
+        self.assertEqual(tableau.semaine.top(5), [("Bob", 4), ("Chloé", 1)])
+        self.assertEqual((tableau.semaine.rang("Chloé"), tableau.semaine.rang("Alice")), (2, None))
+        self.assertEqual((tableau.jour.score("Bob"), tableau.jour.score("Alice")), (4, 0))
+        journal.close()
+
+    def test_ecritures_concurrentes(self):
+        processus = [multiprocessing.Process(target=_ecrire, args=(self.chemin, f"J{i}", 50)) for i in range(4)]
+        for p in processus:
+            p.start()
+        for p in processus:
+            p.join()
+        conn = sqlite3.connect(self.chemin)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM resultats").fetchone()[0], 200)
+        conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import io
+import json
+import logging
+import unittest
+from journalisation import journal, evenement, demarrer_journalisation, arreter_journalisation
+from joueur import Joueur
+
+class TestJournalisation(unittest.TestCase):
+
+    def setUp(self):
+        self.flux = io.StringIO()
+        demarrer_journalisation(flux=self.flux)
+
+    def tearDown(self):
+        arreter_journalisation()
+
+    def lignes(self):
+        arreter_journalisation()
+        return [json.loads(ligne) for ligne in self.flux.getvalue().splitlines()]
+
+    def test_evenement_json(self):
+        evenement(journal("test"), "reponse", joueur="Alice", question="5705ec55", latence=1.5)
+        ligne, = self.lignes()
+        self.assertEqual(ligne["evenement"], "reponse")
+        self.assertEqual(ligne["source"], "quiz.test")
+        self.assertEqual((ligne["joueur"], ligne["question"], ligne["latence"]), ("Alice", "5705ec55", 1.5))
+
+    def test_niveau_desactive(self):
+        Joueur("Alice")  # joueur_cree est un événement DEBUG
+        evenement(journal("test"), "detail", logging.DEBUG)
+        self.assertEqual(self.lignes(), [])
+
+    def test_arret_idempotent(self):
+        arreter_journalisation()
+        arreter_journalisation()
+        self.assertTrue(logging.getLogger("quiz").propagate)
+
+if __name__ == '__main__':
+    unittest.main()
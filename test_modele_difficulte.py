@@ -0,0 +1,47 @@
+import unittest
+try:
+    import numpy as np
+    from modele_difficulte import ModeleReponse, SimulationMonteCarlo
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "numpy n'est pas installé")
+class TestModeleDifficulte(unittest.TestCase):
+
+    def test_toujours_juste_suit_les_regles_du_joueur(self):
+        simulation = SimulationMonteCarlo(1000, ModeleReponse(precisions={1: 1.0, 2: 1.0, 3: 1.0}), graine=0)
+        resumes = simulation.simuler(6)
+        self.assertEqual([r["niveau_moyen"] for r in resumes], [1.5, 2.0, 2.5, 3.0, 3.0, 3.0])
+        self.assertEqual(resumes[-1]["precision"], 1.0)
+        self.assertTrue(np.all(simulation.scores >= 6))
+        self.assertTrue(np.all(simulation.scores <= 18))
+
+    def test_toujours_faux_reste_au_niveau_minimal(self):
+        simulation = SimulationMonteCarlo(500, ModeleReponse(precisions={1: 0.0, 2: 0.0, 3: 0.0}), graine=0)
+        resume = simulation.simuler(4)[-1]
+        self.assertEqual(resume["niveaux"], {1.0: 1.0})
+        self.assertEqual(resume["score_moyen"], 0.0)
+
+    def test_tirage_des_difficultes_selon_le_niveau(self):
+        simulation = SimulationMonteCarlo(200000, graine=1, selectivite=1.0)
+        simulation.niveaux[:] = 1.0
+        difficultes = simulation._tirer_difficultes()
+        poids = np.exp(-np.array([0.0, 1.0, 4.0]))
+        attendu = poids / poids.sum()
+        observe = np.bincount(difficultes, minlength=4)[1:] / len(difficultes)
+        np.testing.assert_allclose(observe, attendu, atol=0.01)
+
+    def test_competence_rapproche_le_niveau(self):
+        simulation = SimulationMonteCarlo(20000, competences=np.r_[np.full(10000, 1.0), np.full(10000, 3.0)], graine=2)
+        simulation.simuler(20)
+        self.assertLess(simulation.niveaux[:10000].mean() + 0.5, simulation.niveaux[10000:].mean())
+
+    def test_reproductible_et_competences_invalides(self):
+        a = SimulationMonteCarlo(100, graine=5).simuler(3)
+        b = SimulationMonteCarlo(100, graine=5).simuler(3)
+        self.assertEqual(a, b)
+        with self.assertRaises(ValueError):
+            SimulationMonteCarlo(3, competences=[1.0, 2.0])
+
+if __name__ == '__main__':
+    unittest.main()
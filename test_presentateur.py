@@ -19,4 +19,14 @@ class TestPresentateur(unittest.TestCase):
     def test_annoncer_tour(self):
         presentateur = Presentateur("Jean-Luc Reichmann")
         with self.assertRaises(ValueError):
-            presentateur.annoncer_tour("")
\ No newline at end of file
+            presentateur.annoncer_tour("")
+
+    def test_annonces_sur_la_sortie(self):
+        messages = []
+        presentateur = Presentateur("Jean-Luc Reichmann", sortie=messages.append)
+        presentateur.annoncer_tour("Alice")
+        presentateur.annoncer_resultat(False)
+        self.assertEqual(messages, ["\nJean-Luc Reichmann : Alice, à vous de jouer !", "Jean-Luc Reichmann : Temps écoulé !"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+import jeu
+from jeu import Joueur, Question, Recompense
+from profilage import Profileur
+from simulation import JeuSimule, ToujoursJuste
+
+class TestProfilage(unittest.TestCase):
+
+    def jouer(self, jeu_simule, nb_tours=3):
+        joueur = Joueur("Alice")
+        for _ in range(nb_tours):
+            jeu_simule.jouer_tour(joueur)
+
+    def test_phases_mesurees_et_imbriquees(self):
+        jeu_simule = JeuSimule()
+        jeu_simule.strategies = {"Alice": ToujoursJuste()}
+        with Profileur() as profileur:
+            self.jouer(jeu_simule)
+        phases = {nom: appels for nom, appels, *_ in profileur.rapport()}
+        self.assertEqual(phases["tour"], 3)
+        self.assertEqual(phases["evaluation"], 3)
+        self.assertEqual(phases["badges"], 3)
+        self.assertIn("tour;evaluation", profileur.piles)
+        self.assertIn("tour;badges", profileur.piles)
+        self.assertGreater(profileur.duree, 0)
+
+    def test_aucune_enveloppe_hors_profilage(self):
+        originales = (jeu.Jeu.jouer_tour, Question.__dict__["valider_entree_utilisateur"],
+                      Recompense.__dict__["verifier_badges"])
+        profileur = Profileur()
+        with profileur:
+            self.assertIsNot(jeu.Jeu.jouer_tour, originales[0])
+            self.assertIsInstance(Recompense.__dict__["verifier_badges"], classmethod)
+            self.assertIsInstance(Question.__dict__["valider_entree_utilisateur"], staticmethod)
+        self.assertEqual((jeu.Jeu.jouer_tour, Question.__dict__["valider_entree_utilisateur"],
+                          Recompense.__dict__["verifier_badges"]), originales)
+        with self.assertRaises(ValueError):
+            profileur.demarrer()
+            profileur.demarrer()
+        profileur.arreter()
+
+    def test_export_piles_repliees(self):
+        profileur = Profileur(cibles=[])
+        with profileur:
+            with profileur.phase("partie"):
+                with profileur.phase("rendu"):
+                    sum(range(10000))
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, "piles.txt")
+            profileur.exporter_piles(chemin)
+            with open(chemin, encoding="utf-8") as f:
+                lignes = [ligne.rsplit(" ", 1) for ligne in f.read().splitlines()]
+        self.assertEqual({pile for pile, _ in lignes} - {"partie"}, {"partie;rendu"})
+        self.assertTrue(all(int(poids) > 0 for _, poids in lignes))
+
+    def test_echantillons_et_cprofile(self):
+        jeu_simule = JeuSimule()
+        jeu_simule.strategies = {"Alice": ToujoursJuste()}
+        with Profileur(cprofile=True, intervalle_echantillons=0.0005) as profileur:
+            for _ in range(1000):
+                self.jouer(jeu_simule, 1)
+                jeu_simule.nouvelle_partie()
+        self.assertTrue(any("MainThread" in pile for pile in profileur.echantillons))
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, "jeu.pstats")
+            profileur.exporter_pstats(chemin)
+            self.assertGreater(os.path.getsize(chemin), 0)
+        with self.assertRaises(ValueError):
+            Profileur().exporter_pstats("inutile.pstats")
+
+if __name__ == '__main__':
+    unittest.main()
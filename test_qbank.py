@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from jeu import Jeu, Joueur, QUESTIONS_INTEGREES, SourceListe
+from qbank import compiler, BanqueMmap
+
+class TestQbank(unittest.TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "banque.qbank")
+        self.questions = list(SourceListe(QUESTIONS_INTEGREES))
+        self.assertEqual(compiler(self.questions, self.chemin), len(self.questions))
+        self.banque = BanqueMmap(self.chemin)
+
+    def tearDown(self):
+        self.banque.close()
+        self.dossier.cleanup()
+
+    def test_aller_retour(self):
+        self.assertEqual(len(self.banque), len(self.questions))
+        self.assertEqual(list(self.banque), self.questions)
+        self.assertEqual(self.banque[9], self.questions[9])
+
+    def test_colonnes_sans_decodage(self):
+        self.assertEqual(list(self.banque.difficultes()), [q[3] for q in self.questions])
+        self.assertEqual(self.banque.theme(4), "Littérature")
+        with self.assertRaises(IndexError):
+            self.banque.difficulte(len(self.questions))
+
+    def test_fichier_invalide(self):
+        chemin = os.path.join(self.dossier.name, "faux.qbank")
+        with open(chemin, "wb") as f:
+            f.write(b"pas une banque" * 10)
+        with self.assertRaises(ValueError):
+            BanqueMmap(chemin)
+
+    def test_separateur_interdit(self):
+        chemin = os.path.join(self.dossier.name, "autre.qbank")
+        with self.assertRaises(ValueError):
+            compiler([("a\x1fb", ["x", "y"], 1, 1, "", "")], chemin)
+        self.assertEqual(os.listdir(self.dossier.name), ["banque.qbank"])
+
+    def test_theme_et_explication_none(self):
+        chemin = os.path.join(self.dossier.name, "autre.qbank")
+        compiler([("Combien ?", ["1", "2"], 2, 1, None, None)], chemin)
+        with BanqueMmap(chemin) as banque:
+            self.assertEqual(banque[0], ("Combien ?", ["1", "2"], 2, 1, "", ""))
+
+    def test_colonnes(self):
+        difficultes, themes = self.banque.colonnes()
+        self.assertEqual(list(difficultes), [q[3] for q in self.questions])
+        self.assertEqual(themes, [q[4] for q in self.questions])
+
+    def test_source_du_jeu(self):
+        with patch.object(BanqueMmap, "question", autospec=True, side_effect=BanqueMmap.question) as decodage:
+            jeu = Jeu(self.banque, sortie=lambda texte: None, scores={})
+            question = jeu.tirer_question(Joueur("Alice"))
+        self.assertIn(question.enonce, [q[0] for q in self.questions])
+        # Seule la question tirée est décodée
+        self.assertEqual(decodage.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,11 @@
+import io
 import unittest
-from unittest.mock import patch
-from question import Question
+from unittest.mock import call, patch
+from question import Question, CacheRendus, cache_rendus
 from presentateur import Presentateur
 from joueur import Joueur
+from saisie import LecteurEntree
+from test_saisie import FluxLent
 
 class TestQuestion(unittest.TestCase):
 
@@ -29,15 +32,66 @@ class TestQuestion(unittest.TestCase):
 
     def test_poser_bonne_reponse(self):
         question = Question("Quelle est la capitale de la France?", ["Paris", "Londres", "Berlin", "Madrid"], 1, 1)
-        with patch('builtins.input', return_value="1"):
+        with patch('saisie.lecteur', LecteurEntree(io.StringIO("1\n"))):
             self.assertTrue(question.poser(self.presentateur, self.joueur))
             self.assertEqual(self.joueur.score, 1)
 
     def test_poser_mauvaise_reponse(self):
         question = Question("Quelle est la capitale de la France?", ["Paris", "Londres", "Berlin", "Madrid"], 1, 1)
-        with patch('builtins.input', return_value="2"):
+        with patch('saisie.lecteur', LecteurEntree(io.StringIO("2\n"))):
             self.assertFalse(question.poser(self.presentateur, self.joueur))
             self.assertEqual(self.joueur.score, 0)
 
+    def test_poser_temps_ecoule(self):
+        question = Question("Quelle est la capitale de la France?", ["Paris", "Londres", "Berlin", "Madrid"], 1, 1)
+        with patch('saisie.temps_limite', return_value=0.05), \
+                patch('saisie.lecteur', LecteurEntree(FluxLent(0.3, "1\n"))):
+            self.assertFalse(question.poser(self.presentateur, self.joueur))
+            self.assertEqual(self.joueur.score, 0)
+
+    def test_poser_repete_redemande_la_reponse(self):
+        question = Question("Quelle est la capitale de la France?", ["Paris", "Londres", "Berlin", "Madrid"], 1, 1)
+        with patch('saisie.lecteur', LecteurEntree(io.StringIO("1\n2\n"))):
+            self.assertTrue(question.poser(self.presentateur, self.joueur))
+            self.assertFalse(question.poser(self.presentateur, self.joueur))
+        self.assertEqual(self.joueur.score, 1)
+
+    def test_poser_ecrit_sur_la_sortie_du_presentateur(self):
+        messages = []
+        presentateur = Presentateur("Jean-Luc Reichmann", sortie=messages.append)
+        question = Question("Quelle est la capitale de la France?", ["Paris", "Londres"], 1, 1)
+        with patch('saisie.lecteur', LecteurEntree(io.StringIO("1\n"))), \
+                patch('builtins.print') as affichage:
+            self.assertTrue(question.poser(presentateur, self.joueur))
+        self.assertIn(question.rendu(), messages)
+        self.assertNotIn(call(question.rendu()), affichage.call_args_list)
+
+    def test_rendu_en_cache(self):
+        question = Question("Quelle est la capitale de la France?", ["Paris", "Londres"], 1, 1, identifiant="capitale")
+        cache_rendus.invalider("capitale")
+        self.assertEqual(question.rendu(), "\nQuelle est la capitale de la France?\n1. Paris\n2. Londres")
+        self.assertIs(question.rendu(), question.rendu())
+        self.assertEqual(question.texte_vocal("en"),
+                         "Question : Quelle est la capitale de la France? Answer 1 : Paris. Answer 2 : Londres.")
+        with self.assertRaises(ValueError):
+            question.texte_vocal("de")
+
+    def test_meme_enonce_options_differentes(self):
+        premiere = Question("Combien ?", ["1", "2"], 1, 1)
+        seconde = Question("Combien ?", ["3", "4"], 1, 1)
+        self.assertNotEqual(premiere.identifiant, seconde.identifiant)
+        self.assertEqual(premiere.rendu(), "\nCombien ?\n1. 1\n2. 2")
+        self.assertEqual(seconde.rendu(), "\nCombien ?\n1. 3\n2. 4")
+        self.assertEqual(Question("Combien ?", ["1", "2"], 2, 1).identifiant, premiere.identifiant)
+
+    def test_cache_borne(self):
+        cache = CacheRendus(taille_max=2)
+        for identifiant in ("a", "b", "a", "c"):
+            cache.obtenir((identifiant, "fr", "texte"), lambda: identifiant.upper())
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.succes, cache.echecs), (1, 3))
+        cache.invalider("a")
+        self.assertEqual(len(cache), 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,89 @@
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+import saisie
+from saisie import LecteurEntree, temps_limite
+
+class FluxLent:
+    """
+    Flux sans descripteur dont chaque ligne arrive après un délai.
+    """
+
+    def __init__(self, delai, *lignes):
+        self.delai = delai
+        self.lignes = list(lignes)
+
+    def readline(self):
+        time.sleep(self.delai)
+        return self.lignes.pop(0) if self.lignes else ""
+
+class TestSaisie(unittest.TestCase):
+
+    def test_temps_limite(self):
+        self.assertEqual([temps_limite(d) for d in (1, 2, 3)], [5, 7, 10])
+
+    def test_lecture_avant_echeance(self):
+        self.assertEqual(LecteurEntree(io.StringIO("2\n")).lire("> ", saisie.horloge() + 1), "2")
+
+    def test_echeance_depassee_par_fil(self):
+        lecteur = LecteurEntree(FluxLent(0.3, "1\n", "2\n"))
+        debut = saisie.horloge()
+        self.assertIsNone(lecteur.lire("> ", debut + 0.05))
+        self.assertLess(saisie.horloge() - debut, 0.25)
+        # La ligne tapée trop tard ne compte pas pour la question suivante.
+        time.sleep(0.3)
+        self.assertEqual(lecteur.lire("> ", saisie.horloge() + 1), "2")
+
+    def test_fichier_lu_ligne_a_ligne(self):
+        with tempfile.TemporaryFile("w+") as fichier:
+            fichier.write("1\n2\n")
+            fichier.seek(0)
+            lecteur = LecteurEntree(fichier)
+            self.assertEqual([lecteur.lire("> ", saisie.horloge() + 1) for _ in range(2)], ["1", "2"])
+            with self.assertRaises(EOFError):
+                lecteur.lire("> ", saisie.horloge() + 1)
+
+    @unittest.skipUnless(os.path.exists(os.devnull), "pas de /dev/null")
+    def test_dev_null(self):
+        with open(os.devnull) as flux, self.assertRaises(EOFError):
+            LecteurEntree(flux).lire("> ", saisie.horloge() + 1)
+
+    @unittest.skipUnless(os.name == "posix", "selectors sur tube POSIX")
+    def test_lignes_arrivees_ensemble_sur_un_tube(self):
+        lecture, ecriture = os.pipe()
+        with os.fdopen(lecture) as flux:
+            os.write(ecriture, b"1\n2\n")
+            os.close(ecriture)
+            lecteur = LecteurEntree(flux)
+            self.assertEqual([lecteur.lire("> ", saisie.horloge() + 0.2) for _ in range(2)], ["1", "2"])
+            with self.assertRaises(EOFError):
+                lecteur.lire("> ", saisie.horloge() + 0.2)
+
+    @unittest.skipUnless(os.name == "posix", "selectors sur tube POSIX")
+    def test_echeance_par_selecteur(self):
+        lecture, ecriture = os.pipe()
+        with os.fdopen(lecture) as flux, os.fdopen(ecriture, "w") as sortie:
+            lecteur = LecteurEntree(flux)
+            debut = saisie.horloge()
+            self.assertIsNone(lecteur.lire("> ", debut + 0.05))
+            self.assertLess(saisie.horloge() - debut, 0.25)
+            sortie.write("3\n")
+            sortie.flush()
+            self.assertEqual(lecteur.lire("> ", saisie.horloge() + 1), "3")
+
+    @unittest.skipUnless(os.name == "posix", "terminal POSIX (pty)")
+    def test_frappe_avant_l_invite_ignoree_sur_un_terminal(self):
+        maitre, esclave = os.openpty()
+        with os.fdopen(esclave) as flux:
+            lecteur = LecteurEntree(flux)
+            os.write(maitre, b"1\n")  # Tapé après l'échéance de la question précédente
+            time.sleep(0.05)
+            threading.Timer(0.1, os.write, (maitre, b"2\n")).start()
+            self.assertEqual(lecteur.lire("> ", saisie.horloge() + 1), "2")
+        os.close(maitre)
+
+if __name__ == '__main__':
+    unittest.main()
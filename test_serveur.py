@@ -0,0 +1,87 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from client_jeu import bot, charge
+from journal_scores import JournalScores
+from serveur import ServeurJeu, decoder_message, decoder_reponse
+from statistiques_reponses import AnalyseReponses
+
+class TestServeur(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.scores = JournalScores(os.path.join(self.dossier.name, "scores.db"))
+        self.serveur = ServeurJeu(nb_tours=3, max_sessions=2, scores=self.scores)
+        instance = await self.serveur.demarrer("127.0.0.1", 0)
+        self.port = instance.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.serveur.arreter()
+        self.scores.close()
+        self.dossier.cleanup()
+
+    def test_decoder_reponse(self):
+        self.assertEqual(decoder_reponse(b'{"reponse": 2}\n'), 2)
+        self.assertEqual(decoder_reponse(b"3\n"), 3)
+        self.assertIsNone(decoder_reponse(b"deux\n"))
+        self.assertEqual(decoder_message(b'{"reponse": 2, "numero": 4}\n'), (4, 2))
+
+    async def test_reponse_tardive_ignoree(self):
+        self.serveur.analyse = AnalyseReponses()
+        self.serveur.nb_tours = 2
+        with patch("serveur.temps_limite", return_value=0.2):
+            lecteur, ecrivain = await asyncio.open_connection("127.0.0.1", self.port)
+            ecrivain.write(b'{"nom": "Alice"}\n')
+            while json.loads(await lecteur.readline())["type"] != "question":
+                pass
+            await asyncio.sleep(0.3)
+            # Arrivée après le délai de la question 1, pendant la question 2
+            ecrivain.write(b'{"reponse": 1, "numero": 1}\n')
+            while json.loads(await lecteur.readline())["type"] != "fin":
+                pass
+            ecrivain.close()
+        self.assertEqual(sum(s.expirees for s in self.serveur.analyse.par_difficulte.values()), 2)
+
+    async def test_partie_complete(self):
+        score = await bot("Alice", "127.0.0.1", self.port, None)
+        self.assertIsNotNone(score)
+        self.assertEqual(self.serveur.parties_terminees, 1)
+        self.assertEqual(self.serveur.sessions, 0)
+        self.assertEqual(self.scores["Alice"]["total"], score)
+
+    async def test_bienvenue_qui_n_est_pas_un_objet(self):
+        for bonjour in (b"[]\n", b"1\n"):
+            with self.assertLogs(level="INFO") as journal:
+                lecteur, ecrivain = await asyncio.open_connection("127.0.0.1", self.port)
+                ecrivain.write(bonjour)
+                self.assertEqual(await lecteur.read(), b"")
+                ecrivain.close()
+            self.assertIn("Message de bienvenue invalide", journal.output[0])
+        self.assertEqual(self.serveur.sessions, 0)
+        self.assertEqual(self.serveur.parties_terminees, 0)
+
+    async def test_scores_enregistres_hors_de_la_boucle(self):
+        fils = []
+        enregistrer = self.scores.enregistrer_partie
+        def enregistrer_partie(resultats):
+            fils.append(threading.current_thread())
+            enregistrer(resultats)
+        with patch.object(self.scores, "enregistrer_partie", enregistrer_partie):
+            await bot("Alice", "127.0.0.1", self.port, None)
+        self.assertEqual(len(fils), 1)
+        self.assertIsNot(fils[0], threading.main_thread())
+
+    async def test_limite_de_connexions(self):
+        self.serveur.max_sessions = 0
+        self.assertIsNone(await bot("Bob", "127.0.0.1", self.port, None))
+
+    async def test_charge_locale(self):
+        resultat = await charge(50, nb_tours=2)
+        self.assertEqual(resultat["parties"], 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+from jeu import Question, QUESTIONS_INTEGREES
+from sources_questions import SourceListe
+from simulation import Strategie, Simulateur, SimulateurParallele, ToujoursJuste, PrecisionParDifficulte, ReponseApres, TempsUniforme
+
+class TestSimulation(unittest.TestCase):
+
+    def test_toujours_juste_bat_toujours_faux(self):
+        resultats = Simulateur(graine=1).simuler(50, [ToujoursJuste(), PrecisionParDifficulte(0.0, nom="Toujours faux")])
+        resume = resultats.resume()
+        self.assertEqual(resume[1]["max"], 0)
+        self.assertGreater(resume[0]["min"], 0)
+        self.assertEqual(resume[0]["victoires"], 50)
+
+    def test_reponse_trop_lente_ne_rapporte_rien(self):
+        resultats = Simulateur(graine=1).simuler(10, [ReponseApres(11)])
+        self.assertEqual(resultats.resume()[0]["max"], 0)
+
+    def test_simulation_reproductible(self):
+        strategies = [PrecisionParDifficulte({1: 0.9, 2: 0.6, 3: 0.3})]
+        self.assertEqual(Simulateur(graine=7).simuler(20, strategies).scores,
+                         Simulateur(graine=7).simuler(20, strategies).scores)
+
+    def test_pas_de_question_repetee_dans_une_partie(self):
+        simulateur = Simulateur(nb_tours=7, graine=3)
+        posees = []
+        strategie = ReponseApres(0, ToujoursJuste())
+        strategie.repondre = lambda question, joueur, rng: (posees.append(question.enonce), (1, 0.0))[1]
+        simulateur.jouer_partie([strategie, strategie, strategie])
+        self.assertEqual(len(posees), len(set(posees)))
+
+    def test_partie_avec_duel_et_etoile_mysterieuse(self):
+        simulateur = Simulateur(nb_tours=1, graine=3)
+        posees = []
+        strategie = ReponseApres(0, ToujoursJuste())
+        strategie.repondre = lambda question, joueur, rng: (posees.append(joueur.nom), (question.reponse_correcte, 0.0))[1]
+        scores = simulateur.jouer_partie([strategie, strategie])
+        # Un tour chacun, trois questions de duel chacun, puis cinq questions d'Étoile pour le vainqueur
+        self.assertEqual(posees.count("Joueur 1"), 9)
+        self.assertEqual(posees.count("Joueur 2"), 4)
+        self.assertGreater(scores[0], scores[1])
+
+    def test_question_a_une_seule_option(self):
+        question = Question("Seule ?", ["Oui"], 1, 2, "", "")
+        self.assertEqual(PrecisionParDifficulte(0.0).repondre(question, None, random.Random(1)), (1, 0.0))
+
+    def test_strategie_abstraite(self):
+        with self.assertRaises(TypeError):
+            Strategie()
+
+    def test_reinitialiser_comme_un_simulateur_neuf(self):
+        # Plus de questions qu'une page : la page chargée dépend des parties déjà jouées
+        source = SourceListe([dict(QUESTIONS_INTEGREES[i % 21], theme=f"Thème {i}") for i in range(1000)])
+        strategies = [PrecisionParDifficulte(0.7), ToujoursJuste()]
+        simulateur = Simulateur(source, graine=1)
+        simulateur.simuler(20, strategies)
+        simulateur.reinitialiser(2)
+        self.assertEqual(simulateur.simuler(10, strategies).scores,
+                         Simulateur(source, graine=2).simuler(10, strategies).scores)
+
+    def test_parallele_reproductible_quel_que_soit_le_nombre_de_processus(self):
+        strategies = [PrecisionParDifficulte(0.7), ReponseApres(TempsUniforme(2, 9))]
+        un = SimulateurParallele(graine=5, nb_processus=1, taille_lot=7).simuler(30, strategies)
+        deux = SimulateurParallele(graine=5, nb_processus=2, taille_lot=7).simuler(30, strategies)
+        self.assertEqual(len(un.scores), 30)
+        self.assertEqual(un.scores, deux.scores)
+        self.assertTrue(all(debit > 0 for debit in deux.debits.values()))
+
+    def test_lots_renvoyes_au_fil_de_l_eau(self):
+        lots = list(SimulateurParallele(graine=1, nb_processus=2, taille_lot=4).lots(10, [ToujoursJuste()]))
+        self.assertEqual(sorted(len(lot.scores) for lot in lots), [2, 4, 4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import io
+import queue
+import unittest
+from sorties import Sortie, SortieTerminal, SortieTamponnee, SortieFile, SortieNulle, vider_sortie
+
+class TestSorties(unittest.TestCase):
+
+    def test_sortie_abstraite(self):
+        with self.assertRaises(TypeError):
+            Sortie()
+
+    def test_terminal(self):
+        flux = io.StringIO()
+        sortie = SortieTerminal(flux)
+        sortie("a")
+        sortie("b")
+        self.assertEqual(flux.getvalue(), "a\nb\n")
+
+    def test_tamponnee_un_bloc_par_vidage(self):
+        blocs = []
+        sortie = SortieTamponnee(blocs.append)
+        sortie("Question")
+        sortie("1. Oui")
+        self.assertEqual(blocs, [])
+        sortie.vider()
+        sortie.vider()
+        self.assertEqual(blocs, ["Question\n1. Oui"])
+
+    def test_file(self):
+        file = queue.Queue()
+        sortie = SortieFile(file)
+        sortie("Bonjour")
+        sortie.vider()
+        self.assertEqual(file.get_nowait(), "Bonjour")
+
+    def test_nulle_et_fonction(self):
+        SortieNulle()("rien")
+        vider_sortie(SortieNulle())
+        vider_sortie(print)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from create_questions_db import create_database, add_question
+from sources_questions import SourceListe, SourceJSONL, SourceCSV, SourceSQLite, PaginateurQuestions
+
+QUESTION = {"question": "Quelle est la capitale de la France?", "options": ["Paris", "Londres", "Berlin", "Madrid"],
+            "correct_option": 1, "difficulty": "facile", "theme": "Géographie", "explication": "Paris."}
+ATTENDU = ("Quelle est la capitale de la France?", ["Paris", "Londres", "Berlin", "Madrid"], 1, 1, "Géographie", "Paris.")
+
+class TestSourcesQuestions(unittest.TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def chemin(self, nom):
+        return os.path.join(self.dossier.name, nom)
+
+    def test_source_jsonl(self):
+        with open(self.chemin("q.jsonl"), "w", encoding="utf-8") as f:
+            f.write(json.dumps(QUESTION) + "\n\n")
+        self.assertEqual(list(SourceJSONL(self.chemin("q.jsonl"))), [ATTENDU])
+
+    def test_source_csv(self):
+        with open(self.chemin("q.csv"), "w", encoding="utf-8") as f:
+            f.write("question,options,correct_option,difficulty,theme,explication\n")
+            f.write("Quelle est la capitale de la France?,Paris|Londres|Berlin|Madrid,1,facile,Géographie,Paris.\n")
+        self.assertEqual(list(SourceCSV(self.chemin("q.csv"))), [ATTENDU])
+
+    def test_source_sqlite(self):
+        db = self.chemin("questions.db")
+        create_database(db)
+        add_question(db, "Question sans options", "Contexte")
+        add_question(db, QUESTION["question"], "Contexte", QUESTION["options"], 1, "facile", "Géographie", "Paris.")
+        self.assertEqual(list(SourceSQLite(db)), [ATTENDU])
+
+    def test_lecture_depuis_une_position(self):
+        questions = [dict(QUESTION, question=f"Q{i}") for i in range(5)]
+        with open(self.chemin("q.jsonl"), "w", encoding="utf-8") as f:
+            for question in questions:
+                f.write(json.dumps(question) + "\n\n")
+        db = self.chemin("questions.db")
+        create_database(db)
+        add_question(db, "Question sans options", "Contexte")
+        for question in questions:
+            add_question(db, question["question"], "Contexte", question["options"], 1, "facile")
+        self.assertEqual(len(SourceListe(questions)), 5)
+        for source in (SourceListe(questions), SourceJSONL(self.chemin("q.jsonl")), SourceSQLite(db)):
+            self.assertEqual([q[0] for q in source.depuis(3)], ["Q3", "Q4"])
+
+    def test_theme_et_explication_absents(self):
+        db = self.chemin("questions.db")
+        create_database(db)
+        add_question(db, QUESTION["question"], "Contexte", QUESTION["options"], 1, "facile")
+        sans_theme = {cle: valeur for cle, valeur in QUESTION.items() if cle not in ("theme", "explication")}
+        attendu = ATTENDU[:4] + ("", "")
+        self.assertEqual(list(SourceSQLite(db)), [attendu])
+        self.assertEqual(list(SourceListe([sans_theme, dict(QUESTION, theme=None, explication=None)])),
+                         [attendu, attendu])
+
+    def test_conversion_une_fois_par_libelle(self):
+        convertir = Mock(return_value=1)
+        list(SourceListe([QUESTION] * 10, convertir))
+        convertir.assert_called_once_with("facile")
+
+    def test_paginateur_borne_et_recommence(self):
+        paginateur = PaginateurQuestions(SourceListe([QUESTION] * 5), lambda *e: e, taille_page=2)
+        self.assertEqual([len(paginateur.page_suivante()) for _ in range(4)], [2, 2, 1, 2])
+
+    def test_paginateur_position_des_pages(self):
+        paginateur = PaginateurQuestions(SourceListe([QUESTION] * 5), lambda *e: e, taille_page=2)
+        debuts = []
+        for _ in range(4):
+            paginateur.page_suivante()
+            debuts.append(paginateur.debut)
+        self.assertEqual(debuts, [0, 2, 4, 0])
+
+    def test_paginateur_depart(self):
+        questions = [dict(QUESTION, question=f"Q{i}") for i in range(5)]
+        paginateur = PaginateurQuestions(SourceListe(questions), lambda *e: e[0], taille_page=2, depart=3)
+        self.assertEqual([paginateur.page_suivante() for _ in range(3)], [["Q3", "Q4"], ["Q0", "Q1"], ["Q2", "Q3"]])
+
+    def test_paginateur_source_vide(self):
+        with self.assertRaises(ValueError):
+            PaginateurQuestions(SourceListe([]), lambda *e: e).page_suivante()
+
+if __name__ == '__main__':
+    unittest.main()
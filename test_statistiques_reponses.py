@@ -0,0 +1,96 @@
+import json
+import os
+import statistics
+import tempfile
+import unittest
+from simulation import JeuSimule, ReponseApres, ToujoursJuste
+from jeu import Joueur
+from statistiques_reponses import AnalyseReponses, DigestQuantiles, Moments, StatistiquesReponses
+
+def valeurs(n):
+    # Permutation déterministe de 0, 0.1, ..., (n - 1) / 10.
+    return [(i * 7919 % n) / 10 for i in range(n)]
+
+class Question:
+    def __init__(self, enonce, theme, difficulte):
+        self.enonce = enonce
+        self.theme = theme
+        self.difficulte = difficulte
+
+class TestStatistiquesReponses(unittest.TestCase):
+
+    def test_moments_et_fusion(self):
+        donnees = valeurs(1000)
+        moments, gauche, droite = Moments(), Moments(), Moments()
+        for i, valeur in enumerate(donnees):
+            moments.ajouter(valeur)
+            (gauche if i < 300 else droite).ajouter(valeur)
+        gauche.fusionner(droite)
+        for m in (moments, gauche):
+            self.assertAlmostEqual(m.moyenne, statistics.mean(donnees))
+            self.assertAlmostEqual(m.variance, statistics.variance(donnees), places=6)
+
+    def test_quantiles_precis_et_memoire_bornee(self):
+        digest = DigestQuantiles()
+        for valeur in valeurs(100000):
+            digest.ajouter(valeur)
+        self.assertAlmostEqual(digest.quantile(0.5), 5000, delta=50)
+        self.assertAlmostEqual(digest.quantile(0.95), 9500, delta=50)
+        self.assertEqual((digest.quantile(0), digest.quantile(1)), (0, 9999.9))
+        self.assertLessEqual(len(digest.moyennes), digest.compression)
+        self.assertIsNone(DigestQuantiles().quantile(0.5))
+        with self.assertRaises(ValueError):
+            digest.quantile(1.5)
+
+    def test_fusion_des_esquisses(self):
+        parties = [DigestQuantiles() for _ in range(4)]
+        for i, valeur in enumerate(valeurs(20000)):
+            parties[i % 4].ajouter(valeur)
+        for partie in parties[1:]:
+            parties[0].fusionner(partie)
+        self.assertEqual(len(parties[0]), 20000)
+        self.assertAlmostEqual(parties[0].quantile(0.95), 1900, delta=20)
+
+    def test_precision_et_temps_ecoules(self):
+        statistiques = StatistiquesReponses()
+        statistiques.ajouter(True, 2.0)
+        statistiques.ajouter(False, 4.0)
+        statistiques.ajouter(False, 10.0, expiree=True)
+        resume = statistiques.resume()
+        self.assertEqual((resume["posees"], resume["expirees"]), (3, 1))
+        self.assertAlmostEqual(resume["precision"], 1 / 3)
+        self.assertEqual(resume["latence_moyenne"], 3.0)
+
+    def test_analyse_fusionnable_via_json(self):
+        analyses = [AnalyseReponses(), AnalyseReponses()]
+        question = Question("Capitale ?", "Géographie", 1)
+        for i, valeur in enumerate(valeurs(500)):
+            analyses[i % 2].enregistrer(question, i % 3 == 0, valeur)
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, "stats.json")
+            analyses[1].sauvegarder(chemin)
+            with open(chemin, encoding="utf-8") as f:
+                json.load(f)
+            analyses[0].fusionner(AnalyseReponses.charger(chemin))
+        resume = analyses[0].resume()
+        self.assertEqual(resume["questions"]["Capitale ?"]["posees"], 500)
+        self.assertEqual(resume["themes"]["Géographie"]["posees"], 500)
+        self.assertAlmostEqual(resume["difficultes"][1]["latence_moyenne"], 24.95)
+        self.assertAlmostEqual(resume["difficultes"][1]["precision"], 167 / 500)
+
+    def test_jeu_alimente_l_analyse(self):
+        import random
+        jeu = JeuSimule(rng=random.Random(1))
+        jeu.analyse = AnalyseReponses()
+        jeu.strategies = {"Alice": ReponseApres(3.0, ToujoursJuste()), "Bob": ReponseApres(20.0)}
+        alice, bob = Joueur("Alice"), Joueur("Bob")
+        for _ in range(4):
+            jeu.jouer_tour(alice)
+            jeu.jouer_tour(bob)
+        resumes = [s.resume() for s in jeu.analyse.par_difficulte.values()]
+        self.assertEqual(sum(r["posees"] for r in resumes), 8)
+        self.assertEqual(sum(r["expirees"] for r in resumes), 4)
+        self.assertEqual({r["latence_moyenne"] for r in resumes if r["latence_moyenne"] is not None}, {3.0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import threading
+import unittest
+from synthese_vocale import MoteurNul, TravailleurVocal
+
+class MoteurBloquant(MoteurNul):
+
+    def __init__(self):
+        super().__init__()
+        self.debloquer = threading.Event()
+
+    def runAndWait(self):
+        self.debloquer.wait()
+        super().runAndWait()
+
+class TestSyntheseVocale(unittest.TestCase):
+
+    def test_moteur_reutilise_et_ordre_conserve(self):
+        moteurs = []
+        def fabrique():
+            moteurs.append(MoteurNul())
+            return moteurs[-1]
+        voix = TravailleurVocal(fabrique)
+        for texte in ("contexte", "question", "Merci"):
+            voix.dire(texte)
+        voix.arreter()
+        self.assertEqual(len(moteurs), 1)
+        self.assertEqual(moteurs[0].textes, ["contexte", "question", "Merci"])
+
+    def test_dire_ne_bloque_pas(self):
+        moteur = MoteurBloquant()
+        voix = TravailleurVocal(lambda: moteur)
+        voix.dire("longue phrase")
+        voix.dire("suivante")
+        self.assertEqual(moteur.textes, [])
+        moteur.debloquer.set()
+        voix.vider()
+        self.assertEqual(moteur.textes, ["longue phrase", "suivante"])
+        voix.arreter()
+
+    def test_annuler_abandonne_les_phrases_en_attente(self):
+        moteur = MoteurBloquant()
+        voix = TravailleurVocal(lambda: moteur)
+        voix.dire("en cours")
+        voix.dire("abandonnée")
+        voix.annuler()
+        moteur.debloquer.set()
+        voix.dire("après annulation")
+        voix.arreter()
+        self.assertNotIn("abandonnée", moteur.textes)
+        self.assertIn("après annulation", moteur.textes)
+
+    def test_echec_du_moteur(self):
+        def fabrique():
+            raise RuntimeError("pas de sortie audio")
+        voix = TravailleurVocal(fabrique)
+        voix.dire("texte")
+        voix.arreter()
+        self.assertEqual(voix.moteur.textes, ["texte"])
+
+if __name__ == '__main__':
+    unittest.main()
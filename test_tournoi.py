@@ -0,0 +1,37 @@
+import unittest
+from simulation import ToujoursJuste, PrecisionParDifficulte
+from tournoi import Tournoi
+
+def participants(n, strategie):
+    return [(f"Joueur {i}", strategie) for i in range(n)]
+
+class TestTournoi(unittest.TestCase):
+
+    def test_eliminations_jusqu_aux_finalistes(self):
+        tournoi = Tournoi(participants(300, PrecisionParDifficulte(0.6)), finalistes=8, graine=3)
+        tournoi.jouer()
+        self.assertEqual(sum(len(manche["elimines"]) for manche in tournoi.manches), 292)
+        self.assertEqual(len(tournoi.duels), 7)
+        for manche in tournoi.manches:
+            self.assertLessEqual(len(manche["elimines"]), manche["tables"])
+
+    def test_egalites_deterministes(self):
+        tournoi = Tournoi(participants(50, PrecisionParDifficulte(0.0)), finalistes=5, graine=1)
+        self.assertEqual(tournoi.jouer().nom, "Joueur 0")
+
+    def test_meilleur_joueur_gagne(self):
+        joueurs = participants(60, PrecisionParDifficulte(0.0)) + [("Champion", ToujoursJuste())]
+        self.assertEqual(Tournoi(joueurs, graine=2).jouer().nom, "Champion")
+
+    def test_reproductible(self):
+        resultats = [Tournoi(participants(100, PrecisionParDifficulte(0.5)), graine=9).jouer().nom for _ in range(2)]
+        self.assertEqual(resultats[0], resultats[1])
+
+    def test_parametres_invalides(self):
+        with self.assertRaises(ValueError):
+            Tournoi(participants(1, ToujoursJuste()))
+        with self.assertRaises(ValueError):
+            Tournoi([("A", ToujoursJuste()), ("A", ToujoursJuste())])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from verification_environnement import verifier_environnement, calculer_empreinte
+
+class TestVerificationEnvironnement(unittest.TestCase):
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.repertoire = self.dossier.name
+        with open(os.path.join(self.repertoire, "requirements.txt"), "w") as f:
+            f.write("json\n")
+        with open(os.path.join(self.repertoire, "jeu.py"), "w") as f:
+            f.write("print('jeu')\n")
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_cache_ignore_deuxieme_demarrage(self):
+        etape = Mock()
+        self.assertTrue(verifier_environnement([etape], mode="cache", repertoire=self.repertoire))
+        self.assertFalse(verifier_environnement([etape], mode="cache", repertoire=self.repertoire))
+        self.assertEqual(etape.call_count, 1)
+
+    def test_cache_invalide_si_source_modifiee(self):
+        etape = Mock()
+        verifier_environnement([etape], mode="cache", repertoire=self.repertoire)
+        with open(os.path.join(self.repertoire, "jeu.py"), "a") as f:
+            f.write("print('modifié')\n")
+        self.assertTrue(verifier_environnement([etape], mode="cache", repertoire=self.repertoire))
+        self.assertEqual(etape.call_count, 2)
+
+    def test_empreinte_depend_des_exigences(self):
+        avant = calculer_empreinte(self.repertoire)
+        with open(os.path.join(self.repertoire, "requirements.txt"), "a") as f:
+            f.write("psutil\n")
+        self.assertNotEqual(avant, calculer_empreinte(self.repertoire))
+
+    def test_modes_toujours_et_desactive(self):
+        etape = Mock()
+        verifier_environnement([etape], mode="toujours", repertoire=self.repertoire)
+        verifier_environnement([etape], mode="toujours", repertoire=self.repertoire)
+        self.assertFalse(verifier_environnement([etape], mode="desactive", repertoire=self.repertoire))
+        self.assertEqual(etape.call_count, 2)
+
+    def test_mode_inconnu(self):
+        with self.assertRaises(ValueError):
+            verifier_environnement([], mode="parfois", repertoire=self.repertoire)
+
+if __name__ == '__main__':
+    unittest.main()
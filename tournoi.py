@@ -0,0 +1,150 @@
+import heapq
+import random
+import time
+from jeu import Joueur
+from simulation import JeuSimule, PrecisionParDifficulte, sortie_nulle
+
+TAILLE_TABLE = 3
+QUESTIONS_PAR_MANCHE = 3
+FINALISTES = 8
+
+
+class Tournoi:
+    """
+    Tournoi à élimination pour un grand nombre de joueurs simulés.
+
+    À chaque manche, les joueurs encore en lice sont répartis en tables indépendantes
+    de taille_table à 2 * taille_table - 1 joueurs, qui jouent chacune leurs questions
+    dans leur propre session de tirage. Le plus faible de chaque table est éliminé
+    (si l'on éliminait plus de joueurs qu'il n'en faut pour atteindre les finalistes,
+    seuls les plus faibles de ces perdants sortent). Une manche coûte O(n log n) au
+    plus, jamais O(n²). Les finalistes sont ensuite placés dans un tableau de duels
+    (le mieux classé contre le moins bien classé) jusqu'au vainqueur.
+
+    Les égalités sont départagées de façon déterministe : points de la manche, puis
+    score total, puis ordre d'inscription (le premier inscrit est devant).
+    """
+
+    def __init__(self, participants, taille_table=TAILLE_TABLE, questions_par_manche=QUESTIONS_PAR_MANCHE,
+                 finalistes=FINALISTES, source=None, graine=None, sortie=sortie_nulle):
+        """
+        Args:
+            participants (list): Couples (nom, stratégie), dans l'ordre d'inscription.
+            taille_table (int): Le nombre minimal de joueurs par table (au moins 2).
+            questions_par_manche (int): Le nombre de questions posées à chaque joueur par manche.
+            finalistes (int): Le nombre de joueurs qualifiés pour le tableau des duels.
+            source (SourceQuestions): La source de questions (questions intégrées par défaut).
+            graine (int, optional): La graine du générateur aléatoire, pour des tournois reproductibles.
+            sortie (callable): La sortie des messages du jeu.
+
+        Raises:
+            ValueError: Si les paramètres ne permettent pas de tenir le tournoi.
+        """
+        if len(participants) < 2:
+            raise ValueError("Un tournoi demande au moins deux participants.")
+        if taille_table < 2 or finalistes < 1:
+            raise ValueError("Il faut au moins deux joueurs par table et au moins un finaliste.")
+        noms = [nom for nom, _ in participants]
+        if len(set(noms)) != len(noms):
+            raise ValueError("Les noms des participants doivent être distincts.")
+        self.rng = random.Random(graine)
+        self.jeu = JeuSimule(source, self.rng, sortie)
+        self.jeu.strategies = dict(participants)
+        self.joueurs = [Joueur(nom) for nom in noms]
+        self._ordre = {nom: numero for numero, nom in enumerate(noms)}
+        self.taille_table = taille_table
+        self.questions_par_manche = questions_par_manche
+        self.finalistes = finalistes
+        self.manches = []
+        self.duels = []
+
+    def _tables(self, joueurs):
+        nb_tables = max(1, len(joueurs) // self.taille_table)
+        melanges = joueurs[:]
+        self.rng.shuffle(melanges)
+        return [melanges[i::nb_tables] for i in range(nb_tables)]
+
+    def _cle_manche(self, depart):
+        # Points de la manche, puis score total, puis ordre d'inscription : la plus petite clé sort.
+        return lambda joueur: (joueur.score - depart[joueur.nom], joueur.score, -self._ordre[joueur.nom])
+
+    def _cle_classement(self, joueur):
+        return joueur.score, -self._ordre[joueur.nom]
+
+    def _jouer_table(self, table, cle):
+        self.jeu.nouvelle_partie()
+        for _ in range(self.questions_par_manche):
+            for joueur in table:
+                self.jeu.jouer_tour(joueur)
+        return min(table, key=cle)
+
+    def jouer_manche(self, joueurs):
+        """
+        Joue une manche d'élimination.
+
+        Args:
+            joueurs (list): Les joueurs encore en lice.
+
+        Returns:
+            list: Les joueurs qualifiés pour la manche suivante, dans l'ordre d'inscription.
+        """
+        debut = time.perf_counter()
+        cle = self._cle_manche({joueur.nom: joueur.score for joueur in joueurs})
+        perdants = [self._jouer_table(table, cle) for table in self._tables(joueurs)]
+        a_eliminer = min(len(perdants), len(joueurs) - self.finalistes)
+        elimines = heapq.nsmallest(a_eliminer, perdants, key=cle)
+        noms_elimines = {joueur.nom for joueur in elimines}
+        for joueur in elimines:
+            self.jeu.presentateur.annoncer_elimination(joueur)
+        self.manches.append({"joueurs": len(joueurs), "tables": len(perdants),
+                             "elimines": [joueur.nom for joueur in elimines],
+                             "duree": time.perf_counter() - debut})
+        return [joueur for joueur in joueurs if joueur.nom not in noms_elimines]
+
+    def jouer_tableau(self, finalistes):
+        """
+        Joue le tableau final : le mieux classé affronte le moins bien classé, le premier
+        tête de série est exempté si le nombre de joueurs est impair.
+
+        Args:
+            finalistes (list): Les joueurs qualifiés.
+
+        Returns:
+            Joueur: Le vainqueur du tournoi.
+        """
+        restants = heapq.nlargest(len(finalistes), finalistes, key=self._cle_classement)
+        while len(restants) > 1:
+            qualifies = [restants[0]] if len(restants) % 2 else []
+            debut = len(qualifies)
+            for i in range(debut, debut + (len(restants) - debut) // 2):
+                joueur1, joueur2 = restants[i], restants[len(restants) - 1 - i + debut]
+                vainqueur = self.jeu.duel_final(joueur1, joueur2)
+                self.duels.append((joueur1.nom, joueur2.nom, vainqueur.nom))
+                qualifies.append(vainqueur)
+            restants = qualifies
+        return restants[0]
+
+    def jouer(self):
+        """
+        Joue le tournoi complet : manches d'élimination puis tableau des duels.
+
+        Returns:
+            Joueur: Le vainqueur du tournoi.
+        """
+        joueurs = self.joueurs
+        while len(joueurs) > self.finalistes:
+            joueurs = self.jouer_manche(joueurs)
+        return self.jouer_tableau(joueurs)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    participants = [(f"Joueur {i}", PrecisionParDifficulte(rng.uniform(0.3, 0.95), nom=f"Joueur {i}"))
+                    for i in range(5000)]
+    debut = time.perf_counter()
+    tournoi = Tournoi(participants, graine=0)
+    champion = tournoi.jouer()
+    print(f"Vainqueur : {champion.nom} (précision {tournoi.jeu.strategies[champion.nom].precisions[1]:.2f})")
+    print(f"{len(tournoi.manches)} manches, {len(tournoi.duels)} duels en {time.perf_counter() - debut:.1f}s")
+    for numero, manche in enumerate(tournoi.manches[:3], 1):
+        print(f"Manche {numero} : {manche['joueurs']} joueurs, {manche['tables']} tables, {manche['duree'] * 1000:.0f} ms")
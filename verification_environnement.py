@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import sys
+import time
+from importlib import metadata
+
+FICHIER_EXIGENCES = "requirements.txt"
+FICHIER_CACHE = ".verification_cache.json"
+VARIABLE_MODE = "QUIZ_VERIFICATION"
+
+MODE_CACHE = "cache"
+MODE_TOUJOURS = "toujours"
+MODE_DESACTIVE = "desactive"
+MODES = (MODE_CACHE, MODE_TOUJOURS, MODE_DESACTIVE)
+
+
+def _version_installee(module):
+    """
+    Retourne la version installée d'une distribution, ou None si elle est absente.
+
+    Args:
+        module (str): Le nom de la distribution.
+
+    Returns:
+        str: La version installée, ou None.
+    """
+    try:
+        return metadata.version(module)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def calculer_empreinte(repertoire="."):
+    """
+    Calcule l'empreinte de l'environnement : contenu de requirements.txt,
+    versions installées des modules requis et contenu des sources Python.
+
+    Args:
+        repertoire (str): Le répertoire du projet.
+
+    Returns:
+        str: L'empreinte hexadécimale (SHA-256).
+    """
+    empreinte = hashlib.sha256()
+    chemin_exigences = os.path.join(repertoire, FICHIER_EXIGENCES)
+    modules = []
+    if os.path.exists(chemin_exigences):
+        with open(chemin_exigences, "rb") as f:
+            contenu = f.read()
+        empreinte.update(contenu)
+        modules = [ligne.strip() for ligne in contenu.decode().splitlines() if ligne.strip()]
+
+    empreinte.update(sys.version.encode())
+    for module in modules:
+        empreinte.update(f"{module}=={_version_installee(module)}\n".encode())
+
+    for nom in sorted(os.listdir(repertoire)):
+        if not nom.endswith(".py"):
+            continue
+        with open(os.path.join(repertoire, nom), "rb") as f:
+            empreinte.update(nom.encode())
+            empreinte.update(hashlib.sha256(f.read()).digest())
+    return empreinte.hexdigest()
+
+
+def _lire_cache(chemin):
+    try:
+        with open(chemin, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _ecrire_cache(chemin, donnees):
+    temporaire = f"{chemin}.tmp"
+    with open(temporaire, "w") as f:
+        json.dump(donnees, f)
+    os.replace(temporaire, chemin)
+
+
+def verifier_environnement(etapes, mode=None, repertoire="."):
+    """
+    Exécute les étapes de vérification de l'environnement selon le mode choisi.
+
+    En mode "cache", les étapes ne sont exécutées que si l'empreinte de
+    l'environnement a changé depuis la dernière vérification réussie.
+    En mode "toujours", elles sont exécutées à chaque démarrage.
+    En mode "desactive", aucune vérification n'est faite (lancements en production).
+
+    Args:
+        etapes (list): Les fonctions de vérification à exécuter, sans argument.
+        mode (str, optional): Le mode de vérification. Par défaut, la variable
+            d'environnement QUIZ_VERIFICATION, sinon "cache".
+        repertoire (str): Le répertoire du projet.
+
+    Returns:
+        bool: Vrai si les étapes ont été exécutées, Faux si elles ont été ignorées.
+
+    Raises:
+        ValueError: Si le mode est inconnu.
+    """
+    mode = mode or os.environ.get(VARIABLE_MODE, MODE_CACHE)
+    if mode not in MODES:
+        raise ValueError(f"Mode de vérification inconnu : {mode}. Modes possibles : {', '.join(MODES)}.")
+
+    if mode == MODE_DESACTIVE:
+        print("Vérification de l'environnement désactivée.")
+        return False
+
+    chemin_cache = os.path.join(repertoire, FICHIER_CACHE)
+    cache = _lire_cache(chemin_cache)
+    if mode == MODE_CACHE:
+        debut = time.perf_counter()
+        empreinte = calculer_empreinte(repertoire)
+        if cache.get("empreinte") == empreinte:
+            duree = time.perf_counter() - debut
+            economie = cache.get("duree", 0.0) - duree
+            print(f"Environnement inchangé, vérification ignorée ({economie:.2f}s économisées).")
+            return False
+
+    debut = time.perf_counter()
+    for etape in etapes:
+        etape()
+    duree = time.perf_counter() - debut
+
+    # L'empreinte est recalculée après coup : les étapes peuvent avoir mis à jour des modules.
+    _ecrire_cache(chemin_cache, {"empreinte": calculer_empreinte(repertoire), "duree": duree})
+    print(f"Vérification de l'environnement terminée en {duree:.2f}s.")
+    return True